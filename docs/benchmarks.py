@@ -0,0 +1,271 @@
+
+"""
+Benchmarks for the analysis pipeline. Runs offline against the bundled reference passes
+and synthetic multi-day, multi-satellite workloads, and reports throughput (samples per
+second) and peak traced memory for each stage. Run from the docs directory:
+
+    python benchmarks.py [--days N] [--satellites N] [--json results.json]
+
+Stages that need LinkBudgetCalculator are skipped when lib/ cannot be found.
+"""
+
+import argparse
+import collections
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pint
+
+import instrument
+import utils
+from incremental import IncrementalCalculator
+from linkbatch import run_batch, slant_range
+from losses import loss_profile
+from passcache import PassCache
+from propagator import DEFAULT_TLE, ephem_date, make_observer, pass_window, posix_time, propagate, propagate_pass
+from refpasses import reference_names, reference_pass
+
+StageResult = collections.namedtuple('StageResult', ['name', 'samples', 'seconds', 'samples_per_second', 'peak_bytes'])
+
+# start of the synthetic workloads, close to the epoch of DEFAULT_TLE
+SYNTHETIC_START = '2018/04/01 00:00:00'
+
+
+def measure(name, stage, repeat=3):
+    """
+    Run stage (a callable returning the number of samples it processed) once under
+    tracemalloc for peak memory, then repeat times for the best wall clock time
+    """
+    gc.collect()
+    tracemalloc.start()
+    stage()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best = float('inf')
+    samples = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        samples = stage()
+        best = min(best, time.perf_counter() - start)
+    return StageResult(name, samples, best, samples / best if best > 0 else float('inf'), peak)
+
+
+def tle_checksum(line):
+    """
+    Line with its TLE checksum digit (column 69) recomputed
+    """
+    body = line[:68]
+    total = sum(int(c) if c.isdigit() else (1 if c == '-' else 0) for c in body)
+    return body + str(total % 10)
+
+
+def synthetic_tles(count):
+    """
+    count variations of DEFAULT_TLE spread out in right ascension of the ascending node
+    and mean anomaly, standing in for a constellation of similar satellites
+    """
+    name, line1, line2 = DEFAULT_TLE
+    tles = []
+    for i in range(count):
+        raan = (float(line2[17:25]) + 360.0 * i / count) % 360.0
+        anomaly = (float(line2[43:51]) + 137.0 * i) % 360.0
+        new_line2 = '%s%8.4f%s%8.4f%s' % (line2[:17], raan, line2[25:43], anomaly, line2[51:])
+        tles.append(('%s %d' % (name, i), line1, tle_checksum(new_line2)))
+    return tles
+
+
+def synthetic_passes(tles, days, observer):
+    """
+    (tle, rise, set) for every pass of every satellite in the first days days
+    """
+    start = posix_time(SYNTHETIC_START)
+    end = start + days * 86400.0
+    passes = []
+    for tle in tles:
+        t = start
+        while True:
+            rise, _, setting = pass_window(tle, observer, ephem_date(t))
+            if rise > end:
+                break
+            passes.append((tle, rise, setting))
+            t = setting + 60.0
+    return passes
+
+
+def load_calculator(ureg, lib_path=None):
+    """
+    Configured LinkBudgetCalculator (Design Iteration 1 values) with its runs timed by
+    instrument, or None when lib/ is not available
+    """
+    if lib_path is None:
+        try:
+            lib_path = utils.get_project_root()
+        except Exception:
+            # no __mtk__.py above the working directory
+            return None
+
+    sys.path.insert(0, lib_path)
+    try:
+        from lib.calculator import LinkBudgetCalculator
+    except ModuleNotFoundError as e:
+        # only a missing lib/ means the stages are skipped, errors inside it are raised
+        if e.name not in ('lib', 'lib.calculator'):
+            raise
+        return None
+    finally:
+        sys.path.remove(lib_path)
+
+    lb_calc = LinkBudgetCalculator(ureg)
+    lb_calc.altitude_ground_station   =  400 * ureg.meter
+    lb_calc.implementation_loss       = -1.0   # dB
+    lb_calc.polarization_losses       =  0.0   # dB
+    lb_calc.receive_antenna_gain      =  5.4   # dB
+    lb_calc.system_noise_figure       =  5.0   # dB
+    lb_calc.altitude_satellite        =  860 * ureg.kilometer
+    lb_calc.transmit_power            =  5.0 * ureg.watt
+    lb_calc.transmit_losses           = -1.0   # dB
+    lb_calc.transmit_antenna_gain     =  4.0   # dBi
+    lb_calc.orbit_elevation_angle     =  0.001 * ureg.degrees
+    lb_calc.downlink_frequency        =  137.5 * ureg.megahertz
+    lb_calc.target_energy_noise_ratio =  20.0  # dB
+    lb_calc.noise_bandwidth           =  34.0  * ureg.kilohertz
+    lb_calc.transmit_pointing_loss    = -3.0   # dB
+    lb_calc.atmospheric_loss          =  utils.atmloss_at_elev(ureg, lb_calc.orbit_elevation_angle)
+    lb_calc.receiving_pointing_loss   =  loss_profile('eggbeater')(lb_calc.orbit_elevation_angle)
+    return instrument.wrap_calculator(lb_calc)
+
+
+def run_benchmarks(days=2, satellites=4, repeat=3, lib_path=None):
+    """
+    Run every stage and return (results, skipped) with results a list of StageResult
+    """
+    ureg = pint.UnitRegistry()
+    observer = make_observer()
+    passes = [reference_pass(name) for name in reference_names()]
+    elevations = np.concatenate([np.array(track.el) for track in passes])
+    results = []
+    skipped = []
+
+    # project root search from a few directories deep
+    with tempfile.TemporaryDirectory() as root:
+        open(os.path.join(root, '__mtk__.py'), 'w').close()
+        nested = os.path.join(root, 'a', 'b', 'c', 'd')
+        os.makedirs(nested)
+        cwd = os.getcwd()
+
+        def project_root():
+            os.chdir(nested)
+            try:
+                for _ in range(100):
+                    utils.get_project_root()
+            finally:
+                os.chdir(cwd)
+            return 100
+        results.append(measure('get_project_root', project_root, repeat))
+
+    # propagation: the list based wrapper, the array propagator and the cache
+    dates = ['2018/04/03 02:00.00', '2018/04/03 10:00.00', '2018/04/01 06:00.00']
+    results.append(measure('compute_angles', lambda: sum(len(utils.compute_angles(date=d)[1]) for d in dates), repeat))
+    results.append(measure('propagate', lambda: sum(propagate(None, observer, track.time).time.size for track in passes), repeat))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = PassCache(cache_dir)
+        results.append(measure('passcache (warm)', lambda: sum(cache.pass_track(date=d).time.size for d in dates), repeat))
+
+    # loss evaluation: per-sample pint comparisons against one array lookup
+    elevation_quantities = [el * ureg.degrees for el in elevations.tolist()]
+    rx_profile = loss_profile('eggbeater')
+    results.append(measure('atmloss_at_elev (scalar)',
+                           lambda: len([utils.atmloss_at_elev(ureg, el) for el in elevation_quantities]), repeat))
+    results.append(measure('pointing loss (scalar)', lambda: len([rx_profile(el) for el in elevation_quantities]), repeat))
+    results.append(measure('loss profiles (array)',
+                           lambda: loss_profile('atmosphere')(elevations).size + rx_profile(elevations).size, repeat))
+
+    # tuple extraction as done in the notebooks
+    distances = slant_range(elevations, 860.0e3, 400.0)
+    outputs = [(d * ureg.meter, -d * 1e-5, -d * 1e-5, d * 1e-6, d * 1e-6) for d in distances.tolist()]
+
+    def extract_tuples():
+        columns = [[i[0].magnitude for i in outputs]] + [[i[k] for i in outputs] for k in range(1, 5)]
+        return len(columns[0])
+    results.append(measure('tuple extraction', extract_tuples, repeat))
+
+    # synthetic constellation over several days
+    tles = synthetic_tles(satellites)
+    synthetic = synthetic_passes(tles, days, observer)
+
+    def synthetic_propagation():
+        return sum(propagate_pass(tle, observer, ephem_date(rise - 120.0)).time.size for tle, rise, _ in synthetic)
+    results.append(measure('synthetic passes (%d sats, %d days, %d passes)' % (satellites, days, len(synthetic)),
+                           synthetic_propagation, 1))
+
+    # link budget stages need the calculator from lib/
+    lb_calc = load_calculator(ureg, lib_path)
+    if lb_calc is None:
+        skipped.append('LinkBudgetCalculator.run and batch stages (lib.calculator not found)')
+    else:
+        def scalar_runs():
+            for el in elevation_quantities:
+                lb_calc.orbit_elevation_angle = el
+                lb_calc.atmospheric_loss = utils.atmloss_at_elev(ureg, el)
+                lb_calc.receiving_pointing_loss = rx_profile(el)
+                lb_calc.run()
+            lb_calc.orbit_elevation_angle = 0.001 * ureg.degrees
+            return len(elevation_quantities)
+        results.append(measure('LinkBudgetCalculator.run (scalar)', scalar_runs, 1))
+        incremental = IncrementalCalculator(lb_calc, ureg)
+
+        def incremental_runs():
+            for el in elevation_quantities:
+                incremental.orbit_elevation_angle = el
+                incremental.atmospheric_loss = utils.atmloss_at_elev(ureg, el)
+                incremental.receiving_pointing_loss = rx_profile(el)
+                incremental.run()
+            incremental.orbit_elevation_angle = 0.001 * ureg.degrees
+            return len(elevation_quantities)
+        results.append(measure('IncrementalCalculator.run (scalar)', incremental_runs, 1))
+        results.append(measure('run_batch', lambda: run_batch(lb_calc, ureg, elevations, loss_profile('atmosphere')(elevations),
+                                                              rx_profile(elevations)).link_margin.size, repeat))
+
+    return results, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--days', type=int, default=2, help='days of synthetic passes')
+    parser.add_argument('--satellites', type=int, default=4, help='number of synthetic satellites')
+    parser.add_argument('--repeat', type=int, default=3, help='timed repetitions per stage')
+    parser.add_argument('--lib', default=None, help='directory containing lib/ (default: project root)')
+    parser.add_argument('--json', default=None, help='also write the results and counters to this file')
+    args = parser.parse_args(argv)
+
+    instrument.reset()
+    instrument.enable()
+    results, skipped = run_benchmarks(args.days, args.satellites, args.repeat, args.lib)
+    instrument.disable()
+
+    print('%-48s %12s %14s %12s' % ('stage', 'samples', 'samples/s', 'peak KiB'))
+    for result in results:
+        print('%-48s %12d %14.0f %12.1f' % (result.name, result.samples, result.samples_per_second,
+                                            result.peak_bytes / 1024.0))
+    for stage in skipped:
+        print('skipped: %s' % stage)
+
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump({'stages': [result._asdict() for result in results],
+                       'skipped': skipped,
+                       'counters': instrument.report()}, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+
+import instrument
+from linkbatch import anchor_state, apply_deltas_scalar
+
+# ---------------------------------------------------------------------------------------
+# incremental recomputation of a LinkBudgetCalculator
+#
+# IncrementalCalculator wraps a calculator and tracks which inputs were set since the
+# last run. the budget terms form a dependency graph (DEPENDENCIES), and a run only
+# invalidates the terms downstream of the changed inputs. when only the per-sample
+# geometry inputs and the additive dB inputs changed, the budget of the last full run is
+# reused: the geometry dependent terms are shifted with linkbatch.apply_deltas_scalar
+# and the dB inputs are added to the terms they enter, without calling the wrapped
+# calculator
+# ---------------------------------------------------------------------------------------
+
+# derived term -> the inputs and terms it is computed from, in evaluation order
+DEPENDENCIES = {
+    'link_distance':      ('orbit_elevation_angle', 'altitude_satellite', 'altitude_ground_station'),
+    'downlink_path_loss': ('link_distance', 'downlink_frequency'),
+    'received_power':     ('downlink_path_loss', 'transmit_power', 'transmit_losses', 'transmit_antenna_gain',
+                           'transmit_pointing_loss', 'atmospheric_loss', 'polarization_losses',
+                           'receive_antenna_gain', 'receiving_pointing_loss'),
+    'energy_noise_ratio': ('received_power', 'system_noise_figure', 'noise_bandwidth', 'implementation_loss'),
+    'link_margin':        ('energy_noise_ratio', 'target_energy_noise_ratio'),
+}
+
+INPUTS = frozenset(name for sources in DEPENDENCIES.values() for name in sources if name not in DEPENDENCIES)
+
+# inputs that change within a pass; changing only these never needs a full run
+GEOMETRY_INPUTS = frozenset(['orbit_elevation_angle', 'atmospheric_loss', 'receiving_pointing_loss'])
+
+# dB inputs -> (the term they are added to, sign); changing these never needs a full run
+# either, they shift that term and everything downstream of it. the noise figure is not
+# one of them: how it enters the noise temperature is up to the calculator
+ADDITIVE_INPUTS = {
+    'transmit_losses':           ('received_power', 1.0),
+    'transmit_antenna_gain':     ('received_power', 1.0),
+    'transmit_pointing_loss':    ('received_power', 1.0),
+    'polarization_losses':       ('received_power', 1.0),
+    'receive_antenna_gain':      ('received_power', 1.0),
+    'implementation_loss':       ('energy_noise_ratio', 1.0),
+    'target_energy_noise_ratio': ('link_margin', -1.0),
+}
+
+SHIFTABLE_INPUTS = GEOMETRY_INPUTS | frozenset(ADDITIVE_INPUTS)
+
+
+def downstream(changed):
+    """
+    Derived terms that depend, directly or through other terms, on any of changed.
+    Returned in evaluation order
+    """
+    affected = set(changed)
+    terms = []
+    for term, sources in DEPENDENCIES.items():
+        if affected.intersection(sources):
+            affected.add(term)
+            terms.append(term)
+    return tuple(terms)
+
+
+class IncrementalCalculator:
+    """
+    LinkBudgetCalculator wrapper that only recomputes the terms affected by the inputs
+    set since the last run. Use it like the calculator itself:
+
+        lb_calc = IncrementalCalculator(LinkBudgetCalculator(ureg), ureg)
+
+    After each run, last_recomputed lists the terms that were recomputed (every term
+    when last_run_full) and last_run_full tells whether the wrapped calculator was run
+    """
+
+    def __init__(self, lb_calc, ureg):
+        object.__setattr__(self, 'lb_calc', lb_calc)
+        object.__setattr__(self, 'ureg', ureg)
+        object.__setattr__(self, 'last_recomputed', ())
+        object.__setattr__(self, 'last_run_full', False)
+        object.__setattr__(self, '_changed', set(INPUTS))
+        object.__setattr__(self, '_anchor', None)
+        object.__setattr__(self, '_anchor_inputs', None)
+        object.__setattr__(self, '_shifts', {'received_power': 0.0, 'energy_noise_ratio': 0.0, 'link_margin': 0.0})
+        object.__setattr__(self, '_outputs', {})
+        # unit lookups on the registry parse strings, so do them once
+        object.__setattr__(self, '_degree', ureg.degree)
+        object.__setattr__(self, '_meter', ureg.meter)
+
+    def __setattr__(self, name, value):
+        # everything is forwarded to the calculator. inputs missing from DEPENDENCIES
+        # are treated as affecting every term
+        # re-setting a static input to the value it already has invalidates nothing
+        if name not in GEOMETRY_INPUTS and name not in self._changed:
+            try:
+                unchanged = bool(getattr(self.lb_calc, name) == value)
+            except Exception:
+                unchanged = False
+            if unchanged:
+                return
+        setattr(self.lb_calc, name, value)
+        self._changed.add(name)
+
+    def __getattr__(self, name):
+        # only called for names not set on the wrapper: budget terms, then the calculator
+        outputs = object.__getattribute__(self, '_outputs')
+        if name in outputs:
+            return outputs[name]
+        return getattr(object.__getattribute__(self, 'lb_calc'), name)
+
+    def run(self):
+        full = (self._anchor is None or self._anchor_inputs is None
+                or not self._changed.issubset(SHIFTABLE_INPUTS)
+                or not self._update_shifts())
+        recomputed = tuple(DEPENDENCIES) if full else downstream(self._changed)
+
+        if full:
+            self.lb_calc.run()
+            self._outputs.clear()
+            self._outputs['is_valid'] = self.lb_calc.is_valid
+            if self.lb_calc.is_valid:
+                object.__setattr__(self, '_anchor', anchor_state(self.lb_calc, self.ureg))
+                object.__setattr__(self, '_anchor_inputs', self._additive_inputs())
+                for term in self._shifts:
+                    self._shifts[term] = 0.0
+                for term in DEPENDENCIES:
+                    self._outputs[term] = getattr(self.lb_calc, term)
+            else:
+                object.__setattr__(self, '_anchor', None)
+        elif recomputed:
+            with instrument.timer('calculator.run_geometry'):
+                self._run_geometry()
+
+        self._changed.clear()
+        object.__setattr__(self, 'last_recomputed', recomputed)
+        object.__setattr__(self, 'last_run_full', full)
+
+    def _additive_inputs(self):
+        """
+        Current values of ADDITIVE_INPUTS as floats, or None when one is not a plain dB value
+        """
+        try:
+            return dict((name, float(getattr(self.lb_calc, name))) for name in ADDITIVE_INPUTS)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    def _update_shifts(self):
+        """
+        Recompute the offsets of the additive dB inputs from their values at the last full
+        run. Returns False when they cannot be shifted and a full run is needed
+        """
+        if self._changed.isdisjoint(ADDITIVE_INPUTS):
+            return True
+        values = self._additive_inputs()
+        if values is None:
+            return False
+        for term in self._shifts:
+            self._shifts[term] = 0.0
+        for name, (term, sign) in ADDITIVE_INPUTS.items():
+            self._shifts[term] += sign * (values[name] - self._anchor_inputs[name])
+        return True
+
+    def _run_geometry(self):
+        elevation = self.lb_calc.orbit_elevation_angle
+        if hasattr(elevation, 'to'):
+            elevation = elevation.m_as(self._degree)
+        elevation = float(elevation)
+
+        if not 0.0 <= elevation <= 90.0:
+            # no budget at this elevation; do not leave the previous sample's terms behind
+            self._outputs['is_valid'] = False
+            for term in DEPENDENCIES:
+                self._outputs[term] = None
+            return
+        self._outputs['is_valid'] = True
+
+        distance, path_loss, received_power, eb_no, margin = apply_deltas_scalar(
+            self._anchor, elevation, float(self.lb_calc.atmospheric_loss), float(self.lb_calc.receiving_pointing_loss))
+        power_shift = self._shifts['received_power']
+        eb_no_shift = power_shift + self._shifts['energy_noise_ratio']
+        self._outputs['link_distance'] = self.ureg.Quantity(distance, self._meter)
+        self._outputs['downlink_path_loss'] = path_loss
+        self._outputs['received_power'] = received_power + power_shift
+        self._outputs['energy_noise_ratio'] = eb_no + eb_no_shift
+        self._outputs['link_margin'] = margin + eb_no_shift + self._shifts['link_margin']
+# ---------------------------------------------------------------------------------------
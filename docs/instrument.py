@@ -0,0 +1,130 @@
+
+import contextlib
+import json
+import threading
+import time
+
+# ---------------------------------------------------------------------------------------
+# opt-in timing instrumentation for the analysis pipeline
+#
+# the propagator, link budget and loss profile hot paths wrap their work in
+# timer('<module>.<function>', samples). while instrumentation is disabled (the default)
+# timer() hands back a shared no-op context, so the cost is one function call
+#
+#     import instrument
+#     instrument.enable()
+#     instrument.wrap_calculator(lb_calc)   # also time every lb_calc.run()
+#     ... run an analysis ...
+#     print(instrument.dump_json())
+#
+# counters may be recorded from worker threads (tracking prefetches in an executor)
+# ---------------------------------------------------------------------------------------
+
+_enabled = False
+_stats = {}
+_lock = threading.Lock()
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+class _Timer:
+    __slots__ = ('name', 'samples', 'start')
+
+    def __init__(self, name, samples):
+        self.name = name
+        self.samples = samples
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter() - self.start, self.samples)
+        return False
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = bool(on)
+
+
+def disable():
+    enable(False)
+
+
+def enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def record(name, seconds=0.0, samples=1):
+    """
+    Add one call of name that took seconds and processed samples samples
+    """
+    if not _enabled:
+        return
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = [0, 0, 0.0]
+        stats[0] += 1
+        stats[1] += int(samples)
+        stats[2] += seconds
+
+
+def count(name, samples=1):
+    """
+    Count one untimed event (a cache hit, a full recomputation, ...)
+    """
+    record(name, 0.0, samples)
+
+
+def timer(name, samples=1):
+    """
+    Context manager timing the enclosed block under name when instrumentation is on
+    """
+    return _Timer(name, samples) if _enabled else _NULL_TIMER
+
+
+def wrap_calculator(lb_calc, name='calculator.run'):
+    """
+    Time every run() of a LinkBudgetCalculator or IncrementalCalculator under name,
+    including plain lb_calc.run() calls from notebooks, by wrapping run on this instance. Wrapping twice has no
+    further effect; del lb_calc.run removes the wrapper. Returns lb_calc
+    """
+    run = lb_calc.run
+    if getattr(run, 'instrumented', False):
+        return lb_calc
+
+    def timed_run():
+        with timer(name):
+            return run()
+    timed_run.instrumented = True
+    # set on the instance itself; IncrementalCalculator forwards attribute writes
+    object.__setattr__(lb_calc, 'run', timed_run)
+    return lb_calc
+
+
+def report():
+    """
+    Counters and cumulative timers as {name: {calls, samples, seconds}}
+    """
+    with _lock:
+        return dict((name, {'calls': calls, 'samples': samples, 'seconds': seconds})
+                    for name, (calls, samples, seconds) in sorted(_stats.items()))
+
+
+def dump_json(path=None):
+    """
+    The report as JSON text, also written to path when given
+    """
+    text = json.dumps(report(), indent=2, sort_keys=True)
+    if path is not None:
+        with open(path, 'w') as f:
+            f.write(text + '\n')
+    return text
+# ---------------------------------------------------------------------------------------
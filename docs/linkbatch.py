@@ -0,0 +1,200 @@
+
+import collections
+import math
+
+import numpy as np
+
+import instrument
+
+# ---------------------------------------------------------------------------------------
+# batch evaluation of a LinkBudgetCalculator over a whole pass
+#
+# within a pass only the elevation angle, the atmospheric loss and the receive pointing
+# loss change. every other term of the budget is fixed, and every term is additive in dB,
+# so the calculator is run once at its current state (the anchor) and each sample is the
+# anchor plus the change in path loss, atmospheric loss and pointing loss
+# ---------------------------------------------------------------------------------------
+
+EARTH_RADIUS_M = 6371.0e3
+
+# the earth radius is fitted from the calculator's link distance at the anchor when the
+# anchor is at or below MAX_FIT_ELEVATION, otherwise from an extra run at FIT_ELEVATION
+MAX_FIT_ELEVATION = 45.0  # deg
+FIT_ELEVATION = 5.0       # deg
+
+BatchResult = collections.namedtuple('BatchResult', ['link_distance',
+                                                     'downlink_path_loss',
+                                                     'received_power',
+                                                     'energy_noise_ratio',
+                                                     'link_margin'])
+
+
+def magnitude_in(ureg, value, units):
+    """
+    Return the magnitude of value in the given units as a float64 array. Plain numbers and
+    arrays are assumed to already be in those units
+    """
+    if hasattr(value, 'to'):
+        value = value.to(getattr(ureg, units)).magnitude
+    return np.asarray(value, dtype=np.float64)
+
+
+def slant_range(elevations, altitude_satellite, altitude_ground_station, earth_radius=EARTH_RADIUS_M):
+    """
+    Distance from the ground station to the satellite (m) for elevation angles in degrees
+    and altitudes in meters, assuming a spherical earth
+    """
+    el = np.radians(elevations)
+    r_gs = earth_radius + altitude_ground_station
+    r_sat = earth_radius + altitude_satellite
+    return np.sqrt(r_sat**2 - (r_gs * np.cos(el))**2) - r_gs * np.sin(el)
+
+
+def run_batch(lb_calc, ureg, elevations, atmospheric_losses=None, receiving_pointing_losses=None, earth_radius=None):
+    """
+    Evaluate the link budget for every sample of a pass in one NumPy computation.
+
+    elevations may be a pint Quantity array or plain degrees. atmospheric_losses and
+    receiving_pointing_losses are per-sample dB arrays; when omitted the calculator's
+    current value is held for the whole pass. The calculator is run once at its current
+    state and is left in that state. earth_radius (m) is passed on to anchor_state.
+    Returns a BatchResult of arrays, with link_distance as a pint Quantity like the
+    scalar calculator
+    """
+    # check units once at the boundary
+    elevations = magnitude_in(ureg, elevations, 'degrees')
+    if elevations.size and (elevations.min() < 0.0 or elevations.max() > 90.0):
+        raise Exception('Elevation angles must be between 0 and 90 degrees')
+
+    atm_losses = (np.full(elevations.shape, float(lb_calc.atmospheric_loss))
+                  if atmospheric_losses is None else np.asarray(atmospheric_losses, dtype=np.float64))
+    rx_losses = (np.full(elevations.shape, float(lb_calc.receiving_pointing_loss))
+                 if receiving_pointing_losses is None else np.asarray(receiving_pointing_losses, dtype=np.float64))
+    if atm_losses.shape != elevations.shape or rx_losses.shape != elevations.shape:
+        raise Exception('Loss arrays must have one value per elevation angle')
+
+    # run the scalar budget once for the anchor
+    lb_calc.run()
+    if not lb_calc.is_valid:
+        raise Exception('Run at elevation angle ', lb_calc.orbit_elevation_angle, ' was not valid')
+
+    return apply_deltas(anchor_state(lb_calc, ureg, earth_radius), elevations, atm_losses, rx_losses, ureg)
+
+
+def anchor_state(lb_calc, ureg, earth_radius=None):
+    """
+    Capture the inputs and outputs of the calculator's last run as plain floats.
+    earth_radius (m) is the radius of the spherical earth used to shift the geometry;
+    when omitted it is fitted to the calculator's own link distance (fit_earth_radius)
+    """
+    anchor = {
+        'elevation':        float(magnitude_in(ureg, lb_calc.orbit_elevation_angle, 'degrees')),
+        'alt_sat':          float(magnitude_in(ureg, lb_calc.altitude_satellite, 'meter')),
+        'alt_gs':           float(magnitude_in(ureg, lb_calc.altitude_ground_station, 'meter')),
+        'atm_loss':         float(lb_calc.atmospheric_loss),
+        'rx_pointing_loss': float(lb_calc.receiving_pointing_loss),
+        'distance':         float(magnitude_in(ureg, lb_calc.link_distance, 'meter')),
+        'path_loss':        float(lb_calc.downlink_path_loss),
+        'received_power':   float(lb_calc.received_power),
+        'eb_no':            float(lb_calc.energy_noise_ratio),
+        'margin':           float(lb_calc.link_margin),
+    }
+    if earth_radius is not None:
+        anchor['earth_radius'] = float(magnitude_in(ureg, earth_radius, 'meter'))
+    elif anchor['elevation'] <= MAX_FIT_ELEVATION:
+        anchor['earth_radius'] = earth_radius_from(anchor['elevation'], anchor['distance'],
+                                                   anchor['alt_sat'], anchor['alt_gs'])
+    else:
+        anchor['earth_radius'] = fit_earth_radius(lb_calc, ureg)
+    return anchor
+
+
+def earth_radius_from(elevation, distance, altitude_satellite, altitude_ground_station):
+    """
+    Earth radius (m) for which slant_range gives distance (m) at elevation (deg). Only
+    well conditioned at low elevations; towards zenith the distance barely depends on
+    the radius
+    """
+    s = math.sin(math.radians(elevation))
+    h_gs = altitude_ground_station
+    h_sat = altitude_satellite
+    d = distance
+    radius = (h_gs**2 + d**2 + 2.0 * h_gs * d * s - h_sat**2) / (2.0 * (h_sat - h_gs - d * s))
+    if not 0.5 * EARTH_RADIUS_M < radius < 2.0 * EARTH_RADIUS_M:
+        raise Exception('Link distance of %g m at %g degrees does not fit a spherical earth; '
+                        'pass earth_radius explicitly' % (distance, elevation))
+    return radius
+
+
+def fit_earth_radius(lb_calc, ureg):
+    """
+    Earth radius (m) that reproduces the calculator's link distance, fitted from a run at
+    FIT_ELEVATION. The calculator's elevation is restored and it is run again, so its
+    outputs are unchanged afterwards
+    """
+    elevation = lb_calc.orbit_elevation_angle
+    try:
+        lb_calc.orbit_elevation_angle = FIT_ELEVATION * ureg.degrees
+        lb_calc.run()
+        distance = float(magnitude_in(ureg, lb_calc.link_distance, 'meter'))
+    finally:
+        lb_calc.orbit_elevation_angle = elevation
+        lb_calc.run()
+    return earth_radius_from(FIT_ELEVATION, distance, float(magnitude_in(ureg, lb_calc.altitude_satellite, 'meter')),
+                             float(magnitude_in(ureg, lb_calc.altitude_ground_station, 'meter')))
+
+
+def apply_deltas(anchor, elevations, atm_losses, rx_losses, ureg):
+    """
+    Shift an anchor budget (from anchor_state) to new elevations (deg) and per-sample
+    atmospheric and receive pointing losses (dB)
+    """
+    with instrument.timer('linkbatch.apply_deltas', np.size(elevations)):
+        return _apply_deltas(anchor, elevations, atm_losses, rx_losses, ureg)
+
+
+def _apply_deltas(anchor, elevations, atm_losses, rx_losses, ureg):
+    radius = anchor['earth_radius']
+    geometry = slant_range(elevations, anchor['alt_sat'], anchor['alt_gs'], radius)
+    geometry_ref = slant_range(anchor['elevation'], anchor['alt_sat'], anchor['alt_gs'], radius)
+    ratio = geometry / geometry_ref
+    distances = anchor['distance'] * ratio
+
+    # free space loss goes with 20 log10(d); follow the calculator's sign convention
+    spreading = 20.0 * np.log10(ratio)
+    sign = -1.0 if anchor['path_loss'] < 0 else 1.0
+    path_loss = anchor['path_loss'] + sign * spreading
+
+    delta = -spreading + (atm_losses - anchor['atm_loss']) + (rx_losses - anchor['rx_pointing_loss'])
+
+    return BatchResult(link_distance=distances * ureg.meter,
+                       downlink_path_loss=path_loss,
+                       received_power=anchor['received_power'] + delta,
+                       energy_noise_ratio=anchor['eb_no'] + delta,
+                       link_margin=anchor['margin'] + delta)
+
+
+def apply_deltas_scalar(anchor, elevation, atm_loss, rx_loss):
+    """
+    apply_deltas for a single sample using plain floats, for per-sample callers where
+    NumPy and pint overhead dominates. Returns (link distance in m, path loss, received
+    power, Eb/No, margin)
+    """
+    radius = anchor['earth_radius']
+    r_gs = radius + anchor['alt_gs']
+    r_sat = radius + anchor['alt_sat']
+
+    def geometry(el):
+        el = math.radians(el)
+        return math.sqrt(r_sat**2 - (r_gs * math.cos(el))**2) - r_gs * math.sin(el)
+
+    ratio = geometry(elevation) / geometry(anchor['elevation'])
+    spreading = 20.0 * math.log10(ratio)
+    sign = -1.0 if anchor['path_loss'] < 0 else 1.0
+    delta = -spreading + (atm_loss - anchor['atm_loss']) + (rx_loss - anchor['rx_pointing_loss'])
+    return (anchor['distance'] * ratio,
+            anchor['path_loss'] + sign * spreading,
+            anchor['received_power'] + delta,
+            anchor['eb_no'] + delta,
+            anchor['margin'] + delta)
+# ---------------------------------------------------------------------------------------
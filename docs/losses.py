@@ -0,0 +1,110 @@
+
+import json
+import os
+
+import numpy as np
+
+import instrument
+
+# ---------------------------------------------------------------------------------------
+# elevation dependent loss profiles (atmosphere, receive antenna pointing)
+#
+# a profile is a table of elevation breakpoints (degrees) and losses (dB), declared once
+# in data/loss_profiles/<name>.json and evaluated over whole arrays of elevations.
+#   step:   losses[i] applies below elevations[i], the last loss at and above the last
+#           breakpoint (len(losses) == len(elevations) + 1)
+#   interp: losses[i] is the loss at elevations[i], linear in between and held constant
+#           outside the table (len(losses) == len(elevations))
+# ---------------------------------------------------------------------------------------
+
+LOSS_PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'loss_profiles')
+
+_profiles = {}
+
+
+class LossProfile:
+    """
+    Breakpoint table of loss (dB) against elevation angle (degrees)
+    """
+
+    def __init__(self, elevations, losses, mode='step', description=''):
+        self.elevations = np.asarray(elevations, dtype=np.float64)
+        self.losses = np.asarray(losses, dtype=np.float64)
+        self.mode = mode
+        self.description = description
+
+        if np.any(np.diff(self.elevations) <= 0):
+            raise Exception('Loss profile breakpoints must be strictly increasing')
+        if mode == 'step':
+            expected = self.elevations.size + 1
+        elif mode == 'interp':
+            expected = self.elevations.size
+        else:
+            raise Exception('Unknown loss profile mode %s (expected step or interp)' % mode)
+        if self.losses.size != expected:
+            raise Exception('A %s loss profile with %d breakpoints needs %d losses' % (mode, self.elevations.size, expected))
+
+    def __call__(self, elevations):
+        """
+        Loss in dB for elevations given as a pint Quantity or plain degrees. Scalars give
+        a float, arrays an array of the same shape
+        """
+        if hasattr(elevations, 'to'):
+            elevations = elevations.to('degree').magnitude
+        elev = np.asarray(elevations, dtype=np.float64)
+
+        with instrument.timer('losses.evaluate', elev.size):
+            if self.mode == 'step':
+                loss = self.losses[np.searchsorted(self.elevations, elev, side='right')]
+            else:
+                loss = np.interp(elev, self.elevations, self.losses)
+
+        return float(loss) if loss.ndim == 0 else loss
+
+    def with_mode(self, mode):
+        """
+        The same table evaluated in another mode. Going from step to interp places each
+        step's loss at the middle of its elevation band
+        """
+        if mode == self.mode:
+            return self
+        if mode == 'interp':
+            edges = np.concatenate(([min(0.0, self.elevations[0])], self.elevations, [max(90.0, self.elevations[-1])]))
+            return LossProfile(0.5 * (edges[:-1] + edges[1:]), self.losses, 'interp', self.description)
+        raise Exception('Cannot convert an %s loss profile to %s' % (self.mode, mode))
+
+
+def load_loss_profile(path):
+    """
+    Read a LossProfile from a JSON data file
+    """
+    with open(path) as f:
+        table = json.load(f)
+    return LossProfile(table['elevations'], table['losses'], table.get('mode', 'step'), table.get('description', ''))
+
+
+def loss_profile_names():
+    """
+    Names of the profiles in LOSS_PROFILE_DIR plus any registered in code
+    """
+    files = [name[:-len('.json')] for name in os.listdir(LOSS_PROFILE_DIR) if name.endswith('.json')]
+    return sorted(set(files) | set(_profiles))
+
+
+def register_loss_profile(name, profile):
+    _profiles[name] = profile
+
+
+def loss_profile(name, mode=None):
+    """
+    Look up a loss profile by name (atmosphere, monopole, eggbeater, ...), optionally
+    evaluated in a different mode
+    """
+    if name not in _profiles:
+        path = os.path.join(LOSS_PROFILE_DIR, name + '.json')
+        if not os.path.isfile(path):
+            raise Exception('Unknown loss profile %s (available: %s)' % (name, ', '.join(loss_profile_names())))
+        _profiles[name] = load_loss_profile(path)
+    profile = _profiles[name]
+    return profile if mode is None else profile.with_mode(mode)
+# ---------------------------------------------------------------------------------------
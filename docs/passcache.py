@@ -0,0 +1,170 @@
+
+import hashlib
+import json
+import os
+import time
+
+import ephem
+import numpy as np
+
+import instrument
+from propagator import DEFAULT_TLE, PassTrack, make_observer, posix_time, propagate_pass
+
+# ---------------------------------------------------------------------------------------
+# on-disk cache of propagated passes
+#
+# each pass is stored as one .npy file holding a (5, n) float64 array, one row per
+# PassTrack column. hits are memory-mapped, so loading a pass does not copy it. several
+# processes may share a cache directory: an entry removed by another process while it
+# is being looked up or evicted is treated as already gone
+# ---------------------------------------------------------------------------------------
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.passcache')
+
+
+def save_track(path, track):
+    """
+    Write a PassTrack to path as a packed (5, n) float64 array
+    """
+    # unique per process, so concurrent writers of the same entry do not collide
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        np.save(f, np.vstack([np.asarray(column, dtype=np.float64) for column in track]))
+    os.replace(tmp_path, path)
+
+
+def load_track(path, mmap=True):
+    """
+    Read a PassTrack written by save_track. With mmap the columns are read-only views of
+    the memory-mapped file
+    """
+    data = np.load(path, mmap_mode='r' if mmap else None)
+    return PassTrack(*data)
+
+
+def _orbit_fields(tle):
+    # ephem bodies do not keep their TLE lines, so key them by their elements instead
+    if isinstance(tle, ephem.EarthSatellite):
+        return [float(value) for value in (tle._epoch, tle._inc, tle._raan, tle._e, tle._ap, tle._M,
+                                           tle._n, tle._decay, tle._drag, tle._orbit)]
+    _, line1, line2 = DEFAULT_TLE if tle is None else tle
+    return [line1.strip(), line2.strip()]
+
+
+def _remove(path):
+    # another process sharing the directory may have removed it already
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class PassCache:
+    """
+    Pass predictions keyed by TLE, observer location, start date and time step. Entries
+    older than max_age seconds are dropped, then the least recently used ones until the
+    cache is under max_bytes
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=256 * 1024 * 1024, max_age=30 * 24 * 3600.0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, tle, observer, date, step=1.0, fine_step=None, fine_window=60.0):
+        """
+        Cache key for a pass prediction. tle is a (line0, line1, line2) TLE or an ephem
+        body, which is keyed by its orbital elements
+        """
+        fields = _orbit_fields(tle) + [
+            float(observer.lat), float(observer.lon), float(observer.elev),
+            posix_time(date), float(step),
+            None if fine_step is None else float(fine_step), float(fine_window)]
+        return hashlib.sha1(json.dumps(fields).encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.npy')
+
+    def get(self, key):
+        """
+        Return the cached PassTrack for key, or None on a miss
+        """
+        path = self.path(key)
+        try:
+            track = load_track(path)
+        except (IOError, OSError, ValueError):
+            instrument.count('passcache.miss')
+            return None
+        instrument.count('passcache.hit')
+        # mark as recently used. the mapping stays valid if another process evicted the
+        # file in the meantime
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            pass
+        return track
+
+    def put(self, key, track):
+        save_track(self.path(key), track)
+        self.evict()
+
+    def pass_track(self, tle=None, observer=None, date=None, step=1.0, fine_step=None, fine_window=60.0):
+        """
+        Same as propagator.propagate_pass, but served from the cache when possible.
+        Calls without a date predict the next pass from now and are never cached
+        """
+        observer = make_observer() if observer is None else observer
+        if date is None:
+            return propagate_pass(tle, observer, date, step, fine_step, fine_window)
+
+        key = self.key(tle, observer, date, step, fine_step, fine_window)
+        track = self.get(key)
+        if track is None:
+            track = propagate_pass(tle, observer, date, step, fine_step, fine_window)
+            self.put(key, track)
+            # serve the memory-mapped copy unless it was evicted straight away
+            cached = self.get(key)
+            track = track if cached is None else cached
+        return track
+
+    def entries(self):
+        """
+        List (path, size, mtime) for every cached pass, least recently used first
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.npy'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self):
+        """
+        Drop entries older than max_age, then the least recently used entries until the
+        cache is under max_bytes
+        """
+        entries = self.entries()
+        if self.max_age is not None:
+            cutoff = time.time() - self.max_age
+            for path, _, mtime in entries:
+                if mtime < cutoff:
+                    _remove(path)
+            entries = [entry for entry in entries if entry[2] >= cutoff]
+        if self.max_bytes is not None:
+            total = sum(entry[1] for entry in entries)
+            for path, size, _ in entries:
+                if total <= self.max_bytes:
+                    break
+                _remove(path)
+                total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            _remove(path)
+# ---------------------------------------------------------------------------------------
@@ -0,0 +1,153 @@
+
+import collections
+import datetime
+import math
+
+import ephem
+import numpy as np
+
+import instrument
+
+# ---------------------------------------------------------------------------------------
+# array based satellite pass propagation
+#
+# times are float64 POSIX seconds (UTC) and angles are degrees. a pass is returned as a
+# PassTrack of contiguous NumPy arrays instead of lists built one second at a time
+# ---------------------------------------------------------------------------------------
+
+# ephem dates count days from 1899/12/31 12:00 UTC
+EPHEM_UNIX_EPOCH = 25567.5
+SECONDS_PER_DAY = 86400.0
+
+# old NOAA 19 TLE (line0, line1, line2) used by the analysis notebooks
+DEFAULT_TLE = ('NOAA 19 [+]',
+               '1 33591U 09005A   18092.90091581  .00000055  00000-0  55075-4 0  9994',
+               '2 33591  99.1353  69.4619 0014005 174.2137 185.9198 14.12266303471284')
+
+# ground station location, given to ephem as-is (floats are radians, strings degrees)
+DEFAULT_LAT = -80.4327
+DEFAULT_LON = 37.2725
+DEFAULT_ELEV = 400
+
+PassTrack = collections.namedtuple('PassTrack', ['time', 'az', 'el', 'range', 'range_rate'])
+
+
+def make_observer(lat=DEFAULT_LAT, lon=DEFAULT_LON, elev=DEFAULT_ELEV):
+    """
+    Create an ephem observer for the ground station
+    """
+    obs = ephem.Observer()
+    obs.lon = lon
+    obs.lat = lat
+    obs.elev = elev
+    return obs
+
+
+def read_tle(tle=None):
+    """
+    Read a (line0, line1, line2) TLE into an ephem body, defaulting to DEFAULT_TLE
+    """
+    name, line1, line2 = DEFAULT_TLE if tle is None else tle
+    return ephem.readtle(name, line1, line2)
+
+
+def posix_time(date):
+    """
+    Convert a datetime, ephem date or date string (UTC) to POSIX seconds
+    """
+    return (float(ephem.Date(date)) - EPHEM_UNIX_EPOCH) * SECONDS_PER_DAY
+
+
+def ephem_date(seconds):
+    """
+    Convert POSIX seconds to an ephem date
+    """
+    return ephem.Date(seconds / SECONDS_PER_DAY + EPHEM_UNIX_EPOCH)
+
+
+def to_datetimes(times):
+    """
+    Convert an array of POSIX seconds to a list of naive UTC datetimes
+    """
+    epoch = datetime.datetime(1970, 1, 1)
+    return [epoch + datetime.timedelta(seconds=t) for t in np.asarray(times, dtype=np.float64).tolist()]
+
+
+def propagate(tle, observer, times):
+    """
+    Look angles for every time in a grid of POSIX seconds. Returns a PassTrack of arrays:
+    az/el in degrees, range in meters and range rate in meters per second. The observer
+    passed in is not modified
+    """
+    times = np.ascontiguousarray(times, dtype=np.float64)
+    body = tle if isinstance(tle, ephem.EarthSatellite) else read_tle(tle)
+    obs = observer.copy()
+
+    az = np.empty(times.shape)
+    el = np.empty(times.shape)
+    rng = np.empty(times.shape)
+    rng_rate = np.empty(times.shape)
+
+    # set the date directly in ephem's day count, no datetime round trips
+    days = times / SECONDS_PER_DAY + EPHEM_UNIX_EPOCH
+    with instrument.timer('propagator.propagate', times.size):
+        for i, day in enumerate(days.tolist()):
+            obs.date = day
+            body.compute(obs)
+            az[i] = body.az
+            el[i] = body.alt
+            rng[i] = body.range
+            rng_rate[i] = body.range_velocity
+
+    return PassTrack(times, np.degrees(az), np.degrees(el), rng, rng_rate)
+
+
+def pass_window(tle, observer, date):
+    """
+    Find the next pass after date. Returns (rise, culmination, set) in POSIX seconds
+    """
+    body = tle if isinstance(tle, ephem.EarthSatellite) else read_tle(tle)
+    obs = observer.copy()
+    obs.date = date
+    with instrument.timer('propagator.pass_window'):
+        body.compute(obs)
+        rise, _, culmination, _, setting, _ = obs.next_pass(body)
+    if rise is None or setting is None:
+        raise Exception('Failed to find a complete pass after %s' % ephem.Date(date))
+    return (posix_time(rise), posix_time(culmination), posix_time(setting))
+
+
+def pass_times(rise, setting, step=1.0, fine_step=None, culmination=None, fine_window=60.0):
+    """
+    Time grid from rise to one step past set. With fine_step, samples within fine_window
+    seconds of culmination use the fine step and the rest of the pass uses step. This is
+    a fixed band around culmination, not a step that adapts to the elevation rate
+    """
+    times = rise + step * np.arange(math.floor((setting - rise) / step) + 2)
+    if fine_step is not None and culmination is not None:
+        start = max(rise, culmination - fine_window)
+        end = min(setting, culmination + fine_window)
+        fine = start + fine_step * np.arange(math.floor((end - start) / fine_step) + 1)
+        times = np.concatenate((times[times < start], fine, times[times > fine[-1]]))
+    return times
+
+
+def propagate_pass(tle=None, observer=None, date=None, step=1.0, fine_step=None, fine_window=60.0):
+    """
+    Propagate the next pass after date on a step second grid, optionally refined near
+    culmination (see pass_times). Samples stop at the first one at or below the horizon,
+    as compute_angles always has. tle is a (line0, line1, line2) TLE or an ephem body.
+    date defaults to datetime.datetime.now(), which like compute_angles always has reads
+    the local time as UTC
+    """
+    body = tle if isinstance(tle, ephem.EarthSatellite) else read_tle(tle)
+    observer = make_observer() if observer is None else observer
+    date = datetime.datetime.now() if date is None else date
+
+    rise, culmination, setting = pass_window(body, observer, date)
+    track = propagate(body, observer, pass_times(rise, setting, step, fine_step, culmination, fine_window))
+
+    below = np.flatnonzero(track.el <= 0.0)
+    end = below[0] if below.size else track.time.size
+    return PassTrack(*(np.ascontiguousarray(column[:end]) for column in track))
+# ---------------------------------------------------------------------------------------
@@ -0,0 +1,56 @@
+
+import os
+
+from passcache import load_track, save_track
+from propagator import make_observer, propagate_pass, to_datetimes
+
+# ---------------------------------------------------------------------------------------
+# reference passes used by the analysis notebooks
+#
+# each pass is a .npy file in data/reference_passes written by passcache.save_track
+# (rows: POSIX time, az, el, range, range rate). passes are memory-mapped on first use,
+# so importing this module costs nothing
+# ---------------------------------------------------------------------------------------
+
+REFERENCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'reference_passes')
+
+_loaded = {}
+
+
+def reference_names():
+    """
+    Names of the available reference passes
+    """
+    return sorted(name[:-len('.npy')] for name in os.listdir(REFERENCE_DIR) if name.endswith('.npy'))
+
+
+def reference_pass(name):
+    """
+    Reference pass as a PassTrack of memory-mapped arrays
+    """
+    if name not in _loaded:
+        path = os.path.join(REFERENCE_DIR, name + '.npy')
+        if not os.path.isfile(path):
+            raise Exception('Unknown reference pass %s (available: %s)' % (name, ', '.join(reference_names())))
+        _loaded[name] = load_track(path)
+    return _loaded[name]
+
+
+def reference_angles(name):
+    """
+    Reference pass in the (az, el, time) list format returned by compute_angles
+    """
+    track = reference_pass(name)
+    return (track.az.tolist(), track.el.tolist(), to_datetimes(track.time))
+
+
+def add_reference_pass(name, tle=None, date=None, observer=None, step=1.0):
+    """
+    Propagate the next pass after date and save it as a new reference pass
+    """
+    observer = make_observer() if observer is None else observer
+    track = propagate_pass(tle, observer, date, step)
+    save_track(os.path.join(REFERENCE_DIR, name + '.npy'), track)
+    _loaded.pop(name, None)
+    return reference_pass(name)
+# ---------------------------------------------------------------------------------------
@@ -0,0 +1,246 @@
+
+import concurrent.futures
+import csv
+import itertools
+import json
+import os
+
+import numpy as np
+import pint
+
+from linkbatch import anchor_state, apply_deltas
+from losses import loss_profile
+
+# ---------------------------------------------------------------------------------------
+# design space sweeps of the link budget over many passes
+#
+# every combination of the swept calculator parameters is evaluated over every pass and
+# reduced to a summary row (time above margin, min/max margin, margin at culmination).
+# configurations are handed to a process pool in chunks and rows are appended to a CSV
+# results table as chunks finish, so an interrupted sweep resumes where it stopped. a
+# fingerprint of the sweep (grid, units, passes, loss profiles, calculator factory) is
+# kept next to the table in <results_path>.sweep.json, and a table is only resumed by
+# the same sweep
+#
+# make_calculator(ureg) must return a fully configured LinkBudgetCalculator and must be
+# a module level function so it can be sent to the worker processes
+# ---------------------------------------------------------------------------------------
+
+SUMMARY_COLUMNS = ['time_above_margin', 'min_margin', 'max_margin', 'culmination_margin']
+
+# per-process state set up by _init_worker
+_worker = {}
+
+
+def parameter_grid(ranges):
+    """
+    Every combination of the parameter values in ranges (name -> sequence), as a list of
+    dicts in a stable order
+    """
+    names = list(ranges)
+    return [dict(zip(names, values)) for values in itertools.product(*(ranges[name] for name in names))]
+
+
+def summarize_pass(times, elevations, margins):
+    """
+    Summary of one pass: seconds with positive margin (each sample counts until the next
+    one), minimum and maximum margin, and the margin at the highest elevation
+    """
+    if times.size > 1:
+        durations = np.diff(times, append=2.0 * times[-1] - times[-2])
+    else:
+        durations = np.ones(times.shape)
+    return (float(durations[margins > 0].sum()),
+            float(margins.min()),
+            float(margins.max()),
+            float(margins[np.argmax(elevations)]))
+
+
+def sweep_fingerprint(make_calculator, ranges, units, passes, atmosphere, pointing):
+    """
+    Everything that determines the rows of a results table, as plain JSON data. passes
+    is a list of (name, times, elevations)
+    """
+    return {
+        'calculator': '%s.%s' % (make_calculator.__module__, make_calculator.__qualname__),
+        'ranges':     dict((name, np.asarray(values).tolist()) for name, values in ranges.items()),
+        'units':      dict(units),
+        'passes':     [[name, float(times[0]), float(times[-1]), int(times.size)] for name, times, _ in passes],
+        'atmosphere': atmosphere,
+        'pointing':   pointing,
+    }
+
+
+def _check_fingerprint(results_path, fingerprint):
+    """
+    Raise unless the results table at results_path was written by the sweep described by
+    fingerprint
+    """
+    fingerprint_path = results_path + '.sweep.json'
+    if not os.path.isfile(fingerprint_path):
+        raise Exception('Results table %s has no sweep fingerprint (%s), so it cannot be resumed'
+                        % (results_path, fingerprint_path))
+    with open(fingerprint_path) as f:
+        stored = json.load(f)
+    # compare through JSON so tuples and lists match
+    expected = json.loads(json.dumps(fingerprint))
+    changed = sorted(key for key in set(stored) | set(expected) if stored.get(key) != expected.get(key))
+    if changed:
+        raise Exception('Results table %s was written by a different sweep (%s changed); use a new results path'
+                        % (results_path, ', '.join(changed)))
+
+
+def _write_fingerprint(results_path, fingerprint):
+    with open(results_path + '.sweep.json', 'w') as f:
+        json.dump(fingerprint, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def _init_worker(make_calculator, units, passes, atmosphere, pointing):
+    ureg = pint.UnitRegistry()
+    _worker['ureg'] = ureg
+    _worker['lb_calc'] = make_calculator(ureg)
+    _worker['units'] = units
+
+    # loss profiles only depend on the pass, so evaluate them once per process
+    atm_profile = loss_profile(atmosphere)
+    rx_profile = loss_profile(pointing)
+    _worker['passes'] = [(name, times, el, atm_profile(el), rx_profile(el)) for name, times, el in passes]
+
+
+def _run_chunk(chunk):
+    ureg = _worker['ureg']
+    lb_calc = _worker['lb_calc']
+    units = _worker['units']
+
+    rows = []
+    for index, config in chunk:
+        for name, value in config.items():
+            setattr(lb_calc, name, ureg.Quantity(value, units[name]) if name in units else value)
+
+        # one scalar run per configuration, every pass is shifted from it
+        lb_calc.run()
+        if not lb_calc.is_valid:
+            raise Exception('Configuration ', config, ' was not valid')
+        anchor = anchor_state(lb_calc, ureg)
+
+        for pass_name, times, el, atm, rx in _worker['passes']:
+            margins = apply_deltas(anchor, el, atm, rx, ureg).link_margin
+            rows.append([index] + list(config.values()) + [pass_name] + list(summarize_pass(times, el, margins)))
+    return rows
+
+
+def _completed_configs(results_path, header, n_passes):
+    """
+    Indices of the configurations already fully written to results_path. Rows of a
+    configuration cut short by a crash are dropped from the file
+    """
+    if not os.path.isfile(results_path):
+        return set()
+
+    with open(results_path, newline='') as f:
+        lines = f.read().splitlines(True)
+    if not lines:
+        return set()
+    if next(csv.reader(lines[:1])) != header:
+        raise Exception('Results table %s was written by a different sweep' % results_path)
+
+    # a crash can leave a partial last line
+    rows = [line for line in lines[1:] if line.endswith('\n')]
+    counts = {}
+    for row in csv.reader(rows):
+        counts[int(row[0])] = counts.get(int(row[0]), 0) + 1
+    done = set(index for index, count in counts.items() if count == n_passes)
+
+    kept = [line for line, row in zip(rows, csv.reader(rows)) if int(row[0]) in done]
+    if len(kept) != len(lines) - 1:
+        with open(results_path, 'w', newline='') as f:
+            f.writelines(lines[:1] + kept)
+    return done
+
+
+def run_sweep(make_calculator, ranges, passes, results_path, units=None,
+              atmosphere='atmosphere', pointing='eggbeater', processes=None, chunk_size=64):
+    """
+    Evaluate every combination of ranges (calculator attribute -> sequence of values)
+    over every pass and append one summary row per configuration and pass to the CSV
+    table at results_path. Configurations already in the table are skipped; a table
+    written by a sweep with a different grid, units, passes, loss profiles or
+    make_calculator is refused rather than resumed.
+
+    passes maps a name to a PassTrack (see refpasses.reference_pass). units maps
+    attribute names to pint unit names for swept values that carry units, e.g.
+    {'noise_bandwidth': 'kilohertz'}. processes=0 runs in this process. Returns the
+    number of configurations evaluated
+    """
+    units = {} if units is None else dict(units)
+    configs = parameter_grid(ranges)
+    header = ['config_index'] + list(ranges) + ['pass'] + SUMMARY_COLUMNS
+
+    # plain arrays for the worker processes, no memory maps
+    pass_arrays = [(name, np.array(track.time), np.array(track.el)) for name, track in passes.items()]
+
+    fingerprint = sweep_fingerprint(make_calculator, ranges, units, pass_arrays, atmosphere, pointing)
+    new_file = not os.path.isfile(results_path) or os.path.getsize(results_path) == 0
+    if new_file:
+        _write_fingerprint(results_path, fingerprint)
+    else:
+        _check_fingerprint(results_path, fingerprint)
+
+    done = _completed_configs(results_path, header, len(pass_arrays))
+    todo = [(index, config) for index, config in enumerate(configs) if index not in done]
+    chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+    init_args = (make_calculator, units, pass_arrays, atmosphere, pointing)
+
+    with open(results_path, 'a', newline='') as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(header)
+
+        def write(rows):
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if processes == 0:
+            _init_worker(*init_args)
+            for chunk in chunks:
+                write(_run_chunk(chunk))
+        else:
+            workers = processes or os.cpu_count() or 1
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                        initargs=init_args) as pool:
+                # keep a bounded number of chunks in flight and stream results as they finish
+                max_pending = 4 * workers
+                pending = set()
+                for chunk in chunks:
+                    if len(pending) >= max_pending:
+                        finished, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                        for future in finished:
+                            write(future.result())
+                    pending.add(pool.submit(_run_chunk, chunk))
+                for future in concurrent.futures.as_completed(pending):
+                    write(future.result())
+
+    return len(todo)
+
+
+def load_results(results_path):
+    """
+    Read a sweep results table into a dict of NumPy columns
+    """
+    with open(results_path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    columns = {}
+    for i, name in enumerate(header):
+        values = [row[i] for row in rows]
+        if name == 'pass':
+            columns[name] = np.array(values)
+        elif name == 'config_index':
+            columns[name] = np.array(values, dtype=np.int64)
+        else:
+            columns[name] = np.array(values, dtype=np.float64)
+    return columns
+# ---------------------------------------------------------------------------------------
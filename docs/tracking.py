@@ -0,0 +1,136 @@
+
+import asyncio
+import collections
+import time
+
+import numpy as np
+
+from linkbatch import anchor_state, apply_deltas
+from losses import loss_profile
+from propagator import make_observer, posix_time, propagate, read_tle
+
+# ---------------------------------------------------------------------------------------
+# real-time tracking for the ground station
+#
+# track() is an async generator that yields one TrackSample per tick with the look
+# angles, range, Doppler shift and live link margin. propagation and the link budget are
+# computed a block of ticks ahead in a worker thread, so each tick only indexes into
+# arrays that are already computed and the rotator and receiver never wait on ephem
+# ---------------------------------------------------------------------------------------
+
+SPEED_OF_LIGHT = 299792458.0  # m/s
+
+MIN_RATE = 1.0   # Hz
+MAX_RATE = 20.0  # Hz
+
+# events reported in TrackSample.events
+AOS = 'aos'                          # satellite rose above the horizon
+MARGIN_POSITIVE = 'margin_positive'  # link margin went above zero
+MARGIN_NEGATIVE = 'margin_negative'  # link margin dropped to zero or below
+LOS = 'los'                          # satellite set below the horizon
+
+TrackSample = collections.namedtuple('TrackSample', ['time', 'az', 'el', 'range', 'range_rate',
+                                                     'doppler', 'link_margin', 'events'])
+
+
+def _compute_block(tle, observer, times, anchor, atm_profile, rx_profile, frequency, ureg):
+    """
+    Look angles, Doppler (Hz) and link margin (dB, NaN below the horizon) for a block of
+    tick times
+    """
+    track = propagate(tle, observer, times)
+    el = np.clip(track.el, 0.0, 90.0)
+    margins = apply_deltas(anchor, el, atm_profile(el), rx_profile(el), ureg).link_margin
+    margins = np.where(track.el > 0.0, margins, np.nan)
+    doppler = -track.range_rate / SPEED_OF_LIGHT * frequency
+    return track, doppler, margins
+
+
+def _events(previous, el, margin):
+    """
+    Events between the previous (el, margin) and the current sample
+    """
+    prev_el, prev_margin = previous
+    events = []
+    if el > 0.0 and not prev_el > 0.0:
+        events.append(AOS)
+    if margin > 0.0 and not prev_margin > 0.0:
+        events.append(MARGIN_POSITIVE)
+    if prev_margin > 0.0 and not margin > 0.0:
+        events.append(MARGIN_NEGATIVE)
+    if prev_el > 0.0 and not el > 0.0:
+        events.append(LOS)
+    return tuple(events)
+
+
+async def track(tle, lb_calc, ureg, observer=None, rate=1.0, lookahead=30.0, start=None, duration=None,
+                atmosphere='atmosphere', pointing='eggbeater', realtime=True):
+    """
+    Yield a TrackSample every 1/rate seconds (rate between 1 and 20 Hz), starting now or
+    at start (POSIX seconds or any date ephem accepts), for duration seconds or until the
+    consumer stops. lb_calc must be configured; it is run once up front and the margin
+    at each tick is shifted from that run. lookahead is how many seconds of ticks are
+    computed ahead of time. With realtime=False samples are produced as fast as they are
+    consumed, for replaying or simulating a pass. In realtime mode ticks whose time has
+    already passed by a full period when they come up (the consumer fell behind) are
+    skipped rather than yielded late; events are reported against the last yielded
+    sample, so none are lost. The first sample carries no events
+    """
+    if not MIN_RATE <= rate <= MAX_RATE:
+        raise Exception('Tracking rate must be between %g and %g Hz' % (MIN_RATE, MAX_RATE))
+
+    # fail early on a bad TLE; each block reads its own copy in the worker thread
+    read_tle(tle)
+    observer = make_observer() if observer is None else observer
+    if start is None:
+        start = time.time()
+    elif not isinstance(start, (int, float)):
+        start = posix_time(start)
+    period = 1.0 / rate
+    block_size = max(1, int(round(lookahead * rate)))
+
+    # static part of the budget, computed once
+    lb_calc.run()
+    if not lb_calc.is_valid:
+        raise Exception('Run at elevation angle ', lb_calc.orbit_elevation_angle, ' was not valid')
+    anchor = anchor_state(lb_calc, ureg)
+    frequency = lb_calc.downlink_frequency.to(ureg.hertz).magnitude
+    atm_profile = loss_profile(atmosphere)
+    rx_profile = loss_profile(pointing)
+
+    loop = asyncio.get_running_loop()
+
+    def prefetch(first_tick):
+        times = start + period * np.arange(first_tick, first_tick + block_size)
+        return loop.run_in_executor(None, _compute_block, tle, observer, times, anchor,
+                                    atm_profile, rx_profile, frequency, ureg)
+
+    tick = 0
+    previous = None
+    pending = prefetch(0)
+    try:
+        while True:
+            block, doppler, margins = await pending
+            pending = prefetch(tick + block_size)
+
+            for i in range(block_size):
+                if duration is not None and tick * period >= duration:
+                    return
+                tick += 1
+                if realtime:
+                    delay = block.time[i] - time.time()
+                    if delay <= -period:
+                        continue
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                el = float(block.el[i])
+                margin = float(margins[i])
+                # a tracker started mid-pass has no previous sample to compare against
+                events = () if previous is None else _events(previous, el, margin)
+                yield TrackSample(float(block.time[i]), float(block.az[i]), el, float(block.range[i]),
+                                  float(block.range_rate[i]), float(doppler[i]), margin, events)
+                previous = (el, margin)
+    finally:
+        pending.cancel()
+# ---------------------------------------------------------------------------------------
@@ -1,8 +1,6 @@
 
 import os
-#import ephem
-import datetime
-import math
+import importlib
 
 # ---------
 # add lib folder to the path
@@ -49,76 +47,50 @@ def get_project_root():
 # atmospheric loss at given elevation (for our frequency)
 # these values were found using the AMSAT link budget calculator
 # see documentation for further information
+# the breakpoint table lives in data/loss_profiles/atmosphere.json
 def atmloss_at_elev(ureg, elev):
-    return -4.6 if elev < 5  * ureg.degrees else \
-           -2.1 if elev < 10 * ureg.degrees else \
-           -1.1 if elev < 30 * ureg.degrees else \
-           -0.4 if elev < 45 * ureg.degrees else \
-           -0.3 if elev < 90 * ureg.degrees else 0.0
+    from losses import loss_profile
+    return loss_profile('atmosphere')(elev)
 # ---------------
 
 # ---------------------------------------------------------------------------------------
 # look angles for NOAA-19 satellite pass
 # uses pyephem and online TLEs for next pass on given datetime
-def compute_angles(tle=None, date=None):
-	# handle the date argument
-	date = datetime.datetime.now() if date is None else date 
+# thin wrapper around propagator.propagate_pass, which returns NumPy arrays
+# pass a passcache.PassCache to reuse predictions from earlier runs
+def compute_angles(tle=None, date=None, cache=None):
+	from propagator import propagate_pass, to_datetimes
 
-	# use an old TLE or the argument
-	if tle is None:
-		name = 'NOAA 19 [+]'
-		line1 = '1 33591U 09005A   18092.90091581  .00000055  00000-0  55075-4 0  9994'
-		line2 = '2 33591  99.1353  69.4619 0014005 174.2137 185.9198 14.12266303471284'
+	if cache is None:
+		track = propagate_pass(tle=tle, date=date)
 	else:
-		name = tle[0]
-		line1 = tle[1]
-		line2 = tle[2]
-
-	# read in the tle
-	tle_rec = ephem.readtle(name, line1, line2)
-
-	# make a new ephem observer
-	obs = ephem.Observer()
-	obs.lon = 37.2725
-	obs.lat = -80.4327
-	obs.elev = 400
-	obs.date = date
-
-	# compute the orbit trajectory stuff
-	tle_rec.compute(obs)
-
-	# find the next pass
-	next_pass = obs.next_pass(tle_rec)
-	
-	# move the current time to the next pass
-	obs.date = next_pass[0]
-	tle_rec.compute(obs)
-
-	# empty lists to start
-	alts  = []
-	azs   = []
-	times = []
-
-	# loop through entire pass
-	while tle_rec.alt > 0:
-		# save results to list in radians
-		alts.append(math.degrees(float(tle_rec.alt)))
-		azs.append(math.degrees(float(tle_rec.az)))
-		times.append(obs.date.datetime())
-
-		# compute next second timestep
-		obs.date = obs.date.datetime() + datetime.timedelta(seconds=1)
-		# compute next pointing angle
-		tle_rec.compute(obs)
+		track = cache.pass_track(tle=tle, date=date)
 
 	# return a tuple with the lists
 	# format is (az, el, time)
-	return (azs, alts, times)
+	return (track.az.tolist(), track.el.tolist(), to_datetimes(track.time))
 # -------------------------------------------------------------------------------
 
-angles_poor = ([8.008955169804599, 8.094774789178517, 8.180814682153168, 8.267073994954904, 8.353554435131022, 8.440256002681517, 8.52718125892733, 8.61432849632117, 8.701700276183972, 8.789297452289386, 8.877119170863763, 8.965167139454397, 9.053442211834936, 9.141945241779021, 9.230676229286658, 9.319636881905135, 9.408827199634453, 9.49824803624826, 9.587900245520201, 9.67778553499757, 9.767903050906718, 9.858253647021293, 9.948839884662233, 10.039660056282246, 10.130716723202271, 10.222010739195953, 10.31354125048965, 10.405310818404294, 10.497318589166243, 10.58956627032279, 10.682054715647578, 10.774784778914256, 10.867756460122823, 10.960970613046927, 11.054428945233857, 11.148131456683616, 11.242078147396203, 11.336271578692555, 11.430711750572677, 11.525398663036562, 11.620334023631509, 11.71551868613116, 11.810952650535517, 11.906636770618226, 12.002571900152931, 12.098759746686929, 12.195200310220217, 12.291893590752794, 12.388842149605601, 12.486045133004993, 12.583504248498258, 12.681219496085399, 12.779192583313709, 12.877423510183185, 12.975913130467477, 13.074662297940229, 13.173672720148733, 13.272943543319345, 13.372476474999356, 13.472271515188766, 13.572331225208513, 13.672653897511307, 13.773242947191731, 13.874096666702494, 13.975217617364532, 14.0766049454042, 14.17826121214244, 14.2801855638056, 14.382380561714625, 14.48484364454857, 14.587579934949318, 14.690587725369573, 14.793867015809335, 14.89742122136319, 15.001248634483847, 15.105349255171305, 15.209728206067439, 15.314382072077667, 15.419312560749281, 15.524521379629572, 15.630010236265834, 15.73577571556348, 15.841822940164391, 15.948150202521273, 16.054759210181416, 16.161651670692116, 16.268825876506078, 16.376283535170597, 16.484026354232963, 16.592052626145886, 16.70036747355124, 16.808967481354443, 16.917854357102787, 17.027029808343563, 17.13649383507677, 17.246246437302414, 17.356291030115074, 17.46662590596746, 17.57725106485957, 17.688169921885994, 17.799380769499432, 17.910887022794476, 18.02268526667654, 18.134780623787496, 18.247171386580053, 18.35985755505422, 18.472840836757275, 18.58612123168923, 18.699702154944664, 18.813580191428994, 18.927758756236805, 19.042237849368096, 19.15701747082287, 19.272099328148414, 19.38748342134473, 19.50316975041182, 19.619160022896978, 19.735455946347493, 19.852055813216072, 19.96895962350272, 20.086170792302017, 20.20368931961396, 20.32151520543856, 20.43964844977581, 20.558089052625707, 20.67684042908284, 20.79590087159992, 20.91527208772423, 21.03495407745578, 21.154946840794562, 21.275252085287875, 21.395869810935714, 21.516801725285376, 21.638046120789564, 21.759604704995574, 21.881477477903406, 22.003666147060347, 22.126170712466404, 22.248992881668865, 22.372129239573148, 22.49558490882113, 22.619358181865515, 22.743449058706307, 22.867859246890795, 22.99258703887169, 23.11763584974358, 23.243005679506453, 23.36869482061303, 23.494704980610592, 23.621037867046443, 23.74769177237328, 23.874668404138404, 24.00196776234181, 24.129589846983496, 24.257534658063467, 24.385803903129016, 24.514397582180138, 24.64331740276413, 24.7725599497864, 24.902128638341544, 25.032023468429554, 25.162244440050433, 25.29279155320418, 25.42366480789079, 25.55486591165757, 25.68639315695721, 25.818248251337014, 25.950431194796977, 26.082943694884396, 26.21578233650468, 26.34895053475242, 26.482448289627612, 26.616273893582964, 26.750429054165767, 26.884912063828736, 27.019726337666448, 27.154870168131612, 27.29034355522423, 27.426146498944302, 27.56228070683912, 27.698744471361387, 27.835539500058402, 27.97266408538287, 28.110119934882086, 28.247907048556044, 28.38602371885746, 28.524471653333617, 28.66325085198452, 28.802357899715584, 28.94179962671598, 29.081569202796537, 29.221673458146423, 29.36210556257647, 29.50286893118126, 29.6439635639608, 29.785389460915084, 29.92714320694953, 30.06922821715872, 30.211644491542657, 30.354392030101337, 30.49746741774018, 30.640874069553767, 30.7846119855421, 30.928677750610593, 31.073071364759247, 31.21779624308265, 31.36284897048621, 31.508232962064515, 31.653941387628397, 31.799981077367026, 31.94634520109123, 32.09304058899018, 32.240060410874705, 32.38740808183939, 32.53508018678965, 32.68308014082007, 32.83140794393065, 32.980056765932225, 33.12903343701396, 33.27833454208127, 33.42795666603956, 33.57790322398344, 33.728174215912894, 33.87876622673333, 34.02968267153935, 34.180916720141774, 34.33247520272977, 34.48435128911417, 34.636548394389564, 34.789063103461366, 34.94189541632957, 35.095048748088765, 35.248516268549785, 35.40229797771262, 35.55639729067186, 35.71081420742751, 35.86554189779039, 36.0205837768551, 36.17593642952704, 36.3316032709008, 36.4875808858818, 36.643865859375445, 36.800461606476325, 36.957364712089856, 37.11457517621604, 37.27209299885487, 37.42991476491178, 37.58804388948133, 37.74647354237436, 37.905203723590866, 38.064237848225446, 38.223572501183504, 38.38320768246504, 38.54313656188089, 38.703365969620215, 38.86388907549386, 39.02470929459639, 39.185819796738656, 39.34722399701523, 39.508921895426106, 39.670906661782126, 39.83318171117788, 39.99574362851877, 40.15858899871021, 40.3217212368468, 40.485136927833935, 40.64883265657704, 40.81281183817071, 40.977067642425766, 41.141603484436786, 41.306412534014605, 41.47149820625382, 41.63685708605983, 41.80248575833805, 41.968387638183074, 42.13455589540573, 42.3009939451006, 42.467694957078514, 42.63465893133948, 42.801885867883485, 42.969375766710534, 43.137121797631465, 43.30512737574085, 43.47338567084953, 43.6418966829575, 43.810663827159345, 43.97967685817132, 44.14894260618257, 44.31845082590936, 44.48820493244627, 44.65820151069872, 44.82843714557212, 44.998915252161055, 45.16962558518176, 45.340574974823426, 45.51175659089687, 45.683167018307515, 45.85480625705535, 46.02667430714038, 46.19876775346802, 46.371083180943685, 46.54361717447279, 46.71637314914993, 46.88934427478591, 47.06252713628617, 47.23592514874529, 47.409531481974085, 47.58334613597257, 47.75736569564616, 47.931586745900255, 48.10601270182946, 48.28063331815, 48.45545200995648, 48.630461947059715, 48.8056665445543, 48.981058972251056, 49.15663923014999, 49.33240390315651, 49.50834957617604, 49.68447283411399, 49.86077367697036, 50.03725210474515, 50.213901287249186, 50.390717809387894, 50.56770508625585, 50.7448528725693, 50.92216458342283, 51.09963680372186, 51.27726270327721, 51.45504569718347, 51.632978955251474, 51.811059062386626, 51.989289433683524, 52.16765982385841, 52.346173648005866, 52.52482407593671, 52.70361110765097, 52.88252791295945, 53.06157790695676, 53.240754259453695, 53.4200535553557, 53.599475794662766, 53.77901756228031, 53.95867544311374, 54.13844602206847, 54.318325884049926, 54.498315029058105, 54.67841004199842, 54.858604092681695, 55.03890059620252, 55.219289307277144, 55.399773641000145, 55.58035018227694, 55.761012100918364, 55.94175598182982, 56.12258524010591, 56.30349304555745, 56.48447256799528, 56.66553063760857, 56.84665359401897, 57.02784485232106, 57.20910099742028, 57.39041861422202, 57.57179428763171, 57.75322460255476, 57.934702728801994, 58.116235496562595, 58.29780924545821, 58.47943080567802, 58.66108651684368, 58.84278320914436, 59.02451405239089, 59.2062722163941, 59.38805770115399, 59.56987050667056, 59.75170380275464, 59.93355758940623, 60.11542503643616, 60.29730614384442, 60.47920091163103, 60.66109567941765, 60.84299727739342, 61.0248988753692, 61.20679364315581, 61.38868841094242, 61.570569518350695, 61.752436965380625, 61.93429758222138, 62.11613087830546, 62.2979505140112, 62.47974282896026, 62.66150782315264, 62.84324549658834, 63.02494218888902, 63.20661156043302, 63.388239950842, 63.56982052992679, 63.75136012787655, 63.93285191450213, 64.11428905961435, 64.2956715632132, 64.47699942529871, 64.65826581568167, 64.83947073436211, 65.02060735115086, 65.20167566604789, 65.38267567905324, 65.56359372978852, 65.74443664844296, 65.92519760482735, 66.10587659894169, 66.28646680059683, 66.46696820979275, 66.6473739963403, 66.82768416023947, 67.00789870149025, 67.18801078990349, 67.36801359529001, 67.54791394783898, 67.72770501736122, 67.90738680385674, 68.08694564694721, 68.26638837682178, 68.4457081632913, 68.62490500635575, 68.80397890601515, 68.98291620189114, 69.16173055436208, 69.34040147286044, 69.5189357875754, 69.69733349850696, 69.87558777546596, 70.05369178826321, 70.23164553689872, 70.40945585156166, 70.5871090718737, 70.76460519783481, 70.94193739925586, 71.11911250632599, 71.29612368885604, 71.472970946846, 71.64964745010673, 71.82614636844903, 72.00247453206208, 72.17862511075671, 72.35459810453291, 72.5303935133907, 72.70599767695172, 72.88141742540517, 73.05664592856185, 73.23169001661093, 73.40653602917409, 73.58118396625132, 73.75563382784262, 73.92988561394797, 74.10393249437824, 74.2777744691334, 74.4514047080243, 74.62483004124009, 74.79804363859162, 74.9710386698897, 75.14382196532351, 75.31638669470388, 75.48872602784165, 75.66084679492597, 75.83274216576768, 76.00441214036678, 76.1758498885341, 76.34705541026963, 76.5180287055734, 76.68876977444538, 76.85927178669641, 77.02953474232649, 77.19955181114643, 77.36932982334545, 77.5388687789235, 77.70815501750226, 77.87719536927092, 78.04598300404027, 78.21451792181034, 78.3828001225811, 78.5508296063526, 78.71859954293562, 78.88610993233019, 79.05335394434711, 79.22034523936475, 79.38706332681559, 79.55352186707798, 79.71970719977355, 79.88563298528068, 80.05127873303182, 80.21665810340534, 80.3817574360229, 80.54658356107363, 80.71113647855759, 80.87540935828557, 81.03940220025757, 81.2031150044736, 81.36654777093366, 81.52969366944859, 81.69255270001838, 81.85512486264302, 82.01741015732253, 82.17940858405689, 82.34111331265694, 82.50252434312269, 82.66364850564328, 82.82447897002957, 82.98500890609238, 83.14524514402088, 83.3051808536259, 83.46481603490744, 83.62415751805466, 83.78319164268925, 83.94192523900034, 84.10035830698796, 84.25848401646292, 84.4163091976144, 84.57382702025323, 84.73103748437941, 84.88793375980379, 85.04452950690467, 85.20081106530372, 85.35677843500096, 85.51243844618556, 85.66778426866833, 85.82281590244928, 85.97753334752841, 86.13193660390571, 86.2860256715812, 86.43980055055486, 86.59325441063754, 86.74638725182923, 86.8992059043191, 87.05170353791797, 87.20388015262586, 87.35573574844275, 87.50727032536865, 87.65848388340356, 87.80937642254749, 87.95994794280041, 88.11019161397319, 88.26011426625497, 88.40970906945658, 88.55897602357804, 88.70792195880851, 88.85654004495882, 89.00483028202896, 89.15279950020812, 89.30043403911795, 89.44774755913679, 89.59472639988628, 89.74138422174481, 89.88770736433399, 90.03370265784301, 90.17937010227187, 90.3247028674314, 90.46970778351077, 90.61438485050998, 90.75873406842904, 90.90274860707875, 91.04642846645915, 91.18978047675937, 91.33280463797944, 91.47549411993018, 91.61784892261157, 91.75987587621282, 91.90156815054473, 92.04293257579648, 92.18395549158974, 92.324657388492, 92.46501777593576, 92.60505031429938, 92.74475500358281, 92.88411818340775, 93.02315351415253, 93.16186099581715, 93.30022696802327, 93.43826509114922, 93.57597536519502, 93.71334412978231, 93.85038504528946, 93.98709128152726, 94.1234696686849, 94.25951337657322, 94.39522923538138, 94.53061041492019, 94.66565691518969, 94.80037556637902, 94.93476636848818, 95.06881566113886, 95.20254393489854, 95.33593752938889, 95.46900327479908, 95.60173434093993, 95.73413755800063, 95.86621292598117, 95.99795361469238, 96.12936645432342, 96.2604514448743, 96.39120858634503, 96.52163787873559, 96.651739322046, 96.78150608608706, 96.91095183123714, 97.04006972730707, 97.16885977429683, 97.29732197220643, 97.42546315122505, 97.5532764811635, 97.68076196202178, 97.80791959379991, 97.93475620668704, 98.06127180068319, 98.18745954559917, 98.31332627162416, 98.43886514856901, 98.56408983681202, 98.68898667597487, 98.81356249624673, 98.9378172976276, 99.06175108011749, 99.18536384371637, 99.30865558842427, 99.43163314443035, 99.55428968154544, 99.67662519976955, 99.79864652929182, 99.92035367011228, 100.04173979204174, 100.16280489508021, 100.28356263960605, 100.40399936524088, 100.52412190217389, 100.64393708059426, 100.76343124012364, 100.88261804114035, 101.00149065345525, 101.12004907706833, 101.23830014216877, 101.35623701856738, 101.47386653645334, 101.59118186563748, 101.70819666649814, 101.82489727865698, 101.94129053230316, 102.0573764274367, 102.17316179424675, 102.28863297235499, 102.40380362213975, 102.51867374360101, 102.63323650654964, 102.74749191098562, 102.8614467870981, 102.97510113488713, 103.08845495435266, 103.20150824549471, 103.31426100831327, 103.42672007299753, 103.53887177916914, 103.65072978720644, 103.76229409710943, 103.87355787868894, 103.98452796213414, 104.09519751725585, 104.20558020443242, 104.31566236328553, 104.42545765419348, 104.53495241677795, 104.64416031141728, 104.75308133811149, 104.86170866667136, 104.9700491272861, 105.07809588976653, 105.18585578430182, 105.29332881089198, 105.40051496953699, 105.50742109042602, 105.61403351318076, 105.72036589817951, 105.8264182454223, 105.93218372471995, 106.03766233607246, 106.14286773985816, 106.24778627569873, 106.35243160397249, 106.45679006430112, 106.56087531706294, 106.6646805320688, 106.76820570931868, 106.87145767900176, 106.97443644111804, 107.07714199566753, 107.17956751246103, 107.28172665187692, 107.38360575353683, 107.4852184778191, 107.58655799453459, 107.68762430368326, 107.78842423545431, 107.88895778984774, 107.98922496686352, 108.0892189363125, 108.18894652838387, 108.28841457326676, 108.38760941058285, 108.48654470071048, 108.58522044364966, 108.68362980921121, 108.78177962758429, 108.87966306857975, 108.9772937925759, 109.07465813919444, 109.17176293862451, 109.26861502105528, 109.3652075562976, 109.46154737454064, 109.5576276455952, 109.65344836946132, 109.74902320651731, 109.84433849638484, 109.93940789944224, 110.03421775531119, 110.12878172437001, 110.22309297642956, 110.31715834167896, 110.4109709899291, 110.5045377513691, 110.59785862599898, 110.69092678362958, 110.78375588463922, 110.87633909883874, 110.96867642622814, 111.06076786680742, 111.15262025076575, 111.24422674791397, 111.33559418844122, 111.42672257234754, 111.5176118996329, 111.60826217029731, 111.69867338434076, 111.78884554176328, 111.878785472754, 111.96848634712377, 112.0579481648726, 112.14718458637883, 112.23618195126409, 112.32494708971757, 112.41348000173927, 112.5017806873292, 112.58984914648735, 112.67769220940288, 112.76530304588664, 112.85268848612778, 112.93984169993715, 113.02677634769306], [3.007806085383382e-06, 0.034348334315013156, 0.06883754795176444, 0.10344783736372477, 0.13817776847797272, 0.17302584719062736, 0.20799054604727465, 0.24307031758318082, 0.27826356097275906, 0.3135687554317021, 0.3489842200931438, 0.3845084341727768, 0.420139716803735, 0.45587644048000536, 0.4917169510151481, 0.5276595942227237, 0.5637027159162926, 0.5998446619094151, 0.6360837780156515, 0.6724184100485624, 0.7088468504608552, 0.7453674984269432, 0.7819786997603866, 0.818678800274746, 0.855466092422729, 0.8923390287396015, 0.9292959016780711, 0.966335163773404, 1.0034552142000135, 1.040654345410607, 1.0779310633013035, 1.1152837670465165, 1.1527108558206594, 1.1902109422415565, 1.22778221204021, 1.2654232778344443, 1.303132645520379, 1.3409088209941329, 1.3787502034301191, 1.4166555121678683, 1.4546230396600883, 1.4926516119680153, 1.5307396282660626, 1.568885594450349, 1.6070883365821114, 1.6453462538357626, 1.6836580655508335, 1.7220224910668547, 1.760438036279945, 1.7989034205296355, 1.8374173631554565, 1.8759786902186444, 1.9145856941719068, 1.9532375212415973, 1.9919328907672467, 2.030670308644974, 2.06944849421431, 2.108266593701608, 2.1471231130029875, 2.18601698490139, 2.2249469287363475, 2.2639118772908007, 2.302910549904281, 2.3419418793597306, 2.3810047984400913, 2.4200978130414823, 2.4592204962770805, 2.498371140599594, 2.5375486787919637, 2.576752470523956, 2.6159810216916894, 2.6552334785215184, 2.694508773796384, 2.733805840299229, 2.773123610812996, 2.8124610181206267, 2.851816995005063, 2.8911906876926596, 2.9305812424097692, 2.969987165052512, 3.0094080287340637, 3.048842552793955, 3.088289670015129, 3.127748526623939, 3.1672182688467387, 3.2066978294664703, 3.2461863547094874, 3.2856827773587325, 3.325186243640559, 3.3646956863379094, 3.4042104651205487, 3.4437292993280075, 3.4832515486300517, 3.522776359253035, 3.5623024505364866, 3.6018293955935854, 3.641355700320449, 3.6808811512736668, 3.7204040409059456, 3.7599243692172855, 3.799440855547217, 3.8389522192352716, 3.8784584602814487, 3.9179578711384555, 3.9574500249194693, 3.9969336409640204, 4.036408719272109, 4.07587312540962, 4.115326859376552, 4.15476906739926, 4.194198468817274, 4.233614636743772, 4.2730162905182825, 4.312402576367162, 4.351773067403584, 4.391126482967082, 4.430435502300975, 4.469753486258153, 4.509051833421467, 4.5483296900172725, 4.587586629158744, 4.626821370185413, 4.66603263243681, 4.705220842799758, 4.744383866840141, 4.783521277671138, 4.822632648405923, 4.861716698384028, 4.900772146944985, 4.939798994088791, 4.978795959154979, 5.017762188369902, 5.056696827959914, 5.095599024151367, 5.134467496283794, 5.173302244357194, 5.212101560824275, 5.250865018798213, 5.289591337618539, 5.3282800903984295, 5.36693042336424, 5.405541055855498, 5.444111560985383, 5.482640231206602, 5.5211270665191545, 5.559570786262571, 5.597970536663206, 5.636325463947413, 5.6746342874547215, 5.7128965802983105, 5.751111488704532, 5.789277732012916, 5.827394456449819, 5.865460808241592, 5.903475933614591, 5.941438978795168, 5.979348663122854, 6.017204559710827, 6.055005387898617, 6.092750293912576, 6.130438423979061, 6.168068497437599, 6.20564008740137, 6.243151913209903, 6.280603121089553, 6.3179924303798485, 6.355319414193969, 6.392582791871442, 6.4297817096386245, 6.466915313721868, 6.503982323460704, 6.540981885081486, 6.5779131448105685, 6.6147748219874805, 6.651566062838578, 6.688286013590212, 6.724933820468739, 6.761508202813688, 6.798008306851413, 6.834432851921444, 6.870780984250136, 6.907051850063843, 6.943244168702095, 6.979357513278067, 7.015389749357647, 7.051340876940832, 7.087209615367154, 7.1229946839761435, 7.1586948021073304, 7.194309969760716, 7.229838052502183, 7.265278196558087, 7.30062954815478, 7.335891253518618, 7.371062458875952, 7.406141456679491, 7.441127393155589, 7.476019414530599, 7.510815813257229, 7.545516589335479, 7.5801191814444095, 7.6146235895840215, 7.649028959980669, 7.683333585087057, 7.7175366111295425, 7.751636330560832, 7.785632743380924, 7.8195241420425265, 7.853308818998348, 7.886986774248389, 7.920556300245355, 7.954016543215602, 7.987366649385481, 8.020604911207702, 8.053729621134972, 8.08674077916729, 8.11963753153101, 8.152417316905193, 8.18508013528984, 8.21762427913766, 8.250048894675002, 8.282353128128223, 8.314535271950032, 8.346594472366778, 8.37852987560482, 8.410338920343214, 8.442022460355611, 8.47357793432107, 8.505004488465945, 8.53630126901659, 8.567467422199359, 8.598501240466957, 8.629401016272094, 8.66016674961477, 8.690796732947693, 8.72128925872357, 8.751644326942397, 8.781859376283242, 8.811935260519746, 8.841868564557327, 8.871659288395984, 8.901306578262071, 8.930807872834649, 8.960164025887364, 8.989371622325631, 9.018431515923096, 9.047341145358821, 9.07609965685916, 9.104706196650467, 9.133159910959092, 9.161458238464101, 9.18960203293914, 9.21758787928962, 9.24541663128919, 9.273085727616913, 9.30059431449914, 9.327941538162223, 9.35512654483252, 9.382147626962738, 9.40900307700558, 9.435692894961052, 9.462215373281857, 9.488568804420707, 9.514753188377597, 9.54076596383159, 9.566607130782687, 9.592275835457242, 9.617769516534313, 9.643088174013904, 9.668230100348723, 9.693194441765119, 9.717979490715802, 9.742584393427126, 9.767009149899092, 9.79125119881076, 9.815309686388483, 9.839183758858617, 9.862871708673868, 9.886373535834235, 9.909687532792427, 9.932812845774798, 9.955746913460409, 9.978490589622904, 10.001042166714994, 10.023399937189385, 10.045563901046076, 10.06753149696413, 10.08930357871719, 10.110876731210677, 10.132251808218232, 10.153427102192564, 10.174401759360027, 10.195174072173328, 10.215744040632467, 10.236109103416506, 10.256270114299092, 10.276224511959285, 10.295972296397084, 10.315511760065197, 10.33484204918998, 10.353962309997785, 10.372871688714964, 10.391569331567874, 10.410053531009222, 10.428324287039006, 10.446379892109935, 10.464219492448361, 10.481842234280641, 10.499247263833125, 10.516434581105816, 10.533400771004128, 10.550147541075352, 10.566672329998553, 10.582975137773726, 10.59905511062723, 10.614910541011767, 10.630541428927343, 10.645946920600306, 10.661125308483367, 10.676076592576525, 10.690799065332486, 10.705292726751255, 10.71955672305918, 10.733590200482617, 10.74739230524792, 10.760962183581443, 10.774298981709538, 10.787401845858563, 10.800269922254866, 10.812904064672097, 10.825301711789317, 10.837462009832878, 10.849385812576427, 10.86107226624632, 10.872518809521615, 10.883727149949605, 10.894694726209353, 10.905422392074506, 10.915908439997768, 10.92615286997914, 10.936154828244977, 10.945913461021632, 10.955428768309107, 10.964700750107399, 10.973726845095571, 10.982508760820915, 10.991044789736138, 10.999334078067596, 11.007376625815285, 11.01517243297921, 11.02272064578572, 11.03002041046117, 11.037071727005562, 11.043874595418895, 11.050427308153877, 11.056730718984152, 11.062783974136075, 11.068587073609647, 11.074138309857576, 11.07943939042715, 11.084487753997436, 11.089285108115725, 11.093829745234721, 11.098122519128076, 11.102162576022137, 11.105949062143264, 11.1094828312651, 11.112763029613998, 11.115789657189959, 11.118561860219337, 11.12108049247578, 11.123344700185639, 11.125355337122562, 11.127110695739255, 11.128611629809365, 11.129857285559247, 11.130849370536192, 11.13158532341926, 11.132066851755745, 11.132293955545649, 11.132264927241676, 11.13198147439112, 11.131442743220337, 11.130648733729322, 11.129600299691726, 11.1282965873339, 11.126737596655843, 11.124924181431204, 11.122856341659984, 11.120533223568533, 11.1179556809305, 11.115123713745882, 11.112037322014682, 11.108696505736901, 11.105102118686181, 11.101254160862526, 11.097152632265933, 11.092797532896403, 11.088189716527584, 11.083328329385827, 11.078215079018426, 11.072849111651735, 11.0672312810594, 11.06136158724142, 11.055240030197796, 11.04886831747582, 11.042245595301846, 11.035371863675875, 11.028248830145198, 11.02087564093617, 11.013254003596082, 11.005383064351287, 10.997264530749082, 10.988897549015816, 10.980282972925137, 10.971421656250692, 10.96231359899248, 10.952959654924147, 10.94336067781934, 10.933515813904414, 10.923427624500304, 10.913095255833369, 10.90251956167725, 10.89170054203195, 10.880640758218407, 10.869338502689327, 10.857795482992007, 10.846012552900088, 10.833989712413572, 10.821727815306108, 10.809227715351337, 10.79649026632291, 10.783515468220825, 10.770304174818728, 10.756858093663912, 10.743177224756376, 10.72926156809612, 10.71511283123044, 10.700731867932978, 10.686118678203735, 10.671274969590005, 10.656200742091787, 10.640897703256373, 10.625364999310118, 10.60960519157396, 10.593618280047899, 10.577405118505581, 10.560966560720653, 10.544303460466761, 10.527417525291197, 10.510308755193961, 10.492977150175054, 10.47542612532906, 10.457653973108687, 10.439663254834873, 10.421454824281266, 10.403028681447864, 10.384385680108313, 10.365528381583555, 10.346455932099941, 10.32717089297841, 10.307672410445315, 10.287963045821597, 10.268043652880902, 10.247914231623227, 10.227576489595869, 10.20703128057247, 10.186280312100324, 10.165322730405787, 10.144161950583442, 10.122797118859642, 10.10122994278168, 10.079461276123203, 10.057492826431503, 10.035325447480227, 10.01295999304302, 9.99039731689353, 9.967639126579046, 9.944685422099573, 9.9215379110024, 9.898198300834819, 9.874667445370479, 9.850945344609379, 9.827034559872457, 9.802935091159712, 9.778648646018441, 9.754176078222285, 9.729518241544893, 9.704677697307202, 9.679653591735567, 9.654448486150928, 9.62906323432693, 9.603498690037219, 9.57775570705544, 9.551835992928888, 9.525740401431209, 9.499470640109692, 9.473027562737988, 9.446412023089742, 9.419624874938597, 9.39266782583185, 9.36554258331679, 9.33824914739342, 9.31078922560903, 9.283164525510912, 9.255375900872716, 9.227423351694439, 9.199310293070667, 9.171035871227753, 9.14260179371299, 9.11400976807367, 9.08526064808344, 9.056356141289593, 9.027296247692126, 8.998083528611982, 8.968717984049158, 8.939201321550948, 8.909534394890997, 8.879719765390245, 8.849756579275047, 8.819647397866337, 8.78939222116412, 8.758993610489332, 8.72845241961562, 8.69776950231663, 8.666945712366008, 8.635982757311048, 8.604881490925395, 8.573642766982696, 8.54226914680389, 8.510759776615327, 8.479118071511596, 8.447343177719052, 8.415437656558629, 8.383402361803977, 8.35123814722874, 8.318945866606567, 8.286528081258394, 8.253983937410576, 8.22131599638405, 8.188525111952465, 8.155612991663112, 8.122579635515992, 8.089426751058397, 8.056156045837618, 8.022767519853657, 7.989262880653806, 7.955643835785357, 7.92191038524831, 7.888064236589958, 7.854107097357594, 7.820038967551216, 7.785862408491765, 7.75157742017924, 7.717184856387287, 7.682687278436845, 7.648083832554268, 7.6133779338341405, 7.578568728502817, 7.543657924107589, 7.50864722819575, 7.473537494540945, 7.438329576916822, 7.403024329097026, 7.3676234586288505, 7.332126965512295, 7.296537411068297, 7.260855649070503, 7.225081679518916, 7.189217209960825, 7.153263094169878, 7.117220612806544, 7.0810910465312915, 7.044875249117768, 7.00857407433962, 6.9721892297441395, 6.935720715331326, 6.899170665535295, 6.86253950724287, 6.825828094227698, 6.78903813403707, 6.752170053557811, 6.715225560337212, 6.678204654375273, 6.6411094701061115, 6.603940007529725, 6.56669840108023, 6.529384650757628, 6.492000464109209, 6.454546268021798, 6.417023343155863, 6.379432970171875, 6.3417760028434795, 6.304052868057498, 6.266265273361227, 6.228413645641485, 6.1904996924455675, 6.1525238406602965, 6.114486944059319, 6.076390283303103, 6.038235139052119, 6.000021511306367, 5.961751534499963, 5.923425208632906, 5.885043814365665, 5.846608632358711, 5.8081205163856895, 5.769579893333423, 5.730988043862381, 5.692346248633034, 5.653654934532205, 5.614914955333538, 5.5761280185843285, 5.537294124284575, 5.49841497998157, 5.459491012562136, 5.420523502686744, 5.3815128772422165, 5.342460416889022, 5.303367402287631, 5.264233833438043, 5.2250614178875505, 5.185850582522977, 5.146602608004791, 5.107317921219816, 5.067997802828523, 5.028643533491378, 4.989255113208384, 4.949833822640009, 4.910380942446723, 4.8708968995153485, 4.831382974506356, 4.791839594306567, 4.752268039576451, 4.7126691640896565, 4.673043394733004, 4.633392439053788, 4.59371672393883, 4.554016676274954, 4.5142944304962755, 4.474549559715971, 4.434783771481334, 4.39502524032269, 4.3552206053871485, 4.315397614318212, 4.275556694002704, 4.235699551987918, 4.1958266151606765, 4.155938737294624, 4.116037199050234, 4.076122000427502, 4.036195275860546, 3.996257025349366, 3.956308529554431, 3.916350215362564, 3.876383790321057, 3.8364096813167343, 3.7964287421232417, 3.756441826514225, 3.7164506420369774, 3.6764551886914982, 3.636456320251434, 3.596456171150901, 3.556454314503075, 3.516452457855249, 3.476451241537658, 3.436451732767359, 3.396454785317999, 3.3564616798500473, 3.3164728432503265, 3.276489556179307, 3.236512885854045, 3.1965436860481886, 3.1565828105353826, 3.116631539976097, 3.0766905147005668, 3.0367610153692604, 2.9968441091992366, 2.9569404365207297, 2.917051277994209, 2.8771779142801437, 2.8373207722653575, 2.7974815594971423, 2.757660702862322, 2.7178596964647768, 2.6780796075215645, 2.6383212898063317, 2.598586023979548, 2.558874877258271, 2.519188916859558, 2.4795292100004676, 2.4398970373414683, 2.4002936795430303, 2.360719776935388, 2.321177037065834, 2.281666313708014, 2.2421888875223983, 2.2027460391694555, 2.1633388358662438, 2.123968771716644, 2.084636913937714, 2.045344329746512, 2.0060927266903295, 1.9668829585428134, 1.9277165194078447, 1.8885949033893041, 1.8495191777042497, 1.8104906230131506, 1.7715108401415935, 1.732581109750048, 1.6937027124989834, 1.6548772492139865, 1.6161058938338206, 1.5773903539057785, 1.5387318033686237, 1.5001319497696486, 1.4615921804910286, 1.4231138829149386, 1.3846986578669656, 1.3463479994509902, 1.3080635084925993, 1.269846679095674, 1.2316990053640948, 1.1936223015668606, 1.155617955086146, 1.1176876734692438, 1.0798330575417405, 1.0420557081292232, 1.0043572260572782, 0.9667394255949041, 0.9292039075676874, 0.891752326162068, 0.854386388925338, 0.8171078567656431, 0.77991833050857, 0.7428195710622639, 0.7058133393348703, 0.6689013428736819, 0.6320853425868438, 0.5953670993825014, 0.5587482674470946, 0.5222306076887685, 0.4858158810156687, 0.4495057416142346, 0.41330203043389113, 0.3772063483002249, 0.34122053616266074, 0.3053462215272117, 0.2695851119411703, 0.2339388615909762, 0.1984091513434955, 0.16299755534388835, 0.12770571443838125, 0.09253521611234763, 0.057487614500627976, 0.022564462070536057], [datetime.datetime(2018, 4, 3, 3, 7, 13, 128778), datetime.datetime(2018, 4, 3, 3, 7, 14, 128778), datetime.datetime(2018, 4, 3, 3, 7, 15, 128777), datetime.datetime(2018, 4, 3, 3, 7, 16, 128776), datetime.datetime(2018, 4, 3, 3, 7, 17, 128776), datetime.datetime(2018, 4, 3, 3, 7, 18, 128776), datetime.datetime(2018, 4, 3, 3, 7, 19, 128776), datetime.datetime(2018, 4, 3, 3, 7, 20, 128776), datetime.datetime(2018, 4, 3, 3, 7, 21, 128776), datetime.datetime(2018, 4, 3, 3, 7, 22, 128776), datetime.datetime(2018, 4, 3, 3, 7, 23, 128776), datetime.datetime(2018, 4, 3, 3, 7, 24, 128776), datetime.datetime(2018, 4, 3, 3, 7, 25, 128776), datetime.datetime(2018, 4, 3, 3, 7, 26, 128776), datetime.datetime(2018, 4, 3, 3, 7, 27, 128776), datetime.datetime(2018, 4, 3, 3, 7, 28, 128776), datetime.datetime(2018, 4, 3, 3, 7, 29, 128776), datetime.datetime(2018, 4, 3, 3, 7, 30, 128776), datetime.datetime(2018, 4, 3, 3, 7, 31, 128776), datetime.datetime(2018, 4, 3, 3, 7, 32, 128776), datetime.datetime(2018, 4, 3, 3, 7, 33, 128776), datetime.datetime(2018, 4, 3, 3, 7, 34, 128776), datetime.datetime(2018, 4, 3, 3, 7, 35, 128776), datetime.datetime(2018, 4, 3, 3, 7, 36, 128776), datetime.datetime(2018, 4, 3, 3, 7, 37, 128776), datetime.datetime(2018, 4, 3, 3, 7, 38, 128776), datetime.datetime(2018, 4, 3, 3, 7, 39, 128776), datetime.datetime(2018, 4, 3, 3, 7, 40, 128776), datetime.datetime(2018, 4, 3, 3, 7, 41, 128776), datetime.datetime(2018, 4, 3, 3, 7, 42, 128776), datetime.datetime(2018, 4, 3, 3, 7, 43, 128776), datetime.datetime(2018, 4, 3, 3, 7, 44, 128776), datetime.datetime(2018, 4, 3, 3, 7, 45, 128776), datetime.datetime(2018, 4, 3, 3, 7, 46, 128776), datetime.datetime(2018, 4, 3, 3, 7, 47, 128776), datetime.datetime(2018, 4, 3, 3, 7, 48, 128776), datetime.datetime(2018, 4, 3, 3, 7, 49, 128776), datetime.datetime(2018, 4, 3, 3, 7, 50, 128776), datetime.datetime(2018, 4, 3, 3, 7, 51, 128776), datetime.datetime(2018, 4, 3, 3, 7, 52, 128776), datetime.datetime(2018, 4, 3, 3, 7, 53, 128776), datetime.datetime(2018, 4, 3, 3, 7, 54, 128776), datetime.datetime(2018, 4, 3, 3, 7, 55, 128776), datetime.datetime(2018, 4, 3, 3, 7, 56, 128776), datetime.datetime(2018, 4, 3, 3, 7, 57, 128776), datetime.datetime(2018, 4, 3, 3, 7, 58, 128776), datetime.datetime(2018, 4, 3, 3, 7, 59, 128776), datetime.datetime(2018, 4, 3, 3, 8, 0, 128776), datetime.datetime(2018, 4, 3, 3, 8, 1, 128776), datetime.datetime(2018, 4, 3, 3, 8, 2, 128776), datetime.datetime(2018, 4, 3, 3, 8, 3, 128776), datetime.datetime(2018, 4, 3, 3, 8, 4, 128776), datetime.datetime(2018, 4, 3, 3, 8, 5, 128776), datetime.datetime(2018, 4, 3, 3, 8, 6, 128776), datetime.datetime(2018, 4, 3, 3, 8, 7, 128776), datetime.datetime(2018, 4, 3, 3, 8, 8, 128776), datetime.datetime(2018, 4, 3, 3, 8, 9, 128776), datetime.datetime(2018, 4, 3, 3, 8, 10, 128776), datetime.datetime(2018, 4, 3, 3, 8, 11, 128776), datetime.datetime(2018, 4, 3, 3, 8, 12, 128776), datetime.datetime(2018, 4, 3, 3, 8, 13, 128776), datetime.datetime(2018, 4, 3, 3, 8, 14, 128776), datetime.datetime(2018, 4, 3, 3, 8, 15, 128776), datetime.datetime(2018, 4, 3, 3, 8, 16, 128776), datetime.datetime(2018, 4, 3, 3, 8, 17, 128776), datetime.datetime(2018, 4, 3, 3, 8, 18, 128776), datetime.datetime(2018, 4, 3, 3, 8, 19, 128776), datetime.datetime(2018, 4, 3, 3, 8, 20, 128776), datetime.datetime(2018, 4, 3, 3, 8, 21, 128776), datetime.datetime(2018, 4, 3, 3, 8, 22, 128776), datetime.datetime(2018, 4, 3, 3, 8, 23, 128776), datetime.datetime(2018, 4, 3, 3, 8, 24, 128776), datetime.datetime(2018, 4, 3, 3, 8, 25, 128776), datetime.datetime(2018, 4, 3, 3, 8, 26, 128776), datetime.datetime(2018, 4, 3, 3, 8, 27, 128776), datetime.datetime(2018, 4, 3, 3, 8, 28, 128776), datetime.datetime(2018, 4, 3, 3, 8, 29, 128776), datetime.datetime(2018, 4, 3, 3, 8, 30, 128776), datetime.datetime(2018, 4, 3, 3, 8, 31, 128776), datetime.datetime(2018, 4, 3, 3, 8, 32, 128776), datetime.datetime(2018, 4, 3, 3, 8, 33, 128776), datetime.datetime(2018, 4, 3, 3, 8, 34, 128776), datetime.datetime(2018, 4, 3, 3, 8, 35, 128776), datetime.datetime(2018, 4, 3, 3, 8, 36, 128776), datetime.datetime(2018, 4, 3, 3, 8, 37, 128776), datetime.datetime(2018, 4, 3, 3, 8, 38, 128776), datetime.datetime(2018, 4, 3, 3, 8, 39, 128776), datetime.datetime(2018, 4, 3, 3, 8, 40, 128776), datetime.datetime(2018, 4, 3, 3, 8, 41, 128776), datetime.datetime(2018, 4, 3, 3, 8, 42, 128776), datetime.datetime(2018, 4, 3, 3, 8, 43, 128776), datetime.datetime(2018, 4, 3, 3, 8, 44, 128776), datetime.datetime(2018, 4, 3, 3, 8, 45, 128776), datetime.datetime(2018, 4, 3, 3, 8, 46, 128776), datetime.datetime(2018, 4, 3, 3, 8, 47, 128776), datetime.datetime(2018, 4, 3, 3, 8, 48, 128776), datetime.datetime(2018, 4, 3, 3, 8, 49, 128776), datetime.datetime(2018, 4, 3, 3, 8, 50, 128776), datetime.datetime(2018, 4, 3, 3, 8, 51, 128776), datetime.datetime(2018, 4, 3, 3, 8, 52, 128776), datetime.datetime(2018, 4, 3, 3, 8, 53, 128776), datetime.datetime(2018, 4, 3, 3, 8, 54, 128776), datetime.datetime(2018, 4, 3, 3, 8, 55, 128776), datetime.datetime(2018, 4, 3, 3, 8, 56, 128776), datetime.datetime(2018, 4, 3, 3, 8, 57, 128776), datetime.datetime(2018, 4, 3, 3, 8, 58, 128776), datetime.datetime(2018, 4, 3, 3, 8, 59, 128776), datetime.datetime(2018, 4, 3, 3, 9, 0, 128776), datetime.datetime(2018, 4, 3, 3, 9, 1, 128776), datetime.datetime(2018, 4, 3, 3, 9, 2, 128775), datetime.datetime(2018, 4, 3, 3, 9, 3, 128774), datetime.datetime(2018, 4, 3, 3, 9, 4, 128773), datetime.datetime(2018, 4, 3, 3, 9, 5, 128772), datetime.datetime(2018, 4, 3, 3, 9, 6, 128771), datetime.datetime(2018, 4, 3, 3, 9, 7, 128770), datetime.datetime(2018, 4, 3, 3, 9, 8, 128769), datetime.datetime(2018, 4, 3, 3, 9, 9, 128769), datetime.datetime(2018, 4, 3, 3, 9, 10, 128768), datetime.datetime(2018, 4, 3, 3, 9, 11, 128767), datetime.datetime(2018, 4, 3, 3, 9, 12, 128766), datetime.datetime(2018, 4, 3, 3, 9, 13, 128765), datetime.datetime(2018, 4, 3, 3, 9, 14, 128764), datetime.datetime(2018, 4, 3, 3, 9, 15, 128763), datetime.datetime(2018, 4, 3, 3, 9, 16, 128762), datetime.datetime(2018, 4, 3, 3, 9, 17, 128761), datetime.datetime(2018, 4, 3, 3, 9, 18, 128760), datetime.datetime(2018, 4, 3, 3, 9, 19, 128759), datetime.datetime(2018, 4, 3, 3, 9, 20, 128759), datetime.datetime(2018, 4, 3, 3, 9, 21, 128758), datetime.datetime(2018, 4, 3, 3, 9, 22, 128757), datetime.datetime(2018, 4, 3, 3, 9, 23, 128756), datetime.datetime(2018, 4, 3, 3, 9, 24, 128755), datetime.datetime(2018, 4, 3, 3, 9, 25, 128754), datetime.datetime(2018, 4, 3, 3, 9, 26, 128753), datetime.datetime(2018, 4, 3, 3, 9, 27, 128752), datetime.datetime(2018, 4, 3, 3, 9, 28, 128751), datetime.datetime(2018, 4, 3, 3, 9, 29, 128750), datetime.datetime(2018, 4, 3, 3, 9, 30, 128749), datetime.datetime(2018, 4, 3, 3, 9, 31, 128748), datetime.datetime(2018, 4, 3, 3, 9, 32, 128747), datetime.datetime(2018, 4, 3, 3, 9, 33, 128747), datetime.datetime(2018, 4, 3, 3, 9, 34, 128746), datetime.datetime(2018, 4, 3, 3, 9, 35, 128745), datetime.datetime(2018, 4, 3, 3, 9, 36, 128744), datetime.datetime(2018, 4, 3, 3, 9, 37, 128743), datetime.datetime(2018, 4, 3, 3, 9, 38, 128742), datetime.datetime(2018, 4, 3, 3, 9, 39, 128741), datetime.datetime(2018, 4, 3, 3, 9, 40, 128740), datetime.datetime(2018, 4, 3, 3, 9, 41, 128739), datetime.datetime(2018, 4, 3, 3, 9, 42, 128738), datetime.datetime(2018, 4, 3, 3, 9, 43, 128737), datetime.datetime(2018, 4, 3, 3, 9, 44, 128737), datetime.datetime(2018, 4, 3, 3, 9, 45, 128736), datetime.datetime(2018, 4, 3, 3, 9, 46, 128735), datetime.datetime(2018, 4, 3, 3, 9, 47, 128734), datetime.datetime(2018, 4, 3, 3, 9, 48, 128733), datetime.datetime(2018, 4, 3, 3, 9, 49, 128732), datetime.datetime(2018, 4, 3, 3, 9, 50, 128731), datetime.datetime(2018, 4, 3, 3, 9, 51, 128730), datetime.datetime(2018, 4, 3, 3, 9, 52, 128729), datetime.datetime(2018, 4, 3, 3, 9, 53, 128728), datetime.datetime(2018, 4, 3, 3, 9, 54, 128727), datetime.datetime(2018, 4, 3, 3, 9, 55, 128727), datetime.datetime(2018, 4, 3, 3, 9, 56, 128726), datetime.datetime(2018, 4, 3, 3, 9, 57, 128725), datetime.datetime(2018, 4, 3, 3, 9, 58, 128724), datetime.datetime(2018, 4, 3, 3, 9, 59, 128723), datetime.datetime(2018, 4, 3, 3, 10, 0, 128722), datetime.datetime(2018, 4, 3, 3, 10, 1, 128722), datetime.datetime(2018, 4, 3, 3, 10, 2, 128722), datetime.datetime(2018, 4, 3, 3, 10, 3, 128722), datetime.datetime(2018, 4, 3, 3, 10, 4, 128722), datetime.datetime(2018, 4, 3, 3, 10, 5, 128722), datetime.datetime(2018, 4, 3, 3, 10, 6, 128722), datetime.datetime(2018, 4, 3, 3, 10, 7, 128721), datetime.datetime(2018, 4, 3, 3, 10, 8, 128720), datetime.datetime(2018, 4, 3, 3, 10, 9, 128720), datetime.datetime(2018, 4, 3, 3, 10, 10, 128720), datetime.datetime(2018, 4, 3, 3, 10, 11, 128720), datetime.datetime(2018, 4, 3, 3, 10, 12, 128720), datetime.datetime(2018, 4, 3, 3, 10, 13, 128720), datetime.datetime(2018, 4, 3, 3, 10, 14, 128720), datetime.datetime(2018, 4, 3, 3, 10, 15, 128720), datetime.datetime(2018, 4, 3, 3, 10, 16, 128720), datetime.datetime(2018, 4, 3, 3, 10, 17, 128720), datetime.datetime(2018, 4, 3, 3, 10, 18, 128720), datetime.datetime(2018, 4, 3, 3, 10, 19, 128720), datetime.datetime(2018, 4, 3, 3, 10, 20, 128720), datetime.datetime(2018, 4, 3, 3, 10, 21, 128720), datetime.datetime(2018, 4, 3, 3, 10, 22, 128720), datetime.datetime(2018, 4, 3, 3, 10, 23, 128720), datetime.datetime(2018, 4, 3, 3, 10, 24, 128720), datetime.datetime(2018, 4, 3, 3, 10, 25, 128720), datetime.datetime(2018, 4, 3, 3, 10, 26, 128720), datetime.datetime(2018, 4, 3, 3, 10, 27, 128720), datetime.datetime(2018, 4, 3, 3, 10, 28, 128720), datetime.datetime(2018, 4, 3, 3, 10, 29, 128720), datetime.datetime(2018, 4, 3, 3, 10, 30, 128720), datetime.datetime(2018, 4, 3, 3, 10, 31, 128720), datetime.datetime(2018, 4, 3, 3, 10, 32, 128720), datetime.datetime(2018, 4, 3, 3, 10, 33, 128720), datetime.datetime(2018, 4, 3, 3, 10, 34, 128720), datetime.datetime(2018, 4, 3, 3, 10, 35, 128720), datetime.datetime(2018, 4, 3, 3, 10, 36, 128720), datetime.datetime(2018, 4, 3, 3, 10, 37, 128720), datetime.datetime(2018, 4, 3, 3, 10, 38, 128720), datetime.datetime(2018, 4, 3, 3, 10, 39, 128720), datetime.datetime(2018, 4, 3, 3, 10, 40, 128720), datetime.datetime(2018, 4, 3, 3, 10, 41, 128720), datetime.datetime(2018, 4, 3, 3, 10, 42, 128720), datetime.datetime(2018, 4, 3, 3, 10, 43, 128720), datetime.datetime(2018, 4, 3, 3, 10, 44, 128720), datetime.datetime(2018, 4, 3, 3, 10, 45, 128720), datetime.datetime(2018, 4, 3, 3, 10, 46, 128720), datetime.datetime(2018, 4, 3, 3, 10, 47, 128720), datetime.datetime(2018, 4, 3, 3, 10, 48, 128720), datetime.datetime(2018, 4, 3, 3, 10, 49, 128720), datetime.datetime(2018, 4, 3, 3, 10, 50, 128720), datetime.datetime(2018, 4, 3, 3, 10, 51, 128720), datetime.datetime(2018, 4, 3, 3, 10, 52, 128720), datetime.datetime(2018, 4, 3, 3, 10, 53, 128720), datetime.datetime(2018, 4, 3, 3, 10, 54, 128720), datetime.datetime(2018, 4, 3, 3, 10, 55, 128720), datetime.datetime(2018, 4, 3, 3, 10, 56, 128720), datetime.datetime(2018, 4, 3, 3, 10, 57, 128720), datetime.datetime(2018, 4, 3, 3, 10, 58, 128720), datetime.datetime(2018, 4, 3, 3, 10, 59, 128720), datetime.datetime(2018, 4, 3, 3, 11, 0, 128720), datetime.datetime(2018, 4, 3, 3, 11, 1, 128720), datetime.datetime(2018, 4, 3, 3, 11, 2, 128720), datetime.datetime(2018, 4, 3, 3, 11, 3, 128720), datetime.datetime(2018, 4, 3, 3, 11, 4, 128720), datetime.datetime(2018, 4, 3, 3, 11, 5, 128720), datetime.datetime(2018, 4, 3, 3, 11, 6, 128720), datetime.datetime(2018, 4, 3, 3, 11, 7, 128720), datetime.datetime(2018, 4, 3, 3, 11, 8, 128720), datetime.datetime(2018, 4, 3, 3, 11, 9, 128720), datetime.datetime(2018, 4, 3, 3, 11, 10, 128720), datetime.datetime(2018, 4, 3, 3, 11, 11, 128720), datetime.datetime(2018, 4, 3, 3, 11, 12, 128720), datetime.datetime(2018, 4, 3, 3, 11, 13, 128720), datetime.datetime(2018, 4, 3, 3, 11, 14, 128720), datetime.datetime(2018, 4, 3, 3, 11, 15, 128720), datetime.datetime(2018, 4, 3, 3, 11, 16, 128720), datetime.datetime(2018, 4, 3, 3, 11, 17, 128720), datetime.datetime(2018, 4, 3, 3, 11, 18, 128720), datetime.datetime(2018, 4, 3, 3, 11, 19, 128720), datetime.datetime(2018, 4, 3, 3, 11, 20, 128720), datetime.datetime(2018, 4, 3, 3, 11, 21, 128720), datetime.datetime(2018, 4, 3, 3, 11, 22, 128720), datetime.datetime(2018, 4, 3, 3, 11, 23, 128720), datetime.datetime(2018, 4, 3, 3, 11, 24, 128720), datetime.datetime(2018, 4, 3, 3, 11, 25, 128720), datetime.datetime(2018, 4, 3, 3, 11, 26, 128720), datetime.datetime(2018, 4, 3, 3, 11, 27, 128720), datetime.datetime(2018, 4, 3, 3, 11, 28, 128720), datetime.datetime(2018, 4, 3, 3, 11, 29, 128720), datetime.datetime(2018, 4, 3, 3, 11, 30, 128720), datetime.datetime(2018, 4, 3, 3, 11, 31, 128720), datetime.datetime(2018, 4, 3, 3, 11, 32, 128720), datetime.datetime(2018, 4, 3, 3, 11, 33, 128720), datetime.datetime(2018, 4, 3, 3, 11, 34, 128720), datetime.datetime(2018, 4, 3, 3, 11, 35, 128720), datetime.datetime(2018, 4, 3, 3, 11, 36, 128720), datetime.datetime(2018, 4, 3, 3, 11, 37, 128720), datetime.datetime(2018, 4, 3, 3, 11, 38, 128720), datetime.datetime(2018, 4, 3, 3, 11, 39, 128720), datetime.datetime(2018, 4, 3, 3, 11, 40, 128720), datetime.datetime(2018, 4, 3, 3, 11, 41, 128720), datetime.datetime(2018, 4, 3, 3, 11, 42, 128720), datetime.datetime(2018, 4, 3, 3, 11, 43, 128720), datetime.datetime(2018, 4, 3, 3, 11, 44, 128720), datetime.datetime(2018, 4, 3, 3, 11, 45, 128720), datetime.datetime(2018, 4, 3, 3, 11, 46, 128720), datetime.datetime(2018, 4, 3, 3, 11, 47, 128720), datetime.datetime(2018, 4, 3, 3, 11, 48, 128720), datetime.datetime(2018, 4, 3, 3, 11, 49, 128720), datetime.datetime(2018, 4, 3, 3, 11, 50, 128720), datetime.datetime(2018, 4, 3, 3, 11, 51, 128720), datetime.datetime(2018, 4, 3, 3, 11, 52, 128720), datetime.datetime(2018, 4, 3, 3, 11, 53, 128720), datetime.datetime(2018, 4, 3, 3, 11, 54, 128720), datetime.datetime(2018, 4, 3, 3, 11, 55, 128720), datetime.datetime(2018, 4, 3, 3, 11, 56, 128720), datetime.datetime(2018, 4, 3, 3, 11, 57, 128720), datetime.datetime(2018, 4, 3, 3, 11, 58, 128720), datetime.datetime(2018, 4, 3, 3, 11, 59, 128720), datetime.datetime(2018, 4, 3, 3, 12, 0, 128720), datetime.datetime(2018, 4, 3, 3, 12, 1, 128720), datetime.datetime(2018, 4, 3, 3, 12, 2, 128719), datetime.datetime(2018, 4, 3, 3, 12, 3, 128718), datetime.datetime(2018, 4, 3, 3, 12, 4, 128717), datetime.datetime(2018, 4, 3, 3, 12, 5, 128716), datetime.datetime(2018, 4, 3, 3, 12, 6, 128715), datetime.datetime(2018, 4, 3, 3, 12, 7, 128714), datetime.datetime(2018, 4, 3, 3, 12, 8, 128713), datetime.datetime(2018, 4, 3, 3, 12, 9, 128712), datetime.datetime(2018, 4, 3, 3, 12, 10, 128711), datetime.datetime(2018, 4, 3, 3, 12, 11, 128710), datetime.datetime(2018, 4, 3, 3, 12, 12, 128710), datetime.datetime(2018, 4, 3, 3, 12, 13, 128709), datetime.datetime(2018, 4, 3, 3, 12, 14, 128708), datetime.datetime(2018, 4, 3, 3, 12, 15, 128707), datetime.datetime(2018, 4, 3, 3, 12, 16, 128706), datetime.datetime(2018, 4, 3, 3, 12, 17, 128705), datetime.datetime(2018, 4, 3, 3, 12, 18, 128704), datetime.datetime(2018, 4, 3, 3, 12, 19, 128703), datetime.datetime(2018, 4, 3, 3, 12, 20, 128703), datetime.datetime(2018, 4, 3, 3, 12, 21, 128702), datetime.datetime(2018, 4, 3, 3, 12, 22, 128701), datetime.datetime(2018, 4, 3, 3, 12, 23, 128700), datetime.datetime(2018, 4, 3, 3, 12, 24, 128699), datetime.datetime(2018, 4, 3, 3, 12, 25, 128698), datetime.datetime(2018, 4, 3, 3, 12, 26, 128697), datetime.datetime(2018, 4, 3, 3, 12, 27, 128696), datetime.datetime(2018, 4, 3, 3, 12, 28, 128695), datetime.datetime(2018, 4, 3, 3, 12, 29, 128694), datetime.datetime(2018, 4, 3, 3, 12, 30, 128693), datetime.datetime(2018, 4, 3, 3, 12, 31, 128692), datetime.datetime(2018, 4, 3, 3, 12, 32, 128691), datetime.datetime(2018, 4, 3, 3, 12, 33, 128690), datetime.datetime(2018, 4, 3, 3, 12, 34, 128689), datetime.datetime(2018, 4, 3, 3, 12, 35, 128688), datetime.datetime(2018, 4, 3, 3, 12, 36, 128688), datetime.datetime(2018, 4, 3, 3, 12, 37, 128687), datetime.datetime(2018, 4, 3, 3, 12, 38, 128686), datetime.datetime(2018, 4, 3, 3, 12, 39, 128685), datetime.datetime(2018, 4, 3, 3, 12, 40, 128684), datetime.datetime(2018, 4, 3, 3, 12, 41, 128683), datetime.datetime(2018, 4, 3, 3, 12, 42, 128682), datetime.datetime(2018, 4, 3, 3, 12, 43, 128681), datetime.datetime(2018, 4, 3, 3, 12, 44, 128681), datetime.datetime(2018, 4, 3, 3, 12, 45, 128680), datetime.datetime(2018, 4, 3, 3, 12, 46, 128679), datetime.datetime(2018, 4, 3, 3, 12, 47, 128678), datetime.datetime(2018, 4, 3, 3, 12, 48, 128677), datetime.datetime(2018, 4, 3, 3, 12, 49, 128676), datetime.datetime(2018, 4, 3, 3, 12, 50, 128675), datetime.datetime(2018, 4, 3, 3, 12, 51, 128674), datetime.datetime(2018, 4, 3, 3, 12, 52, 128673), datetime.datetime(2018, 4, 3, 3, 12, 53, 128672), datetime.datetime(2018, 4, 3, 3, 12, 54, 128671), datetime.datetime(2018, 4, 3, 3, 12, 55, 128671), datetime.datetime(2018, 4, 3, 3, 12, 56, 128670), datetime.datetime(2018, 4, 3, 3, 12, 57, 128669), datetime.datetime(2018, 4, 3, 3, 12, 58, 128668), datetime.datetime(2018, 4, 3, 3, 12, 59, 128667), datetime.datetime(2018, 4, 3, 3, 13, 0, 128666), datetime.datetime(2018, 4, 3, 3, 13, 1, 128666), datetime.datetime(2018, 4, 3, 3, 13, 2, 128666), datetime.datetime(2018, 4, 3, 3, 13, 3, 128666), datetime.datetime(2018, 4, 3, 3, 13, 4, 128666), datetime.datetime(2018, 4, 3, 3, 13, 5, 128666), datetime.datetime(2018, 4, 3, 3, 13, 6, 128666), datetime.datetime(2018, 4, 3, 3, 13, 7, 128665), datetime.datetime(2018, 4, 3, 3, 13, 8, 128664), datetime.datetime(2018, 4, 3, 3, 13, 9, 128664), datetime.datetime(2018, 4, 3, 3, 13, 10, 128664), datetime.datetime(2018, 4, 3, 3, 13, 11, 128664), datetime.datetime(2018, 4, 3, 3, 13, 12, 128664), datetime.datetime(2018, 4, 3, 3, 13, 13, 128664), datetime.datetime(2018, 4, 3, 3, 13, 14, 128664), datetime.datetime(2018, 4, 3, 3, 13, 15, 128664), datetime.datetime(2018, 4, 3, 3, 13, 16, 128664), datetime.datetime(2018, 4, 3, 3, 13, 17, 128664), datetime.datetime(2018, 4, 3, 3, 13, 18, 128664), datetime.datetime(2018, 4, 3, 3, 13, 19, 128664), datetime.datetime(2018, 4, 3, 3, 13, 20, 128664), datetime.datetime(2018, 4, 3, 3, 13, 21, 128664), datetime.datetime(2018, 4, 3, 3, 13, 22, 128664), datetime.datetime(2018, 4, 3, 3, 13, 23, 128664), datetime.datetime(2018, 4, 3, 3, 13, 24, 128664), datetime.datetime(2018, 4, 3, 3, 13, 25, 128664), datetime.datetime(2018, 4, 3, 3, 13, 26, 128664), datetime.datetime(2018, 4, 3, 3, 13, 27, 128664), datetime.datetime(2018, 4, 3, 3, 13, 28, 128664), datetime.datetime(2018, 4, 3, 3, 13, 29, 128664), datetime.datetime(2018, 4, 3, 3, 13, 30, 128664), datetime.datetime(2018, 4, 3, 3, 13, 31, 128664), datetime.datetime(2018, 4, 3, 3, 13, 32, 128664), datetime.datetime(2018, 4, 3, 3, 13, 33, 128664), datetime.datetime(2018, 4, 3, 3, 13, 34, 128664), datetime.datetime(2018, 4, 3, 3, 13, 35, 128664), datetime.datetime(2018, 4, 3, 3, 13, 36, 128664), datetime.datetime(2018, 4, 3, 3, 13, 37, 128664), datetime.datetime(2018, 4, 3, 3, 13, 38, 128664), datetime.datetime(2018, 4, 3, 3, 13, 39, 128664), datetime.datetime(2018, 4, 3, 3, 13, 40, 128664), datetime.datetime(2018, 4, 3, 3, 13, 41, 128664), datetime.datetime(2018, 4, 3, 3, 13, 42, 128664), datetime.datetime(2018, 4, 3, 3, 13, 43, 128664), datetime.datetime(2018, 4, 3, 3, 13, 44, 128664), datetime.datetime(2018, 4, 3, 3, 13, 45, 128664), datetime.datetime(2018, 4, 3, 3, 13, 46, 128664), datetime.datetime(2018, 4, 3, 3, 13, 47, 128664), datetime.datetime(2018, 4, 3, 3, 13, 48, 128664), datetime.datetime(2018, 4, 3, 3, 13, 49, 128664), datetime.datetime(2018, 4, 3, 3, 13, 50, 128664), datetime.datetime(2018, 4, 3, 3, 13, 51, 128664), datetime.datetime(2018, 4, 3, 3, 13, 52, 128664), datetime.datetime(2018, 4, 3, 3, 13, 53, 128664), datetime.datetime(2018, 4, 3, 3, 13, 54, 128664), datetime.datetime(2018, 4, 3, 3, 13, 55, 128664), datetime.datetime(2018, 4, 3, 3, 13, 56, 128664), datetime.datetime(2018, 4, 3, 3, 13, 57, 128664), datetime.datetime(2018, 4, 3, 3, 13, 58, 128664), datetime.datetime(2018, 4, 3, 3, 13, 59, 128664), datetime.datetime(2018, 4, 3, 3, 14, 0, 128664), datetime.datetime(2018, 4, 3, 3, 14, 1, 128664), datetime.datetime(2018, 4, 3, 3, 14, 2, 128664), datetime.datetime(2018, 4, 3, 3, 14, 3, 128664), datetime.datetime(2018, 4, 3, 3, 14, 4, 128664), datetime.datetime(2018, 4, 3, 3, 14, 5, 128664), datetime.datetime(2018, 4, 3, 3, 14, 6, 128664), datetime.datetime(2018, 4, 3, 3, 14, 7, 128664), datetime.datetime(2018, 4, 3, 3, 14, 8, 128664), datetime.datetime(2018, 4, 3, 3, 14, 9, 128664), datetime.datetime(2018, 4, 3, 3, 14, 10, 128664), datetime.datetime(2018, 4, 3, 3, 14, 11, 128664), datetime.datetime(2018, 4, 3, 3, 14, 12, 128664), datetime.datetime(2018, 4, 3, 3, 14, 13, 128664), datetime.datetime(2018, 4, 3, 3, 14, 14, 128664), datetime.datetime(2018, 4, 3, 3, 14, 15, 128664), datetime.datetime(2018, 4, 3, 3, 14, 16, 128664), datetime.datetime(2018, 4, 3, 3, 14, 17, 128664), datetime.datetime(2018, 4, 3, 3, 14, 18, 128664), datetime.datetime(2018, 4, 3, 3, 14, 19, 128664), datetime.datetime(2018, 4, 3, 3, 14, 20, 128664), datetime.datetime(2018, 4, 3, 3, 14, 21, 128664), datetime.datetime(2018, 4, 3, 3, 14, 22, 128664), datetime.datetime(2018, 4, 3, 3, 14, 23, 128664), datetime.datetime(2018, 4, 3, 3, 14, 24, 128664), datetime.datetime(2018, 4, 3, 3, 14, 25, 128664), datetime.datetime(2018, 4, 3, 3, 14, 26, 128664), datetime.datetime(2018, 4, 3, 3, 14, 27, 128664), datetime.datetime(2018, 4, 3, 3, 14, 28, 128664), datetime.datetime(2018, 4, 3, 3, 14, 29, 128664), datetime.datetime(2018, 4, 3, 3, 14, 30, 128664), datetime.datetime(2018, 4, 3, 3, 14, 31, 128664), datetime.datetime(2018, 4, 3, 3, 14, 32, 128664), datetime.datetime(2018, 4, 3, 3, 14, 33, 128664), datetime.datetime(2018, 4, 3, 3, 14, 34, 128664), datetime.datetime(2018, 4, 3, 3, 14, 35, 128664), datetime.datetime(2018, 4, 3, 3, 14, 36, 128664), datetime.datetime(2018, 4, 3, 3, 14, 37, 128664), datetime.datetime(2018, 4, 3, 3, 14, 38, 128664), datetime.datetime(2018, 4, 3, 3, 14, 39, 128664), datetime.datetime(2018, 4, 3, 3, 14, 40, 128664), datetime.datetime(2018, 4, 3, 3, 14, 41, 128664), datetime.datetime(2018, 4, 3, 3, 14, 42, 128664), datetime.datetime(2018, 4, 3, 3, 14, 43, 128664), datetime.datetime(2018, 4, 3, 3, 14, 44, 128664), datetime.datetime(2018, 4, 3, 3, 14, 45, 128664), datetime.datetime(2018, 4, 3, 3, 14, 46, 128664), datetime.datetime(2018, 4, 3, 3, 14, 47, 128664), datetime.datetime(2018, 4, 3, 3, 14, 48, 128664), datetime.datetime(2018, 4, 3, 3, 14, 49, 128664), datetime.datetime(2018, 4, 3, 3, 14, 50, 128664), datetime.datetime(2018, 4, 3, 3, 14, 51, 128664), datetime.datetime(2018, 4, 3, 3, 14, 52, 128664), datetime.datetime(2018, 4, 3, 3, 14, 53, 128664), datetime.datetime(2018, 4, 3, 3, 14, 54, 128664), datetime.datetime(2018, 4, 3, 3, 14, 55, 128664), datetime.datetime(2018, 4, 3, 3, 14, 56, 128664), datetime.datetime(2018, 4, 3, 3, 14, 57, 128664), datetime.datetime(2018, 4, 3, 3, 14, 58, 128664), datetime.datetime(2018, 4, 3, 3, 14, 59, 128664), datetime.datetime(2018, 4, 3, 3, 15, 0, 128664), datetime.datetime(2018, 4, 3, 3, 15, 1, 128664), datetime.datetime(2018, 4, 3, 3, 15, 2, 128663), datetime.datetime(2018, 4, 3, 3, 15, 3, 128662), datetime.datetime(2018, 4, 3, 3, 15, 4, 128661), datetime.datetime(2018, 4, 3, 3, 15, 5, 128660), datetime.datetime(2018, 4, 3, 3, 15, 6, 128659), datetime.datetime(2018, 4, 3, 3, 15, 7, 128658), datetime.datetime(2018, 4, 3, 3, 15, 8, 128657), datetime.datetime(2018, 4, 3, 3, 15, 9, 128656), datetime.datetime(2018, 4, 3, 3, 15, 10, 128655), datetime.datetime(2018, 4, 3, 3, 15, 11, 128654), datetime.datetime(2018, 4, 3, 3, 15, 12, 128654), datetime.datetime(2018, 4, 3, 3, 15, 13, 128653), datetime.datetime(2018, 4, 3, 3, 15, 14, 128652), datetime.datetime(2018, 4, 3, 3, 15, 15, 128651), datetime.datetime(2018, 4, 3, 3, 15, 16, 128650), datetime.datetime(2018, 4, 3, 3, 15, 17, 128649), datetime.datetime(2018, 4, 3, 3, 15, 18, 128648), datetime.datetime(2018, 4, 3, 3, 15, 19, 128647), datetime.datetime(2018, 4, 3, 3, 15, 20, 128646), datetime.datetime(2018, 4, 3, 3, 15, 21, 128645), datetime.datetime(2018, 4, 3, 3, 15, 22, 128644), datetime.datetime(2018, 4, 3, 3, 15, 23, 128643), datetime.datetime(2018, 4, 3, 3, 15, 24, 128642), datetime.datetime(2018, 4, 3, 3, 15, 25, 128642), datetime.datetime(2018, 4, 3, 3, 15, 26, 128641), datetime.datetime(2018, 4, 3, 3, 15, 27, 128640), datetime.datetime(2018, 4, 3, 3, 15, 28, 128639), datetime.datetime(2018, 4, 3, 3, 15, 29, 128638), datetime.datetime(2018, 4, 3, 3, 15, 30, 128637), datetime.datetime(2018, 4, 3, 3, 15, 31, 128636), datetime.datetime(2018, 4, 3, 3, 15, 32, 128635), datetime.datetime(2018, 4, 3, 3, 15, 33, 128634), datetime.datetime(2018, 4, 3, 3, 15, 34, 128633), datetime.datetime(2018, 4, 3, 3, 15, 35, 128632), datetime.datetime(2018, 4, 3, 3, 15, 36, 128632), datetime.datetime(2018, 4, 3, 3, 15, 37, 128631), datetime.datetime(2018, 4, 3, 3, 15, 38, 128630), datetime.datetime(2018, 4, 3, 3, 15, 39, 128629), datetime.datetime(2018, 4, 3, 3, 15, 40, 128628), datetime.datetime(2018, 4, 3, 3, 15, 41, 128627), datetime.datetime(2018, 4, 3, 3, 15, 42, 128626), datetime.datetime(2018, 4, 3, 3, 15, 43, 128625), datetime.datetime(2018, 4, 3, 3, 15, 44, 128624), datetime.datetime(2018, 4, 3, 3, 15, 45, 128623), datetime.datetime(2018, 4, 3, 3, 15, 46, 128622), datetime.datetime(2018, 4, 3, 3, 15, 47, 128622), datetime.datetime(2018, 4, 3, 3, 15, 48, 128621), datetime.datetime(2018, 4, 3, 3, 15, 49, 128620), datetime.datetime(2018, 4, 3, 3, 15, 50, 128619), datetime.datetime(2018, 4, 3, 3, 15, 51, 128618), datetime.datetime(2018, 4, 3, 3, 15, 52, 128617), datetime.datetime(2018, 4, 3, 3, 15, 53, 128616), datetime.datetime(2018, 4, 3, 3, 15, 54, 128615), datetime.datetime(2018, 4, 3, 3, 15, 55, 128615), datetime.datetime(2018, 4, 3, 3, 15, 56, 128614), datetime.datetime(2018, 4, 3, 3, 15, 57, 128613), datetime.datetime(2018, 4, 3, 3, 15, 58, 128612), datetime.datetime(2018, 4, 3, 3, 15, 59, 128611), datetime.datetime(2018, 4, 3, 3, 16, 0, 128610), datetime.datetime(2018, 4, 3, 3, 16, 1, 128610), datetime.datetime(2018, 4, 3, 3, 16, 2, 128610), datetime.datetime(2018, 4, 3, 3, 16, 3, 128610), datetime.datetime(2018, 4, 3, 3, 16, 4, 128610), datetime.datetime(2018, 4, 3, 3, 16, 5, 128610), datetime.datetime(2018, 4, 3, 3, 16, 6, 128610), datetime.datetime(2018, 4, 3, 3, 16, 7, 128609), datetime.datetime(2018, 4, 3, 3, 16, 8, 128608), datetime.datetime(2018, 4, 3, 3, 16, 9, 128607), datetime.datetime(2018, 4, 3, 3, 16, 10, 128606), datetime.datetime(2018, 4, 3, 3, 16, 11, 128605), datetime.datetime(2018, 4, 3, 3, 16, 12, 128605), datetime.datetime(2018, 4, 3, 3, 16, 13, 128605), datetime.datetime(2018, 4, 3, 3, 16, 14, 128605), datetime.datetime(2018, 4, 3, 3, 16, 15, 128604), datetime.datetime(2018, 4, 3, 3, 16, 16, 128603), datetime.datetime(2018, 4, 3, 3, 16, 17, 128602), datetime.datetime(2018, 4, 3, 3, 16, 18, 128601), datetime.datetime(2018, 4, 3, 3, 16, 19, 128600), datetime.datetime(2018, 4, 3, 3, 16, 20, 128600), datetime.datetime(2018, 4, 3, 3, 16, 21, 128600), datetime.datetime(2018, 4, 3, 3, 16, 22, 128600), datetime.datetime(2018, 4, 3, 3, 16, 23, 128599), datetime.datetime(2018, 4, 3, 3, 16, 24, 128598), datetime.datetime(2018, 4, 3, 3, 16, 25, 128598), datetime.datetime(2018, 4, 3, 3, 16, 26, 128598), datetime.datetime(2018, 4, 3, 3, 16, 27, 128598), datetime.datetime(2018, 4, 3, 3, 16, 28, 128598), datetime.datetime(2018, 4, 3, 3, 16, 29, 128598), datetime.datetime(2018, 4, 3, 3, 16, 30, 128598), datetime.datetime(2018, 4, 3, 3, 16, 31, 128597), datetime.datetime(2018, 4, 3, 3, 16, 32, 128596), datetime.datetime(2018, 4, 3, 3, 16, 33, 128595), datetime.datetime(2018, 4, 3, 3, 16, 34, 128594), datetime.datetime(2018, 4, 3, 3, 16, 35, 128593), datetime.datetime(2018, 4, 3, 3, 16, 36, 128593), datetime.datetime(2018, 4, 3, 3, 16, 37, 128593), datetime.datetime(2018, 4, 3, 3, 16, 38, 128593), datetime.datetime(2018, 4, 3, 3, 16, 39, 128592), datetime.datetime(2018, 4, 3, 3, 16, 40, 128591), datetime.datetime(2018, 4, 3, 3, 16, 41, 128590), datetime.datetime(2018, 4, 3, 3, 16, 42, 128589), datetime.datetime(2018, 4, 3, 3, 16, 43, 128588), datetime.datetime(2018, 4, 3, 3, 16, 44, 128588), datetime.datetime(2018, 4, 3, 3, 16, 45, 128588), datetime.datetime(2018, 4, 3, 3, 16, 46, 128588), datetime.datetime(2018, 4, 3, 3, 16, 47, 128588), datetime.datetime(2018, 4, 3, 3, 16, 48, 128588), datetime.datetime(2018, 4, 3, 3, 16, 49, 128588), datetime.datetime(2018, 4, 3, 3, 16, 50, 128587), datetime.datetime(2018, 4, 3, 3, 16, 51, 128586), datetime.datetime(2018, 4, 3, 3, 16, 52, 128585), datetime.datetime(2018, 4, 3, 3, 16, 53, 128584), datetime.datetime(2018, 4, 3, 3, 16, 54, 128583), datetime.datetime(2018, 4, 3, 3, 16, 55, 128583), datetime.datetime(2018, 4, 3, 3, 16, 56, 128583), datetime.datetime(2018, 4, 3, 3, 16, 57, 128583), datetime.datetime(2018, 4, 3, 3, 16, 58, 128582), datetime.datetime(2018, 4, 3, 3, 16, 59, 128581), datetime.datetime(2018, 4, 3, 3, 17, 0, 128580), datetime.datetime(2018, 4, 3, 3, 17, 1, 128580), datetime.datetime(2018, 4, 3, 3, 17, 2, 128580), datetime.datetime(2018, 4, 3, 3, 17, 3, 128580), datetime.datetime(2018, 4, 3, 3, 17, 4, 128580), datetime.datetime(2018, 4, 3, 3, 17, 5, 128580), datetime.datetime(2018, 4, 3, 3, 17, 6, 128580), datetime.datetime(2018, 4, 3, 3, 17, 7, 128580), datetime.datetime(2018, 4, 3, 3, 17, 8, 128580), datetime.datetime(2018, 4, 3, 3, 17, 9, 128580), datetime.datetime(2018, 4, 3, 3, 17, 10, 128580), datetime.datetime(2018, 4, 3, 3, 17, 11, 128580), datetime.datetime(2018, 4, 3, 3, 17, 12, 128580), datetime.datetime(2018, 4, 3, 3, 17, 13, 128580), datetime.datetime(2018, 4, 3, 3, 17, 14, 128580), datetime.datetime(2018, 4, 3, 3, 17, 15, 128579), datetime.datetime(2018, 4, 3, 3, 17, 16, 128578), datetime.datetime(2018, 4, 3, 3, 17, 17, 128578), datetime.datetime(2018, 4, 3, 3, 17, 18, 128578), datetime.datetime(2018, 4, 3, 3, 17, 19, 128578), datetime.datetime(2018, 4, 3, 3, 17, 20, 128578), datetime.datetime(2018, 4, 3, 3, 17, 21, 128578), datetime.datetime(2018, 4, 3, 3, 17, 22, 128578), datetime.datetime(2018, 4, 3, 3, 17, 23, 128578), datetime.datetime(2018, 4, 3, 3, 17, 24, 128578), datetime.datetime(2018, 4, 3, 3, 17, 25, 128578), datetime.datetime(2018, 4, 3, 3, 17, 26, 128578), datetime.datetime(2018, 4, 3, 3, 17, 27, 128578), datetime.datetime(2018, 4, 3, 3, 17, 28, 128578), datetime.datetime(2018, 4, 3, 3, 17, 29, 128578), datetime.datetime(2018, 4, 3, 3, 17, 30, 128578), datetime.datetime(2018, 4, 3, 3, 17, 31, 128578), datetime.datetime(2018, 4, 3, 3, 17, 32, 128578), datetime.datetime(2018, 4, 3, 3, 17, 33, 128578), datetime.datetime(2018, 4, 3, 3, 17, 34, 128578), datetime.datetime(2018, 4, 3, 3, 17, 35, 128578), datetime.datetime(2018, 4, 3, 3, 17, 36, 128578), datetime.datetime(2018, 4, 3, 3, 17, 37, 128578), datetime.datetime(2018, 4, 3, 3, 17, 38, 128578), datetime.datetime(2018, 4, 3, 3, 17, 39, 128578), datetime.datetime(2018, 4, 3, 3, 17, 40, 128578), datetime.datetime(2018, 4, 3, 3, 17, 41, 128578), datetime.datetime(2018, 4, 3, 3, 17, 42, 128578), datetime.datetime(2018, 4, 3, 3, 17, 43, 128578), datetime.datetime(2018, 4, 3, 3, 17, 44, 128578), datetime.datetime(2018, 4, 3, 3, 17, 45, 128578), datetime.datetime(2018, 4, 3, 3, 17, 46, 128578), datetime.datetime(2018, 4, 3, 3, 17, 47, 128578), datetime.datetime(2018, 4, 3, 3, 17, 48, 128578), datetime.datetime(2018, 4, 3, 3, 17, 49, 128578), datetime.datetime(2018, 4, 3, 3, 17, 50, 128578), datetime.datetime(2018, 4, 3, 3, 17, 51, 128578), datetime.datetime(2018, 4, 3, 3, 17, 52, 128578), datetime.datetime(2018, 4, 3, 3, 17, 53, 128578), datetime.datetime(2018, 4, 3, 3, 17, 54, 128578), datetime.datetime(2018, 4, 3, 3, 17, 55, 128578), datetime.datetime(2018, 4, 3, 3, 17, 56, 128578), datetime.datetime(2018, 4, 3, 3, 17, 57, 128578), datetime.datetime(2018, 4, 3, 3, 17, 58, 128578), datetime.datetime(2018, 4, 3, 3, 17, 59, 128578), datetime.datetime(2018, 4, 3, 3, 18, 0, 128577), datetime.datetime(2018, 4, 3, 3, 18, 1, 128576), datetime.datetime(2018, 4, 3, 3, 18, 2, 128575), datetime.datetime(2018, 4, 3, 3, 18, 3, 128574), datetime.datetime(2018, 4, 3, 3, 18, 4, 128573), datetime.datetime(2018, 4, 3, 3, 18, 5, 128572), datetime.datetime(2018, 4, 3, 3, 18, 6, 128571), datetime.datetime(2018, 4, 3, 3, 18, 7, 128570), datetime.datetime(2018, 4, 3, 3, 18, 8, 128569), datetime.datetime(2018, 4, 3, 3, 18, 9, 128568), datetime.datetime(2018, 4, 3, 3, 18, 10, 128567), datetime.datetime(2018, 4, 3, 3, 18, 11, 128566), datetime.datetime(2018, 4, 3, 3, 18, 12, 128566), datetime.datetime(2018, 4, 3, 3, 18, 13, 128565), datetime.datetime(2018, 4, 3, 3, 18, 14, 128564), datetime.datetime(2018, 4, 3, 3, 18, 15, 128563), datetime.datetime(2018, 4, 3, 3, 18, 16, 128562), datetime.datetime(2018, 4, 3, 3, 18, 17, 128561), datetime.datetime(2018, 4, 3, 3, 18, 18, 128560), datetime.datetime(2018, 4, 3, 3, 18, 19, 128559), datetime.datetime(2018, 4, 3, 3, 18, 20, 128558), datetime.datetime(2018, 4, 3, 3, 18, 21, 128557), datetime.datetime(2018, 4, 3, 3, 18, 22, 128556), datetime.datetime(2018, 4, 3, 3, 18, 23, 128555), datetime.datetime(2018, 4, 3, 3, 18, 24, 128554), datetime.datetime(2018, 4, 3, 3, 18, 25, 128554), datetime.datetime(2018, 4, 3, 3, 18, 26, 128553), datetime.datetime(2018, 4, 3, 3, 18, 27, 128552), datetime.datetime(2018, 4, 3, 3, 18, 28, 128551), datetime.datetime(2018, 4, 3, 3, 18, 29, 128550), datetime.datetime(2018, 4, 3, 3, 18, 30, 128549), datetime.datetime(2018, 4, 3, 3, 18, 31, 128548), datetime.datetime(2018, 4, 3, 3, 18, 32, 128547), datetime.datetime(2018, 4, 3, 3, 18, 33, 128546), datetime.datetime(2018, 4, 3, 3, 18, 34, 128545), datetime.datetime(2018, 4, 3, 3, 18, 35, 128544), datetime.datetime(2018, 4, 3, 3, 18, 36, 128544), datetime.datetime(2018, 4, 3, 3, 18, 37, 128543), datetime.datetime(2018, 4, 3, 3, 18, 38, 128542), datetime.datetime(2018, 4, 3, 3, 18, 39, 128541), datetime.datetime(2018, 4, 3, 3, 18, 40, 128540), datetime.datetime(2018, 4, 3, 3, 18, 41, 128539), datetime.datetime(2018, 4, 3, 3, 18, 42, 128538), datetime.datetime(2018, 4, 3, 3, 18, 43, 128537), datetime.datetime(2018, 4, 3, 3, 18, 44, 128536), datetime.datetime(2018, 4, 3, 3, 18, 45, 128535), datetime.datetime(2018, 4, 3, 3, 18, 46, 128534), datetime.datetime(2018, 4, 3, 3, 18, 47, 128534), datetime.datetime(2018, 4, 3, 3, 18, 48, 128533), datetime.datetime(2018, 4, 3, 3, 18, 49, 128532), datetime.datetime(2018, 4, 3, 3, 18, 50, 128531), datetime.datetime(2018, 4, 3, 3, 18, 51, 128530), datetime.datetime(2018, 4, 3, 3, 18, 52, 128529), datetime.datetime(2018, 4, 3, 3, 18, 53, 128528), datetime.datetime(2018, 4, 3, 3, 18, 54, 128527), datetime.datetime(2018, 4, 3, 3, 18, 55, 128527), datetime.datetime(2018, 4, 3, 3, 18, 56, 128526), datetime.datetime(2018, 4, 3, 3, 18, 57, 128525), datetime.datetime(2018, 4, 3, 3, 18, 58, 128524), datetime.datetime(2018, 4, 3, 3, 18, 59, 128523), datetime.datetime(2018, 4, 3, 3, 19, 0, 128522), datetime.datetime(2018, 4, 3, 3, 19, 1, 128522), datetime.datetime(2018, 4, 3, 3, 19, 2, 128522), datetime.datetime(2018, 4, 3, 3, 19, 3, 128522), datetime.datetime(2018, 4, 3, 3, 19, 4, 128522), datetime.datetime(2018, 4, 3, 3, 19, 5, 128522), datetime.datetime(2018, 4, 3, 3, 19, 6, 128522), datetime.datetime(2018, 4, 3, 3, 19, 7, 128521), datetime.datetime(2018, 4, 3, 3, 19, 8, 128520), datetime.datetime(2018, 4, 3, 3, 19, 9, 128519), datetime.datetime(2018, 4, 3, 3, 19, 10, 128518), datetime.datetime(2018, 4, 3, 3, 19, 11, 128517), datetime.datetime(2018, 4, 3, 3, 19, 12, 128517), datetime.datetime(2018, 4, 3, 3, 19, 13, 128517), datetime.datetime(2018, 4, 3, 3, 19, 14, 128517), datetime.datetime(2018, 4, 3, 3, 19, 15, 128516), datetime.datetime(2018, 4, 3, 3, 19, 16, 128515), datetime.datetime(2018, 4, 3, 3, 19, 17, 128514), datetime.datetime(2018, 4, 3, 3, 19, 18, 128513), datetime.datetime(2018, 4, 3, 3, 19, 19, 128512), datetime.datetime(2018, 4, 3, 3, 19, 20, 128512), datetime.datetime(2018, 4, 3, 3, 19, 21, 128512), datetime.datetime(2018, 4, 3, 3, 19, 22, 128512), datetime.datetime(2018, 4, 3, 3, 19, 23, 128511), datetime.datetime(2018, 4, 3, 3, 19, 24, 128510), datetime.datetime(2018, 4, 3, 3, 19, 25, 128510), datetime.datetime(2018, 4, 3, 3, 19, 26, 128510), datetime.datetime(2018, 4, 3, 3, 19, 27, 128510), datetime.datetime(2018, 4, 3, 3, 19, 28, 128510), datetime.datetime(2018, 4, 3, 3, 19, 29, 128510), datetime.datetime(2018, 4, 3, 3, 19, 30, 128510), datetime.datetime(2018, 4, 3, 3, 19, 31, 128509), datetime.datetime(2018, 4, 3, 3, 19, 32, 128508), datetime.datetime(2018, 4, 3, 3, 19, 33, 128507), datetime.datetime(2018, 4, 3, 3, 19, 34, 128506), datetime.datetime(2018, 4, 3, 3, 19, 35, 128505), datetime.datetime(2018, 4, 3, 3, 19, 36, 128505), datetime.datetime(2018, 4, 3, 3, 19, 37, 128505), datetime.datetime(2018, 4, 3, 3, 19, 38, 128505), datetime.datetime(2018, 4, 3, 3, 19, 39, 128504), datetime.datetime(2018, 4, 3, 3, 19, 40, 128503), datetime.datetime(2018, 4, 3, 3, 19, 41, 128502), datetime.datetime(2018, 4, 3, 3, 19, 42, 128501), datetime.datetime(2018, 4, 3, 3, 19, 43, 128500), datetime.datetime(2018, 4, 3, 3, 19, 44, 128500), datetime.datetime(2018, 4, 3, 3, 19, 45, 128500), datetime.datetime(2018, 4, 3, 3, 19, 46, 128500), datetime.datetime(2018, 4, 3, 3, 19, 47, 128500), datetime.datetime(2018, 4, 3, 3, 19, 48, 128500)])
-
-angles_good = ([72.59872955603669, 72.56089030803481, 72.5229007958712, 72.48475418935668, 72.44645731868042, 72.40801018384242, 72.3694059546535, 72.33064463111369, 72.29173304341212, 72.25266436135965, 72.21343175476709, 72.17404205382363, 72.13449525852926, 72.0947845386948, 72.05490989432026, 72.01487815559481, 71.9746824923293, 71.9343229045237, 71.89379256198883, 71.8530982949139, 71.81224010329888, 71.77121115695462, 71.7300114558811, 71.68864100007833, 71.64709978954632, 71.60538782428505, 71.56350510429453, 71.52144479938559, 71.47920690955823, 71.43679143481245, 71.39420520533743, 71.3514345607548, 71.30848633125376, 71.2653605168343, 71.22205028730725, 71.1785556426726, 71.13487658293037, 71.09101310808056, 71.04696521812315, 71.00272608286897, 70.9583025325072, 70.91368773684869, 70.8688816958934, 70.82388440964135, 70.77869587809255, 70.73330927105782, 70.68773141872633, 70.6419554909089, 70.59597465741638, 70.54980257862708, 70.50343242435187, 70.45685736440156, 70.41007739877614, 70.36309252747562, 70.3159027505, 70.26850806784928, 70.22090847952346, 70.17309715533337, 70.12507409527902, 70.07684612954955, 70.02839959776665, 69.97973449993032, 69.9308576662297, 69.88176909666483, 69.83245513085733, 69.7829225989964, 69.73317150108203, 69.68319500692503, 69.63299311652544, 69.58257266007242, 69.5319199771876, 69.48104189806017, 69.42993159250096, 69.37858906050998, 69.3270143020872, 69.27520731723267, 69.22316810594634, 69.17088983803906, 69.11836568332167, 69.06560930217249, 69.01260703421319, 68.95936570963293, 68.90587849824257, 68.85214540004208, 68.7981595848423, 68.7439278828324, 68.68944346382321, 68.63470632781473, 68.57971647480694, 68.52446707461071, 68.4689649574152, 68.4132032930312, 68.3571752512696, 68.30088766231951, 68.24433369599181, 68.18751335228647, 68.1304266312035, 68.07307353274291, 68.01544039652634, 67.95754088293215, 67.89936133158197, 67.84090857266501, 67.78217577599207, 67.72316294156316, 67.66386323918911, 67.6042834990591, 67.54441689098392, 67.48425658477446, 67.42380941061984, 67.36307536852009, 67.30204079809685, 67.24071252953931, 67.17908373265828, 67.11715440745378, 67.05492455392579, 66.99239417207433, 66.92954960152103, 66.86640450264427, 66.80294521506568, 66.73917173878527, 66.67508407380305, 66.61068222011899, 66.54595934754396, 66.48091545607792, 66.4155505457209, 66.34985778628372, 66.28383717776637, 66.21748872016887, 66.15080558330203, 66.08378776716587, 66.01643527176037, 65.94874126689638, 65.88070575257387, 65.81232189860371, 65.74359653517504, 65.6745228320987, 65.60509395918552, 65.53531674662467, 65.46517753403782, 65.39468315161412, 65.3238267691644, 65.25260838668868, 65.18102117399778, 65.10906513109168, 65.03674025797042, 64.9640397244448, 64.89095670032567, 64.81750484599135, 64.74366367087434, 64.66944000516382, 64.5948270186706, 64.51982471139469, 64.44442625314691, 64.36863847411645, 64.29244771392497, 64.21585397257245, 64.13885725005889, 64.0614575463843, 63.98364120117035, 63.905415044606194, 63.826772246502664, 63.74771280685977, 63.66822306529916, 63.58831668219918, 63.507979997181494, 63.42720618005692, 63.34600206101464, 63.26436080986547, 63.18228242660943, 63.09975325086817, 63.01678011283085, 62.933356182308316, 62.84947462911139, 62.76513545324007, 62.68034548488353, 62.59508423347427, 62.509351699012264, 62.423154711686706, 62.336486441308416, 62.24933322749905, 62.16170190044779, 62.07358562996545, 61.98498441605205, 61.89588459832923, 61.806293006986174, 61.7162028118337, 61.62560718268266, 61.53450611953303, 61.442899622384815, 61.35077403085968, 61.25812934495763, 61.16496556467865, 61.07127585983359, 60.97705340023327, 60.88229818587768, 60.78701021676683, 60.69117583252238, 60.59479503314433, 60.49786781863268, 60.400387358798255, 60.3023468234519, 60.20374621259359, 60.104578696034174, 60.00484427377365, 59.904529285433675, 59.803633731014244, 59.702157610515364, 59.60009409374786, 59.49744318071174, 59.39419121102866, 59.29033135450945, 59.18587727153244, 59.08080164134096, 58.975118124313354, 58.86881306007128, 58.76188644861473, 58.654324629565366, 58.546134433112364, 58.437309029066554, 58.32783475704959, 58.217711617061475, 58.106939609102206, 57.99550507279345, 57.8834080081352, 57.77064841512746, 57.657212633391886, 57.543093832739316, 57.42829884335891, 57.31281400487234, 57.19663248709042, 57.079754290013156, 56.9621691683568, 56.843877122121356, 56.72487132111764, 56.60514493515648, 56.484691134048724, 56.36350650269977, 56.24158421092046, 56.1189208436162, 55.995509570597825, 55.871346976770745, 55.746422816851215, 55.62073367574464, 55.49427613835644, 55.36703995940286, 55.23902172378931, 55.110214601326625, 54.98061517692022, 54.85021320528633, 54.71900527133039, 54.586987959957796, 54.454151025884805, 54.32049105401682, 54.1859977990701, 54.05067126104464, 53.9144977795621, 53.77747735462247, 53.63960315603659, 53.50086493852071, 53.361259286980236, 53.220779371225994, 53.07941494597424, 52.937166011224974, 52.79402232169443, 52.64998046228803, 52.50502677262743, 52.35916125271264, 52.212373657259896, 52.06466057117462, 51.916011749173045, 51.76642377616059, 51.61588640685351, 51.46439622615722, 51.31194298878795, 51.15851986455654, 51.004123438368396, 50.84874346493978, 50.692373114081505, 50.535008970698996, 50.37663737441391, 50.21725832522625, 50.05686157785225, 49.895440302102756, 49.732984252694, 49.56949001453141, 49.40494734233122, 49.23935623609343, 49.07269962034512, 48.904974079991696, 48.73617619993859, 48.566292319807445, 48.395319024503685, 48.223246068743556, 48.05007003743247, 47.87578410038125, 47.70037459721157, 47.523838112828834, 47.34616781704388, 47.16735346457295, 46.98739164032145, 46.80627209900563, 46.623988010436335, 46.44053254442438, 46.25589545568601, 46.07007332912664, 45.88305591946252, 45.69483639650448, 45.50541134515793, 45.31476710504454, 45.12289684597512, 44.92979715285511, 44.73546119549532, 44.53987531351742, 44.34303950692141, 44.14494011532894, 43.94557372364544, 43.74493350168173, 43.54300920415406, 43.33979741596784, 43.13528789183932, 42.92947721667391, 42.72235173009327, 42.51391143209741, 42.304146077402564, 42.09304883581956, 41.880616292253826, 41.66683478632701, 41.45170431803912, 41.23521122701181, 41.01735892833967, 40.79813034654977, 40.577528896736695, 40.35554091852211, 40.13216299681143, 39.90738830141548, 39.68121000214509, 39.45362809900027, 39.224628931602666, 38.9942090848577, 38.76236514367079, 38.52909027785276, 38.29437765721444, 38.05822728175583, 37.8206254910986, 37.581575700337325, 37.341071079282834, 37.09910138265138, 36.85567002553754, 36.61076676265756, 36.36438817891686, 36.11653427431544, 35.86719821866412, 35.61637659686833, 35.36406599383348, 35.11026299446497, 34.85496418366824, 34.59816614634868, 34.33986888250631, 34.08006897704653, 33.818759599780186, 33.55594758089644, 33.291622675111526, 33.025788297520045, 32.7584410330274, 32.48958088163361, 32.21920784333865, 31.947321918142542, 31.6739162758561, 31.398997746668503, 31.122566330579748, 30.844618612495246, 30.565161422604177, 30.284187930717362, 30.001708382118558, 29.717715946618597, 29.432220869501236, 29.145219735671883, 28.85671596022513, 28.566716373350143, 28.275220975046924, 27.98223488795735, 27.6877632347233, 27.39180772289206, 27.094375182652808, 26.795469029100126, 26.495097799970473, 26.19326491035844, 25.88997889800049, 25.58524488553849, 25.27906970316162, 24.971463596153637, 24.662429979609115, 24.351982513906403, 24.040124614140083, 23.7268699406885, 23.412225323740813, 23.096202716128076, 22.778810655586756, 22.460061094947893, 22.139965987042537, 21.818537284701737, 21.495785233209247, 21.171721785396116, 20.846364016735265, 20.51972046496316, 20.191809913100016, 19.862642606429592, 19.532237327972105, 19.200606030558596, 18.867765789662, 18.533733680755233, 18.19852336421664, 17.862153623066437, 17.524643240324842, 17.186009291464778, 16.846268851959174, 16.505442412375537, 16.163547048186796, 15.820604957507747, 15.476634923358613, 15.1316574363069, 14.785692986920123, 14.438763773313081, 14.090890286053282, 13.74209557702918, 13.39240269812922, 13.041832993694563, 12.690410369387298, 12.338159584643169, 11.985102837576978, 11.631264887624468, 11.276671347995025, 10.92134697812439, 10.565315683674658, 10.208605639176158, 9.851240750290982, 9.493247484002165, 9.134654014840033, 8.775485956013974, 8.415769774507021, 8.055534498623148, 7.694806595345386, 7.333614239204064, 6.971985604729508, 6.609948866452044, 6.24753262578882, 5.884765057270164, 5.521676042973694, 5.158293757429737, 4.7946472289422655, 4.430766339588898, 4.066679690786782, 3.70241716461354, 3.3380082162599654, 2.9734820874734424, 2.6088688737750023, 2.244198457242263, 1.8795002930660207, 1.5148043700455995, 1.1501401433717957, 0.7855374951222277, 0.42102644077664664, 0.05663615538137052, 359.69240561845197, 359.3283292149336, 358.9644986982254, 358.6008867475706, 358.2375206837259, 357.8744824689614, 357.511772103277, 357.1494169074295, 356.78741688141884, 356.42585398751504, 356.0647282257181, 355.70406691678477, 355.34389738147166, 354.98427426129217, 354.6251702354896, 354.2666672663339, 353.90876535382523, 353.55149181872025, 353.1948739817755, 352.8389391637478, 352.4837146853938, 352.12922786747015, 351.77550603073354, 351.4225491751839, 351.07043926309143, 350.71912165294265, 350.36867830700766, 350.0191092252864, 349.6704417285356, 349.3227031375119, 348.975920772972, 348.6300946349159, 348.28525204410033, 347.9414203212819, 347.59862678721726, 347.2568987626632, 346.91620892686296, 346.5766392420866, 346.23816238757746, 345.9008056840922, 345.5645964523875, 345.22956201322, 344.8957023665898, 344.5630175124968, 344.23156209245445, 343.9013361064627, 343.5723395545215, 343.2446270781443, 342.91814403581765, 342.5929723898117, 342.26911214012637, 341.946535966005, 341.62529850896095, 341.3053997689942, 340.98683974610486, 340.6696457610495, 340.3538178138281, 340.0393559044407, 339.72631467440067, 339.41466680295133, 339.1044122900927, 338.7955784565814, 338.4881653024174, 338.18220014835754, 337.8776829944017, 337.57458651979323, 337.2729653660454, 336.9728195331584, 336.6741217003754, 336.37689918845314, 336.0811519973916, 335.7868801271907, 335.49411089860735, 335.2028443116413, 334.913053045536, 334.6247644210481, 334.3379784381776, 334.0526950969245, 333.7689143972888, 333.48663633927055, 333.2058882436263, 332.9266427895995, 332.6489272979468, 332.3727144479115, 332.0980042394936, 331.82482399344974, 331.5531463890233, 331.282998746971, 331.014353746536, 330.7472113877185, 330.48159899127506, 330.217489236449, 329.954909443997, 329.69380497240576, 329.4342304631886, 329.1761312748322, 328.9195620488498, 328.6644681437282, 328.41087688022395, 328.1587882583371, 327.908174957311, 327.6590642979023, 327.4114289593543, 327.16524162091036, 326.9205569240838, 326.677347548118, 326.43558617225625, 326.1952727964985, 325.9564347416015, 325.71904468680856, 325.48310263211965, 325.24860857753475, 325.01553520229726, 324.78390982716377, 324.55367781062097, 324.32489379418223, 324.0975031363342, 323.8715331578335, 323.6469565379234, 323.4238005973608, 323.2020106946321, 322.9816141504942, 322.7625836441902, 322.5449191757202, 322.32862074508427, 322.1136883522823, 321.90009467655767, 321.68786703866704, 321.476950797097, 321.26740059336106, 321.059134465189, 320.8522070540943, 320.64659103932024, 320.44225910011016, 320.2392385572207, 320.03750208989516, 319.8370496981336, 319.6378813819361, 319.4399698205458, 319.2433150139628, 319.04791696218706, 318.8537483444619, 318.6608364815441, 318.4691267319202, 318.27867373710353, 318.08942285558084, 317.90137408735205, 317.7145274324172, 317.52888289077623, 317.3444404624292, 317.16114550586275, 316.9790253418335, 316.7980799703415, 316.61828207063013, 316.43965896345594, 316.26215600730563, 316.08577320217927, 315.9105378688334, 315.73639536575473, 315.5634003344567, 315.3914981334258, 315.2206614419054, 315.05094490140897, 314.8823211911797, 314.7147356697042, 314.54824297849603, 314.3828157967983, 314.2184268038544, 314.05507599966444, 313.8927907049849, 313.7315162783026, 313.57128004037406, 313.4120546704427, 313.2538128477519, 313.0966092138149, 312.94038912711835, 312.7851525876623, 312.6308995954467, 312.4776301504716, 312.32531693198035, 312.17395993997286, 312.02358649520585, 311.8741146354093, 311.7256263228532, 311.57803959526757, 311.43140909416576, 311.28568017803434, 311.14085284687343, 310.99695442143957, 310.8539302602195, 310.7118350047266, 310.5705866926907, 310.4302399656253, 310.29076750277363, 310.1521693041357, 310.0144180489549, 309.87754105798786, 309.7414836897212, 309.60627326491164, 309.4719097835591, 309.3383932456637, 309.20566900971204, 309.07379171721743, 308.94270672666653, 308.8124140380594, 308.6829409721526, 308.5542602081896, 308.42634442541356, 308.299248265338, 308.17288976569273, 308.0473235679912, 307.92252235147674, 307.7984861161493, 307.6751875412523, 307.5526266267856, 307.43083069350587, 307.3097450998999, 307.18942448748095, 307.069786893979, 306.9509142816641, 306.83272468826624, 306.715245434542, 306.59847652049143, 306.4824179461146, 306.3670423906547, 306.2523498541119, 306.138340336486, 306.0250138377772, 305.91234303722865, 305.80035525559714, 305.6890231721259, 305.578346786815, 305.46832609966447, 305.3589611106742, 305.2502244990876, 305.14214358566136, 305.0346910496387, 304.9278668910197, 304.82164378904764, 304.71607638523597, 304.6110827173145, 304.5067174267967, 304.40298051368256, 304.29981733645866, 304.1972552158818, 304.0952941519518, 303.99390682391214, 303.89309323176275, 303.79288069626034, 303.6932418966482, 303.5941495121696, 303.4956581843381, 303.3977132716401, 303.3003147740757, 303.2034626916449, 303.10718434510443, 303.0114524136975, 302.9162395766675, 302.82157315477116, 302.7274531480084, 302.63382491486584, 302.5407704176136, 302.4482076939816, 302.3561640647265, 302.2646395298483, 302.1736067685904, 302.08312042246604, 301.99309852920527, 301.90359573032146, 301.8145847050578, 301.7260654534145, 301.6380106546347, 301.5504749502318, 301.46340369869245, 301.3767969000167, 301.2906818749612, 301.2050313027692, 301.11987250419753, 301.03515083773266, 300.95089362413137, 300.867073542637, 300.7837452347628, 300.7008267382389, 300.61840001533517, 300.53638310378165, 300.45480332433505, 300.373687997752, 300.2929824825191, 300.2127140993931, 300.132882848374, 300.0534887294618, 299.97447710114307, 299.8959299256879, 299.8177652408263, 299.74003768807154, 299.6626926259103, 299.58575737509926, 299.5092592563951, 299.4331163075278, 299.3574104907674, 299.2820871646005, 299.2071463290271, 299.13261530480395, 299.0584394504176, 298.9846734073815, 298.91128985493884, 298.83828879308976, 298.7656429010775, 298.69337949965876, 298.62149858883356, 298.5499728478452, 298.47882959745033, 298.4080415168923, 298.33760860617116, 298.2675308652868, 298.19780829423934, 298.12846821378537, 298.0594559824116, 297.99079892087457, 297.9224697084178, 297.8544956657978, 297.7868767930147, 297.7195857693117, 297.6526225946889, 297.58601458990296, 297.51970711344046, 297.4537548068148, 297.3881303492693, 297.32280642004736, 297.2578376606622, 297.1931694296005, 297.128829047619, 297.0648165147176, 297.0011045101397, 296.93769303388535, 296.8746094067111, 296.8118263078604, 296.74934373733305, 296.68718901588596, 296.6253075020056, 296.56375383720547, 296.5024733799721, 296.44149345106223, 296.38081405047586, 296.32043517821296, 296.2603295135168, 296.2005243771442, 296.14099244833835, 296.08176104785605, 296.0228028549405, 295.96411786959175, 295.90573341256646, 295.8475948423513, 295.78975680045966, 295.7321919661348, 295.67487301862, 295.61785459942877, 295.5610820670476, 295.50458274223325, 295.4483566249857, 295.3923763945483, 295.33666937167766, 295.28120823561716, 295.22602030712346, 295.17107826543986, 295.1164094313231, 295.0619864840164, 295.0078094235199, 294.95387824983345, 294.9001929629572, 294.846753562891, 294.79356004963495, 294.740612423189, 294.6879106835532, 294.6354275099708, 294.58321754395524, 294.5312261439931, 294.4794533100844, 294.42792636298583, 294.37664530269734, 294.32558280846234, 294.27476620103744, 294.224168159666, 294.173788684348, 294.1236277750834, 294.073712752629, 294.02401629622796, 293.97453840588037, 293.9252790815862, 293.8762110025889, 293.8273888104016, 293.7787851842678, 293.7303728034307, 293.6822063094038, 293.63423106067364, 293.5864743779969, 293.538908940617, 293.4915620692904, 293.44443376401733, 293.39749670404103, 293.35075088936145, 293.3042236407353, 293.25791495816264, 293.21177020013005, 293.1658440081509, 293.12013638222516, 293.0745926808395, 293.0292675455073, 292.98410633471514, 292.93916368997645, 292.89441229053455, 292.8498248156327, 292.8054559067843, 292.76127824323265, 292.7172645042211, 292.6734420105063, 292.62981076208825, 292.58637075896695, 292.54309468038576, 292.50000984710135, 292.45711625911366, 292.41438659566603, 292.37184817751523, 292.32947368390444, 292.2872904355905, 292.2452711118165, 292.2034430333394, 292.1617788794023, 292.12027865000533, 292.0789423451484, 292.0377972855882, 291.9968161505682, 291.95599894008814, 291.91534565414827, 291.8748562927484, 291.83453085588866, 291.79439666432563, 291.75439907654606, 291.71456541330656, 291.6749229953638, 291.63541718120445, 291.59604797082847, 291.5568700057493, 291.5178559652102, 291.4789785284545, 291.4402650162388, 291.4016881078066, 291.36330244467115], [1.0383385373065518e-06, 0.04579512104919959, 0.09188725527569556, 0.13825411451824612, 0.1848936610592815, 0.2318037604646861, 0.27898214489821205, 0.3264265331833982, 0.3741346041231439, 0.42210390311821616, 0.4703320022498084, 0.5188164202382612, 0.5675546224430624, 0.616544100904126, 0.6657822409396603, 0.7152665879504325, 0.7649944738937979, 0.8149633908096707, 0.8651707773771122, 0.9156140722751835, 0.966290767543799, 1.0171984085837253, 1.0683344340740242, 1.119696496137168, 1.171282140173924, 1.2230889115850592, 1.2751146759364578, 1.3273568719071813, 1.379813365063114, 1.4324818075267285, 1.485360171585615, 1.5384462160839525, 1.5917379133093308, 1.6452331288276343, 1.6989300483698646, 1.7528265375019063, 1.806920781954761, 1.861210754016019, 1.9156947461383875, 1.9703712642179858, 2.025238173820698, 2.0802939808426437, 2.13553697773653, 2.1909660972852993, 2.2465792050548354, 2.3023750203846696, 2.3583522626143325, 2.414509651083354, 2.4708452648010306, 2.5273586768805396, 2.584047966331176, 2.6409120659358822, 2.6979501219210125, 2.7551608536260974, 2.8125431938340784, 2.870095861884487, 2.9278182174470877, 2.985709193304823, 3.0437679356840475, 3.1019935908111136, 3.160385091468964, 3.218942010770776, 3.2776632814994913, 3.3365482633248753, 3.395596315916693, 3.4548067989447104, 3.514178858635281, 3.573712281544993, 3.6334062139002006, 3.6932600153706687, 3.7532734725129857, 3.8134461584403283, 3.873777646265874, 3.9342670822159764, 3.9949140394038123, 4.0557189447162045, 4.116680944379507, 4.177799184620074, 4.239074519211551, 4.300505667493469, 4.36209305635265, 4.423809365032416, 4.485709235046126, 4.547764491863454, 4.609975135484399, 4.672340312135316, 4.734860875589852, 4.797535972074358, 4.8603656015888355, 4.923350191020108, 4.986489313481353, 5.049783395859391, 5.1132315843805785, 5.17683473281856, 5.240592414286513, 5.304504628784438, 5.368571803199158, 5.432793510643849, 5.497170178005335, 5.561701805283615, 5.626388392478691, 5.691230366477384, 5.756227727279694, 5.821380474885623, 5.886688609295169, 5.952152984281979, 6.017773172959231, 6.083549175326922, 6.1494822720455256, 6.215571609341391, 6.281817614101345, 6.34822071321221, 6.414781333560807, 6.481499475147137, 6.548375137971202, 6.615409175806645, 6.682601588653469, 6.749952803398496, 6.817462820041725, 6.885132492356803, 6.952961393456907, 7.02094995022886, 7.089099016446308, 7.157409018996075, 7.225879104104514, 7.294511406205742, 7.36330507152611, 7.43226010006562, 7.501378199371564, 7.570658515670296, 7.640101902735462, 7.709709214340708, 7.779480450486035, 7.849415611171441, 7.9195155501705745, 7.989780267483434, 8.060211470657313, 8.13080745214492, 8.201569919493544, 8.272499726476834, 8.343596019321142, 8.414859651800116, 8.48629233146105, 8.557892350756646, 8.629662271007847, 8.70160038466736, 8.773709253056124, 8.845987168626845, 8.918436692700464, 8.991056971503331, 9.06384800503545, 9.136812354617756, 9.209948312702961, 9.283256733064707, 9.35673932325029, 9.430395229486061, 9.504225305545669, 9.578230405202756, 9.65240967468368, 9.726765675309377, 9.801296699532557, 9.87600445490051, 9.950889795186884, 10.025951866618032, 10.101191522967598, 10.17661047178288, 10.252207005516581, 10.327982831715994, 10.403938804154768, 10.4800749228329, 10.55639118775039, 10.63288759890724, 10.709565863850743, 10.786425982580896, 10.863468808871348, 10.940693488948451, 11.018101730359499, 11.095692679330842, 11.173468043409779, 11.251427822596304, 11.329572016890419, 11.407901480065773, 11.48641621212236, 11.565116213060186, 11.644003190426542, 11.723076290447779, 11.802337220671191, 11.881784273549489, 11.961420010403605, 12.041242723686251, 12.121254974718367, 12.201455055952655, 12.281844674936414, 12.362422977895992, 12.443191672378687, 12.524149904610846, 12.605297674592476, 12.686636689870866, 12.768166950446014, 12.849887602544278, 12.931799499939302, 13.013903496404733, 13.096198738166924, 13.178686078999522, 13.261365518902528, 13.344237057875938, 13.427301549693402, 13.510558140581272, 13.594007684313196, 13.677651034662818, 13.761486484082846, 13.845515740120575, 13.929737949002355, 14.014153964501837, 14.098763786619015, 14.183566561580248, 14.268562289385532, 14.353751823808516, 14.439136018622845, 14.524730241754153, 14.610599379999554, 14.696649518257958, 14.782889194265833, 14.869316700475881, 14.955933744435399, 15.042740326144383, 15.129734738055543, 15.21691868771617, 15.304290467578973, 15.391850077643952, 15.479599225458399, 15.56748156196166, 15.655539775836049, 15.743789235007199, 15.832228231927816, 15.920858474145195, 16.00967825411204, 16.098687571828354, 16.187886427294135, 16.277273112962092, 16.366847628832225, 16.45660997490453, 16.54655844363172, 16.636694742561087, 16.727015456598043, 16.817520585742592, 16.90821012999473, 16.999082381807163, 17.090137341179894, 17.181375008112926, 17.27279196751167, 17.364389926923415, 17.456165471253584, 17.548120308049466, 17.640251022216475, 17.732557613754615, 17.825038375116588, 17.917693306302393, 18.010520699764747, 18.103518847956348, 18.196686043329905, 18.29002228588542, 18.38352416052831, 18.477193374805868, 18.57102480607621, 18.665020161886634, 18.759174319595257, 18.85348898674938, 18.947962455801704, 19.04258960411035, 19.13737213922262, 19.232304938496625, 19.327389709479668, 19.42262132952986, 19.517999798647214, 19.613521701737135, 19.709185331252332, 19.804988979645515, 19.9009292318221, 19.997006087782083, 20.09321442488359, 20.189552535579327, 20.28601700477471, 20.382607832469738, 20.479319896022535, 20.576153195433097, 20.67310090051226, 20.770163011260017, 20.86733611258179, 20.964615081835696, 21.061999919021737, 21.159485501498036, 21.25706841417001, 21.354746949490362, 21.452515984817214, 21.550372105055988, 21.648311895112094, 21.746331939890947, 21.844428824297964, 21.942597425691265, 22.040834328976263, 22.13913611905838, 22.237497673295735, 22.335913869046447, 22.43438299876323, 22.5328999398042, 22.63145786198019, 22.73005335019662, 22.828682989358896, 22.92733994927785, 23.026020814858903, 23.12472046346017, 23.223433772439783, 23.322153911608563, 23.420875758324634, 23.519595897493414, 23.618305791378436, 23.717003732432413, 23.81567947537159, 23.914331312648667, 24.01295070652719, 24.111530826817983, 24.210066550879173, 24.308552756068877, 24.406982612197933, 24.505347581529872, 24.603640833875524, 24.701858954140306, 24.799991697040465, 24.89803393993412, 24.99597714508481, 25.093814482303365, 25.191539121400616, 25.2891425246401, 25.386617861832644, 25.483956595241786, 25.58115018713107, 25.67819351485861, 25.775076333140657, 25.871790104240745, 25.96832629042241, 26.06467806149649, 26.160835172179222, 26.256789084734145, 26.352531261424797, 26.448053164514718, 26.543344548720153, 26.638396876304636, 26.733199901984413, 26.827743380475727, 26.922020481589414, 27.016019252494424, 27.10973115545429, 27.203145945185263, 27.29625166885629, 27.389039788730916, 27.481500059525377, 27.573620528408632, 27.665392657644215, 27.75680278685379, 27.84784408584818, 27.93850289424905, 28.028767259225354, 28.11862864304063, 28.208075092863822, 28.29709465586389, 28.385675379209786, 28.473807017617755, 28.561475910709454, 28.648671813201126, 28.735384479809024, 28.82159854260751, 28.90730375631283, 28.992486460546644, 29.077136410025197, 29.161243359464734, 29.24479023339233, 29.32776678652423, 29.410159358482094, 29.491957703982166, 29.57314816264611, 29.653720489190164, 29.733654193046824, 29.812945859121502, 29.89157499684669, 29.969534776033214, 30.04680812120815, 30.12338478708775, 30.199251113293666, 30.274393439447564, 30.34880152026568, 30.422458280275098, 30.495350059097476, 30.56747002654364, 30.638797692046083, 30.709326225415634, 30.779041966273955, 30.84792783914812, 30.91597359875437, 30.98316558471437, 31.049493551744366, 31.11494383946601, 31.179499372406386, 31.243149905281737, 31.305885192808304, 31.36769157460775, 31.428558805396317, 31.4884663946065, 31.54741092714371, 31.60537532753502, 31.662349350496683, 31.71832275074494, 31.77327845280686, 31.827209626493282, 31.880102611425862, 31.931947162320842, 31.982729618799887, 32.03243973557924, 32.08107068246973, 32.12860538399843, 32.1750335948816, 32.22035190002463, 32.26453980886003, 32.30759732138779, 32.349507362134986, 32.390263100912456, 32.42985429243643, 32.468274106517754, 32.50550888277808, 32.54155520612282, 32.57639941617364, 32.610038097835954, 32.64245759073142, 32.67365447976545, 32.7036185196543, 32.73234629530337, 32.75982756142892, 32.786055487841764, 32.81102324435275, 32.83472741586728, 32.8571577571016, 32.87831426805571, 32.89819011854045, 32.916775063272055, 32.934072517345115, 32.95006882038128, 32.96477080256974, 32.97816480353213, 32.99025423836305, 33.00103227687333, 33.010495503968386, 33.01864391964821, 33.02547410881822, 33.030986071478424, 33.035176392534225, 33.038045071985636, 33.03959210983264, 33.03981409098066, 33.038714430524294, 33.03628971336894, 33.0325399395146, 33.02747193915045, 33.021082297181906, 33.01337442870354, 33.00434833371538, 32.99400401221739, 32.98235170949335, 32.96938801044866, 32.95511633017792, 32.93954349887029, 32.92266951652578, 32.904501213333546, 32.885042004388175, 32.864298719878846, 32.84227135980556, 32.81897016945206, 32.794401979007525, 32.76856678847195, 32.74147142803451, 32.71312955807354, 32.683541178589046, 32.65271311977019, 32.620659041995324, 32.58737894526443, 32.552886489955874, 32.5171885062588, 32.48029182436239, 32.442203274455814, 32.402936516917414, 32.36249838193635, 32.3208956997018, 32.27814213059211, 32.23424791989102, 32.189216482693126, 32.14306489447135, 32.095799985414864, 32.047435415902, 31.99797801612194, 31.94743803135843, 31.8958325370844, 31.84316494839443, 31.78945234076145, 31.734704959469212, 31.678933049801476, 31.622150272136572, 31.564366871758267, 31.505596509044892, 31.445849429280205, 31.385139292842545, 31.32347634501567, 31.26087424617792, 31.19734665670763, 31.132907236983147, 31.067562817193632, 31.001333887906604, 30.93422727931123, 30.866256651785847, 30.7974356657088, 30.727777981458424, 30.657297259413063, 30.586007159951055, 30.51391451326157, 30.44103980991212, 30.36738988009187, 30.292981799273754, 30.217829227836102, 30.141942411062676, 30.06533500933181, 29.988020683021855, 29.91001309251114, 29.831322483083422, 29.75196593021163, 29.671950264084927, 29.59129597527083, 29.510006478863925, 29.428105680526304, 29.345596995352548, 29.262494083721005, 29.17881743619918, 29.094570467881656, 29.009770254241364, 28.92442704056205, 28.838554487222066, 28.75216283950516, 28.66526917288426, 28.57788031754853, 28.490009933876316, 28.401669974698663, 28.312870685299327, 28.22362743360394, 28.133948757348968, 28.043846609365453, 27.953332942484444, 27.862419709536987, 27.77111544825955, 27.679433819030468, 27.5873850671335, 27.494979437852397, 27.402228884018207, 27.309141943367397, 27.21573056873101, 27.122005005392804, 27.02797549863653, 26.933652293745947, 26.839043928457514, 26.74416235560228, 26.649016112916712, 26.55361544568456, 26.45797059918958, 26.362088403620938, 26.26598081180969, 26.169654653945, 26.07312188285792, 25.97638762119032, 25.879463821773253, 25.782359022343183, 25.68507834554198, 25.587635451747996, 25.490033756055805, 25.39228350374917, 25.294393232564545, 25.196369772691106, 25.098221661865317, 24.999957437823635, 24.901582223207942, 24.8031045557547, 24.70453297320037, 24.605872598186824, 24.507130260903242, 24.408316206633376, 24.30943385047181, 24.210491730155006, 24.11149496832484, 24.012452102717777, 23.913368255975694, 23.81424855074047, 23.715099817201274, 23.615928885547273, 23.51674258596764, 23.41754433355696, 23.31833925095711, 23.219135875904552, 23.119939331041163, 23.02075132391424, 22.92158209980753, 22.822433366268335, 22.723310245938524, 22.62421956900727, 22.52516304302187, 22.42614920571878, 22.327181472192585, 22.228263257537876, 22.129399684396528, 22.03059416786312, 21.93185183057954, 21.83317779518766, 21.73457376923477, 21.636046582910044, 21.537597943760773, 21.439231266881542, 21.340951674914226, 21.24276429050071, 21.144669113640987, 21.046671266976936, 20.948774165603144, 20.850981224614195, 20.75329585910467, 20.65571977662187, 20.558258099807663, 20.46091082866206, 20.36368479337422, 20.26657999394415, 20.16959984546643, 20.072747763035647, 19.976025454199096, 19.879436334051363, 19.782982110139734, 19.686664490011506, 19.590488596308557, 19.494452721483594, 19.398561988178493, 19.302818103940545, 19.207222776317046, 19.11177771285529, 19.016486328649854, 18.921348623700748, 18.826368013102552, 18.731544496855264, 18.636881490053472, 18.54238070024447, 18.448042127428252, 18.353867479152118, 18.259860170510645, 18.166021909051132, 18.072350987226287, 17.978852527677983, 17.885524822858926, 17.79237128786371, 17.699390215145034, 17.606586727344776, 17.513959116915647, 17.421510798952234, 17.32924006590724, 17.23715033287525, 17.145241599856266, 17.053513866850288, 16.961968841404605, 16.870608231066516, 16.779433743383308, 16.6884419632604, 16.59763801333966, 16.50702018607381, 16.416590189010133, 16.326348022148633, 16.236295393036603, 16.146432301674036, 16.05675874806094, 15.967274732197309, 15.87798196163044, 15.788882143907623, 15.699973571481568, 15.61125624435227, 15.522740407803491, 15.434347514659772, 15.346133913981763, 15.258109851053225, 15.170275325874153, 15.082630338444549, 14.995176596311707, 14.907912391928331, 14.820839432841716, 14.733956011504569, 14.647263835464182, 14.560762904720555, 14.474480540030369, 14.388457722528644, 14.302631272965556, 14.217000337567459, 14.13156406256071, 14.046322447945304, 13.96127634749489, 13.876425761209468, 13.791770689089038, 13.707309423586306, 13.623044526022213, 13.538973435075818, 13.455097858294415, 13.371416088130712, 13.287928978358353, 13.204636528977339, 13.121537886214027, 13.03863305006841, 12.955922874314142, 12.873404797630279, 12.791081381337762, 12.708950064115651, 12.627011699737594, 12.545266288203587, 12.46371297573999, 12.382351762346797, 12.301182648024012, 12.220203925224341, 12.139417301495076, 12.058821069288927, 11.97841522860589, 11.898199779445967, 11.818173868035514, 11.738337494374527, 11.658690658463007, 11.57923250652731, 11.49996218479379, 11.420880547036088, 11.341985885706917, 11.263279054579922, 11.18475834610781, 11.106424614064226, 11.028277004675525, 10.95031466416806, 10.87253844631548, 10.794945789796841, 10.717538402159441, 10.640314575855983, 10.563275164660118, 10.486417607250903, 10.409743611175632, 10.333251468887013, 10.256941180385045, 10.18081274566973, 10.104864457193774, 10.029097168730821, 9.95351002650723, 9.87810217674935, 9.802873619457182, 9.727823500857083, 9.652951820949049, 9.578258579733083, 9.50374206966189, 9.42940229073547, 9.355239242953827, 9.281252072543309, 9.207439925730274, 9.133803656288366, 9.060341556670295, 8.987053626876058, 8.913939866905656, 8.840998569211797, 8.768231441341774, 8.695635921974647, 8.623212011110416, 8.550959708749083, 8.478879014890646, 8.406968221987814, 8.33522818381423, 8.263658046596252, 8.19225695656023, 8.121024913706169, 8.049961064260417, 7.979066261996623, 7.908337945593849, 7.837777822599386, 7.767384185465942, 7.697157034193517, 7.627095515008465, 7.557200481684432, 7.487470226674126, 7.417904749977546, 7.348504051594692, 7.279267277751919, 7.210195282222873, 7.141285930573438, 7.072539649690436, 7.0039564395738685, 6.935535446450089, 6.86727709720592, 6.799180111180893, 6.731244488375007, 6.663470228788263, 6.595856905533838, 6.528404091724908, 6.461111360474649, 6.393978711783063, 6.32700614565015, 6.2601928083022615, 6.193539126626223, 6.127043819961564, 6.060707742081931, 5.9945304661005006, 5.928511565130449, 5.8626506122849555, 5.796947607564018, 5.73140297785446, 5.666015869382635, 5.600785855261721, 5.535713789265363, 5.470798817619916, 5.406040940325378, 5.341440584268574, 5.276996895675858, 5.212710728320875, 5.148580801543156, 5.08460839600317, 5.020792657927272, 4.95713358731546, 4.893632037941383, 4.830287156031392, 4.7670989415854885, 4.704068248377318, 4.641194649520058, 4.578478571900532, 4.515919588631916, 4.453518553487856, 4.391302787225033, 4.329218502103733, 4.267292591993812, 4.205525056895271, 4.143916323694933, 4.0824663923927975, 4.021176116762511, 3.960045496804074, 3.899074532517486, 3.838264504563216, 3.7776149860544415, 3.717126830764809, 3.6568008924679636, 3.5966367442770832, 3.5366356668526366, 3.476797873638036, 3.4171240049635156, 3.35761470115931, 3.2982708159990657, 3.2390929898130176, 3.180081649487988, 3.121237862241036, 3.062562268402395, 3.0040557217457122, 2.945719289488045, 2.887553611959628, 2.8295599698209304, 2.7717390034021876, 2.7140919933638683, 2.656620006923031, 2.599323897853321, 2.54220516025862, 2.485264647912574, 2.4285040683624755, 2.3719244888253823, 2.315527189961764, 2.2593134524320897, 2.2032851972270637, 2.1474432781203316, 2.09178982954601, 2.036325918721156, 1.9810534666364743, 1.9259741808392568, 1.8710897688767962, 1.816401938296385, 1.7619125033670215, 1.7076233850794098, 1.653536504424254, 1.599653889113964, 1.5459775668609494, 1.4925095653776201, 1.439252125819798, 1.386207275899892, 1.3333772567737243, 1.2807644163188219, 1.228371102412712, 1.17619944948951, 1.1242521255918607, 1.0725312651538796, 1.0210396429399171, 0.9697795001057945, 0.9187533979724507, 0.8679640045825301, 0.8174137745352656, 0.7671053225124492, 0.7170412631958722, 0.6672241579064735, 0.6176567280477505, 0.5683414282189362, 0.5192809264626751, 0.4704778908216117, 0.4219347225341261, 0.37365406296243653, 0.3256383400253493, 0.27789006168295044, 0.23041162917362, 0.18320531033360576, 0.13627341301979531, 0.089618145037477, 0.043241537434113964], [datetime.datetime(2018, 4, 3, 11, 31, 12, 13216), datetime.datetime(2018, 4, 3, 11, 31, 13, 13215), datetime.datetime(2018, 4, 3, 11, 31, 14, 13214), datetime.datetime(2018, 4, 3, 11, 31, 15, 13213), datetime.datetime(2018, 4, 3, 11, 31, 16, 13212), datetime.datetime(2018, 4, 3, 11, 31, 17, 13212), datetime.datetime(2018, 4, 3, 11, 31, 18, 13211), datetime.datetime(2018, 4, 3, 11, 31, 19, 13210), datetime.datetime(2018, 4, 3, 11, 31, 20, 13210), datetime.datetime(2018, 4, 3, 11, 31, 21, 13210), datetime.datetime(2018, 4, 3, 11, 31, 22, 13210), datetime.datetime(2018, 4, 3, 11, 31, 23, 13210), datetime.datetime(2018, 4, 3, 11, 31, 24, 13210), datetime.datetime(2018, 4, 3, 11, 31, 25, 13210), datetime.datetime(2018, 4, 3, 11, 31, 26, 13210), datetime.datetime(2018, 4, 3, 11, 31, 27, 13210), datetime.datetime(2018, 4, 3, 11, 31, 28, 13210), datetime.datetime(2018, 4, 3, 11, 31, 29, 13210), datetime.datetime(2018, 4, 3, 11, 31, 30, 13210), datetime.datetime(2018, 4, 3, 11, 31, 31, 13209), datetime.datetime(2018, 4, 3, 11, 31, 32, 13208), datetime.datetime(2018, 4, 3, 11, 31, 33, 13207), datetime.datetime(2018, 4, 3, 11, 31, 34, 13206), datetime.datetime(2018, 4, 3, 11, 31, 35, 13205), datetime.datetime(2018, 4, 3, 11, 31, 36, 13205), datetime.datetime(2018, 4, 3, 11, 31, 37, 13205), datetime.datetime(2018, 4, 3, 11, 31, 38, 13205), datetime.datetime(2018, 4, 3, 11, 31, 39, 13204), datetime.datetime(2018, 4, 3, 11, 31, 40, 13203), datetime.datetime(2018, 4, 3, 11, 31, 41, 13202), datetime.datetime(2018, 4, 3, 11, 31, 42, 13201), datetime.datetime(2018, 4, 3, 11, 31, 43, 13200), datetime.datetime(2018, 4, 3, 11, 31, 44, 13200), datetime.datetime(2018, 4, 3, 11, 31, 45, 13200), datetime.datetime(2018, 4, 3, 11, 31, 46, 13200), datetime.datetime(2018, 4, 3, 11, 31, 47, 13200), datetime.datetime(2018, 4, 3, 11, 31, 48, 13200), datetime.datetime(2018, 4, 3, 11, 31, 49, 13200), datetime.datetime(2018, 4, 3, 11, 31, 50, 13199), datetime.datetime(2018, 4, 3, 11, 31, 51, 13198), datetime.datetime(2018, 4, 3, 11, 31, 52, 13197), datetime.datetime(2018, 4, 3, 11, 31, 53, 13196), datetime.datetime(2018, 4, 3, 11, 31, 54, 13195), datetime.datetime(2018, 4, 3, 11, 31, 55, 13195), datetime.datetime(2018, 4, 3, 11, 31, 56, 13195), datetime.datetime(2018, 4, 3, 11, 31, 57, 13195), datetime.datetime(2018, 4, 3, 11, 31, 58, 13194), datetime.datetime(2018, 4, 3, 11, 31, 59, 13193), datetime.datetime(2018, 4, 3, 11, 32, 0, 13192), datetime.datetime(2018, 4, 3, 11, 32, 1, 13192), datetime.datetime(2018, 4, 3, 11, 32, 2, 13192), datetime.datetime(2018, 4, 3, 11, 32, 3, 13192), datetime.datetime(2018, 4, 3, 11, 32, 4, 13192), datetime.datetime(2018, 4, 3, 11, 32, 5, 13192), datetime.datetime(2018, 4, 3, 11, 32, 6, 13192), datetime.datetime(2018, 4, 3, 11, 32, 7, 13191), datetime.datetime(2018, 4, 3, 11, 32, 8, 13190), datetime.datetime(2018, 4, 3, 11, 32, 9, 13190), datetime.datetime(2018, 4, 3, 11, 32, 10, 13190), datetime.datetime(2018, 4, 3, 11, 32, 11, 13190), datetime.datetime(2018, 4, 3, 11, 32, 12, 13190), datetime.datetime(2018, 4, 3, 11, 32, 13, 13190), datetime.datetime(2018, 4, 3, 11, 32, 14, 13190), datetime.datetime(2018, 4, 3, 11, 32, 15, 13190), datetime.datetime(2018, 4, 3, 11, 32, 16, 13190), datetime.datetime(2018, 4, 3, 11, 32, 17, 13190), datetime.datetime(2018, 4, 3, 11, 32, 18, 13190), datetime.datetime(2018, 4, 3, 11, 32, 19, 13190), datetime.datetime(2018, 4, 3, 11, 32, 20, 13190), datetime.datetime(2018, 4, 3, 11, 32, 21, 13190), datetime.datetime(2018, 4, 3, 11, 32, 22, 13190), datetime.datetime(2018, 4, 3, 11, 32, 23, 13190), datetime.datetime(2018, 4, 3, 11, 32, 24, 13190), datetime.datetime(2018, 4, 3, 11, 32, 25, 13190), datetime.datetime(2018, 4, 3, 11, 32, 26, 13190), datetime.datetime(2018, 4, 3, 11, 32, 27, 13190), datetime.datetime(2018, 4, 3, 11, 32, 28, 13190), datetime.datetime(2018, 4, 3, 11, 32, 29, 13190), datetime.datetime(2018, 4, 3, 11, 32, 30, 13190), datetime.datetime(2018, 4, 3, 11, 32, 31, 13190), datetime.datetime(2018, 4, 3, 11, 32, 32, 13190), datetime.datetime(2018, 4, 3, 11, 32, 33, 13190), datetime.datetime(2018, 4, 3, 11, 32, 34, 13190), datetime.datetime(2018, 4, 3, 11, 32, 35, 13190), datetime.datetime(2018, 4, 3, 11, 32, 36, 13190), datetime.datetime(2018, 4, 3, 11, 32, 37, 13190), datetime.datetime(2018, 4, 3, 11, 32, 38, 13190), datetime.datetime(2018, 4, 3, 11, 32, 39, 13190), datetime.datetime(2018, 4, 3, 11, 32, 40, 13190), datetime.datetime(2018, 4, 3, 11, 32, 41, 13190), datetime.datetime(2018, 4, 3, 11, 32, 42, 13190), datetime.datetime(2018, 4, 3, 11, 32, 43, 13190), datetime.datetime(2018, 4, 3, 11, 32, 44, 13190), datetime.datetime(2018, 4, 3, 11, 32, 45, 13190), datetime.datetime(2018, 4, 3, 11, 32, 46, 13190), datetime.datetime(2018, 4, 3, 11, 32, 47, 13190), datetime.datetime(2018, 4, 3, 11, 32, 48, 13190), datetime.datetime(2018, 4, 3, 11, 32, 49, 13190), datetime.datetime(2018, 4, 3, 11, 32, 50, 13190), datetime.datetime(2018, 4, 3, 11, 32, 51, 13190), datetime.datetime(2018, 4, 3, 11, 32, 52, 13190), datetime.datetime(2018, 4, 3, 11, 32, 53, 13190), datetime.datetime(2018, 4, 3, 11, 32, 54, 13190), datetime.datetime(2018, 4, 3, 11, 32, 55, 13190), datetime.datetime(2018, 4, 3, 11, 32, 56, 13190), datetime.datetime(2018, 4, 3, 11, 32, 57, 13190), datetime.datetime(2018, 4, 3, 11, 32, 58, 13190), datetime.datetime(2018, 4, 3, 11, 32, 59, 13190), datetime.datetime(2018, 4, 3, 11, 33, 0, 13190), datetime.datetime(2018, 4, 3, 11, 33, 1, 13190), datetime.datetime(2018, 4, 3, 11, 33, 2, 13190), datetime.datetime(2018, 4, 3, 11, 33, 3, 13190), datetime.datetime(2018, 4, 3, 11, 33, 4, 13190), datetime.datetime(2018, 4, 3, 11, 33, 5, 13190), datetime.datetime(2018, 4, 3, 11, 33, 6, 13190), datetime.datetime(2018, 4, 3, 11, 33, 7, 13190), datetime.datetime(2018, 4, 3, 11, 33, 8, 13190), datetime.datetime(2018, 4, 3, 11, 33, 9, 13190), datetime.datetime(2018, 4, 3, 11, 33, 10, 13190), datetime.datetime(2018, 4, 3, 11, 33, 11, 13190), datetime.datetime(2018, 4, 3, 11, 33, 12, 13190), datetime.datetime(2018, 4, 3, 11, 33, 13, 13190), datetime.datetime(2018, 4, 3, 11, 33, 14, 13190), datetime.datetime(2018, 4, 3, 11, 33, 15, 13190), datetime.datetime(2018, 4, 3, 11, 33, 16, 13190), datetime.datetime(2018, 4, 3, 11, 33, 17, 13190), datetime.datetime(2018, 4, 3, 11, 33, 18, 13190), datetime.datetime(2018, 4, 3, 11, 33, 19, 13190), datetime.datetime(2018, 4, 3, 11, 33, 20, 13190), datetime.datetime(2018, 4, 3, 11, 33, 21, 13190), datetime.datetime(2018, 4, 3, 11, 33, 22, 13190), datetime.datetime(2018, 4, 3, 11, 33, 23, 13190), datetime.datetime(2018, 4, 3, 11, 33, 24, 13190), datetime.datetime(2018, 4, 3, 11, 33, 25, 13190), datetime.datetime(2018, 4, 3, 11, 33, 26, 13190), datetime.datetime(2018, 4, 3, 11, 33, 27, 13190), datetime.datetime(2018, 4, 3, 11, 33, 28, 13190), datetime.datetime(2018, 4, 3, 11, 33, 29, 13190), datetime.datetime(2018, 4, 3, 11, 33, 30, 13190), datetime.datetime(2018, 4, 3, 11, 33, 31, 13190), datetime.datetime(2018, 4, 3, 11, 33, 32, 13190), datetime.datetime(2018, 4, 3, 11, 33, 33, 13190), datetime.datetime(2018, 4, 3, 11, 33, 34, 13190), datetime.datetime(2018, 4, 3, 11, 33, 35, 13190), datetime.datetime(2018, 4, 3, 11, 33, 36, 13190), datetime.datetime(2018, 4, 3, 11, 33, 37, 13190), datetime.datetime(2018, 4, 3, 11, 33, 38, 13190), datetime.datetime(2018, 4, 3, 11, 33, 39, 13190), datetime.datetime(2018, 4, 3, 11, 33, 40, 13190), datetime.datetime(2018, 4, 3, 11, 33, 41, 13190), datetime.datetime(2018, 4, 3, 11, 33, 42, 13190), datetime.datetime(2018, 4, 3, 11, 33, 43, 13190), datetime.datetime(2018, 4, 3, 11, 33, 44, 13190), datetime.datetime(2018, 4, 3, 11, 33, 45, 13190), datetime.datetime(2018, 4, 3, 11, 33, 46, 13190), datetime.datetime(2018, 4, 3, 11, 33, 47, 13190), datetime.datetime(2018, 4, 3, 11, 33, 48, 13190), datetime.datetime(2018, 4, 3, 11, 33, 49, 13190), datetime.datetime(2018, 4, 3, 11, 33, 50, 13190), datetime.datetime(2018, 4, 3, 11, 33, 51, 13190), datetime.datetime(2018, 4, 3, 11, 33, 52, 13190), datetime.datetime(2018, 4, 3, 11, 33, 53, 13190), datetime.datetime(2018, 4, 3, 11, 33, 54, 13190), datetime.datetime(2018, 4, 3, 11, 33, 55, 13190), datetime.datetime(2018, 4, 3, 11, 33, 56, 13190), datetime.datetime(2018, 4, 3, 11, 33, 57, 13190), datetime.datetime(2018, 4, 3, 11, 33, 58, 13190), datetime.datetime(2018, 4, 3, 11, 33, 59, 13190), datetime.datetime(2018, 4, 3, 11, 34, 0, 13190), datetime.datetime(2018, 4, 3, 11, 34, 1, 13190), datetime.datetime(2018, 4, 3, 11, 34, 2, 13189), datetime.datetime(2018, 4, 3, 11, 34, 3, 13188), datetime.datetime(2018, 4, 3, 11, 34, 4, 13188), datetime.datetime(2018, 4, 3, 11, 34, 5, 13188), datetime.datetime(2018, 4, 3, 11, 34, 6, 13188), datetime.datetime(2018, 4, 3, 11, 34, 7, 13187), datetime.datetime(2018, 4, 3, 11, 34, 8, 13186), datetime.datetime(2018, 4, 3, 11, 34, 9, 13185), datetime.datetime(2018, 4, 3, 11, 34, 10, 13184), datetime.datetime(2018, 4, 3, 11, 34, 11, 13183), datetime.datetime(2018, 4, 3, 11, 34, 12, 13183), datetime.datetime(2018, 4, 3, 11, 34, 13, 13183), datetime.datetime(2018, 4, 3, 11, 34, 14, 13183), datetime.datetime(2018, 4, 3, 11, 34, 15, 13182), datetime.datetime(2018, 4, 3, 11, 34, 16, 13181), datetime.datetime(2018, 4, 3, 11, 34, 17, 13180), datetime.datetime(2018, 4, 3, 11, 34, 18, 13179), datetime.datetime(2018, 4, 3, 11, 34, 19, 13178), datetime.datetime(2018, 4, 3, 11, 34, 20, 13178), datetime.datetime(2018, 4, 3, 11, 34, 21, 13178), datetime.datetime(2018, 4, 3, 11, 34, 22, 13178), datetime.datetime(2018, 4, 3, 11, 34, 23, 13177), datetime.datetime(2018, 4, 3, 11, 34, 24, 13176), datetime.datetime(2018, 4, 3, 11, 34, 25, 13175), datetime.datetime(2018, 4, 3, 11, 34, 26, 13174), datetime.datetime(2018, 4, 3, 11, 34, 27, 13173), datetime.datetime(2018, 4, 3, 11, 34, 28, 13173), datetime.datetime(2018, 4, 3, 11, 34, 29, 13173), datetime.datetime(2018, 4, 3, 11, 34, 30, 13173), datetime.datetime(2018, 4, 3, 11, 34, 31, 13172), datetime.datetime(2018, 4, 3, 11, 34, 32, 13171), datetime.datetime(2018, 4, 3, 11, 34, 33, 13170), datetime.datetime(2018, 4, 3, 11, 34, 34, 13169), datetime.datetime(2018, 4, 3, 11, 34, 35, 13168), datetime.datetime(2018, 4, 3, 11, 34, 36, 13168), datetime.datetime(2018, 4, 3, 11, 34, 37, 13167), datetime.datetime(2018, 4, 3, 11, 34, 38, 13166), datetime.datetime(2018, 4, 3, 11, 34, 39, 13165), datetime.datetime(2018, 4, 3, 11, 34, 40, 13164), datetime.datetime(2018, 4, 3, 11, 34, 41, 13163), datetime.datetime(2018, 4, 3, 11, 34, 42, 13162), datetime.datetime(2018, 4, 3, 11, 34, 43, 13161), datetime.datetime(2018, 4, 3, 11, 34, 44, 13161), datetime.datetime(2018, 4, 3, 11, 34, 45, 13161), datetime.datetime(2018, 4, 3, 11, 34, 46, 13161), datetime.datetime(2018, 4, 3, 11, 34, 47, 13161), datetime.datetime(2018, 4, 3, 11, 34, 48, 13161), datetime.datetime(2018, 4, 3, 11, 34, 49, 13161), datetime.datetime(2018, 4, 3, 11, 34, 50, 13160), datetime.datetime(2018, 4, 3, 11, 34, 51, 13159), datetime.datetime(2018, 4, 3, 11, 34, 52, 13158), datetime.datetime(2018, 4, 3, 11, 34, 53, 13157), datetime.datetime(2018, 4, 3, 11, 34, 54, 13156), datetime.datetime(2018, 4, 3, 11, 34, 55, 13156), datetime.datetime(2018, 4, 3, 11, 34, 56, 13156), datetime.datetime(2018, 4, 3, 11, 34, 57, 13156), datetime.datetime(2018, 4, 3, 11, 34, 58, 13155), datetime.datetime(2018, 4, 3, 11, 34, 59, 13154), datetime.datetime(2018, 4, 3, 11, 35, 0, 13153), datetime.datetime(2018, 4, 3, 11, 35, 1, 13153), datetime.datetime(2018, 4, 3, 11, 35, 2, 13153), datetime.datetime(2018, 4, 3, 11, 35, 3, 13153), datetime.datetime(2018, 4, 3, 11, 35, 4, 13153), datetime.datetime(2018, 4, 3, 11, 35, 5, 13153), datetime.datetime(2018, 4, 3, 11, 35, 6, 13153), datetime.datetime(2018, 4, 3, 11, 35, 7, 13152), datetime.datetime(2018, 4, 3, 11, 35, 8, 13151), datetime.datetime(2018, 4, 3, 11, 35, 9, 13151), datetime.datetime(2018, 4, 3, 11, 35, 10, 13151), datetime.datetime(2018, 4, 3, 11, 35, 11, 13151), datetime.datetime(2018, 4, 3, 11, 35, 12, 13151), datetime.datetime(2018, 4, 3, 11, 35, 13, 13151), datetime.datetime(2018, 4, 3, 11, 35, 14, 13151), datetime.datetime(2018, 4, 3, 11, 35, 15, 13151), datetime.datetime(2018, 4, 3, 11, 35, 16, 13151), datetime.datetime(2018, 4, 3, 11, 35, 17, 13151), datetime.datetime(2018, 4, 3, 11, 35, 18, 13151), datetime.datetime(2018, 4, 3, 11, 35, 19, 13151), datetime.datetime(2018, 4, 3, 11, 35, 20, 13151), datetime.datetime(2018, 4, 3, 11, 35, 21, 13151), datetime.datetime(2018, 4, 3, 11, 35, 22, 13151), datetime.datetime(2018, 4, 3, 11, 35, 23, 13151), datetime.datetime(2018, 4, 3, 11, 35, 24, 13151), datetime.datetime(2018, 4, 3, 11, 35, 25, 13151), datetime.datetime(2018, 4, 3, 11, 35, 26, 13151), datetime.datetime(2018, 4, 3, 11, 35, 27, 13151), datetime.datetime(2018, 4, 3, 11, 35, 28, 13151), datetime.datetime(2018, 4, 3, 11, 35, 29, 13151), datetime.datetime(2018, 4, 3, 11, 35, 30, 13151), datetime.datetime(2018, 4, 3, 11, 35, 31, 13151), datetime.datetime(2018, 4, 3, 11, 35, 32, 13151), datetime.datetime(2018, 4, 3, 11, 35, 33, 13151), datetime.datetime(2018, 4, 3, 11, 35, 34, 13151), datetime.datetime(2018, 4, 3, 11, 35, 35, 13151), datetime.datetime(2018, 4, 3, 11, 35, 36, 13151), datetime.datetime(2018, 4, 3, 11, 35, 37, 13151), datetime.datetime(2018, 4, 3, 11, 35, 38, 13151), datetime.datetime(2018, 4, 3, 11, 35, 39, 13151), datetime.datetime(2018, 4, 3, 11, 35, 40, 13151), datetime.datetime(2018, 4, 3, 11, 35, 41, 13151), datetime.datetime(2018, 4, 3, 11, 35, 42, 13151), datetime.datetime(2018, 4, 3, 11, 35, 43, 13151), datetime.datetime(2018, 4, 3, 11, 35, 44, 13151), datetime.datetime(2018, 4, 3, 11, 35, 45, 13151), datetime.datetime(2018, 4, 3, 11, 35, 46, 13151), datetime.datetime(2018, 4, 3, 11, 35, 47, 13151), datetime.datetime(2018, 4, 3, 11, 35, 48, 13151), datetime.datetime(2018, 4, 3, 11, 35, 49, 13151), datetime.datetime(2018, 4, 3, 11, 35, 50, 13151), datetime.datetime(2018, 4, 3, 11, 35, 51, 13151), datetime.datetime(2018, 4, 3, 11, 35, 52, 13151), datetime.datetime(2018, 4, 3, 11, 35, 53, 13151), datetime.datetime(2018, 4, 3, 11, 35, 54, 13151), datetime.datetime(2018, 4, 3, 11, 35, 55, 13151), datetime.datetime(2018, 4, 3, 11, 35, 56, 13151), datetime.datetime(2018, 4, 3, 11, 35, 57, 13151), datetime.datetime(2018, 4, 3, 11, 35, 58, 13151), datetime.datetime(2018, 4, 3, 11, 35, 59, 13151), datetime.datetime(2018, 4, 3, 11, 36, 0, 13151), datetime.datetime(2018, 4, 3, 11, 36, 1, 13151), datetime.datetime(2018, 4, 3, 11, 36, 2, 13151), datetime.datetime(2018, 4, 3, 11, 36, 3, 13151), datetime.datetime(2018, 4, 3, 11, 36, 4, 13151), datetime.datetime(2018, 4, 3, 11, 36, 5, 13151), datetime.datetime(2018, 4, 3, 11, 36, 6, 13151), datetime.datetime(2018, 4, 3, 11, 36, 7, 13151), datetime.datetime(2018, 4, 3, 11, 36, 8, 13151), datetime.datetime(2018, 4, 3, 11, 36, 9, 13151), datetime.datetime(2018, 4, 3, 11, 36, 10, 13151), datetime.datetime(2018, 4, 3, 11, 36, 11, 13151), datetime.datetime(2018, 4, 3, 11, 36, 12, 13151), datetime.datetime(2018, 4, 3, 11, 36, 13, 13151), datetime.datetime(2018, 4, 3, 11, 36, 14, 13151), datetime.datetime(2018, 4, 3, 11, 36, 15, 13151), datetime.datetime(2018, 4, 3, 11, 36, 16, 13151), datetime.datetime(2018, 4, 3, 11, 36, 17, 13151), datetime.datetime(2018, 4, 3, 11, 36, 18, 13151), datetime.datetime(2018, 4, 3, 11, 36, 19, 13151), datetime.datetime(2018, 4, 3, 11, 36, 20, 13151), datetime.datetime(2018, 4, 3, 11, 36, 21, 13151), datetime.datetime(2018, 4, 3, 11, 36, 22, 13151), datetime.datetime(2018, 4, 3, 11, 36, 23, 13151), datetime.datetime(2018, 4, 3, 11, 36, 24, 13151), datetime.datetime(2018, 4, 3, 11, 36, 25, 13151), datetime.datetime(2018, 4, 3, 11, 36, 26, 13151), datetime.datetime(2018, 4, 3, 11, 36, 27, 13151), datetime.datetime(2018, 4, 3, 11, 36, 28, 13151), datetime.datetime(2018, 4, 3, 11, 36, 29, 13151), datetime.datetime(2018, 4, 3, 11, 36, 30, 13151), datetime.datetime(2018, 4, 3, 11, 36, 31, 13151), datetime.datetime(2018, 4, 3, 11, 36, 32, 13151), datetime.datetime(2018, 4, 3, 11, 36, 33, 13151), datetime.datetime(2018, 4, 3, 11, 36, 34, 13151), datetime.datetime(2018, 4, 3, 11, 36, 35, 13151), datetime.datetime(2018, 4, 3, 11, 36, 36, 13151), datetime.datetime(2018, 4, 3, 11, 36, 37, 13151), datetime.datetime(2018, 4, 3, 11, 36, 38, 13151), datetime.datetime(2018, 4, 3, 11, 36, 39, 13151), datetime.datetime(2018, 4, 3, 11, 36, 40, 13151), datetime.datetime(2018, 4, 3, 11, 36, 41, 13151), datetime.datetime(2018, 4, 3, 11, 36, 42, 13151), datetime.datetime(2018, 4, 3, 11, 36, 43, 13151), datetime.datetime(2018, 4, 3, 11, 36, 44, 13151), datetime.datetime(2018, 4, 3, 11, 36, 45, 13151), datetime.datetime(2018, 4, 3, 11, 36, 46, 13151), datetime.datetime(2018, 4, 3, 11, 36, 47, 13151), datetime.datetime(2018, 4, 3, 11, 36, 48, 13151), datetime.datetime(2018, 4, 3, 11, 36, 49, 13151), datetime.datetime(2018, 4, 3, 11, 36, 50, 13151), datetime.datetime(2018, 4, 3, 11, 36, 51, 13151), datetime.datetime(2018, 4, 3, 11, 36, 52, 13151), datetime.datetime(2018, 4, 3, 11, 36, 53, 13151), datetime.datetime(2018, 4, 3, 11, 36, 54, 13151), datetime.datetime(2018, 4, 3, 11, 36, 55, 13151), datetime.datetime(2018, 4, 3, 11, 36, 56, 13151), datetime.datetime(2018, 4, 3, 11, 36, 57, 13151), datetime.datetime(2018, 4, 3, 11, 36, 58, 13151), datetime.datetime(2018, 4, 3, 11, 36, 59, 13151), datetime.datetime(2018, 4, 3, 11, 37, 0, 13151), datetime.datetime(2018, 4, 3, 11, 37, 1, 13151), datetime.datetime(2018, 4, 3, 11, 37, 2, 13150), datetime.datetime(2018, 4, 3, 11, 37, 3, 13149), datetime.datetime(2018, 4, 3, 11, 37, 4, 13148), datetime.datetime(2018, 4, 3, 11, 37, 5, 13147), datetime.datetime(2018, 4, 3, 11, 37, 6, 13146), datetime.datetime(2018, 4, 3, 11, 37, 7, 13145), datetime.datetime(2018, 4, 3, 11, 37, 8, 13144), datetime.datetime(2018, 4, 3, 11, 37, 9, 13144), datetime.datetime(2018, 4, 3, 11, 37, 10, 13144), datetime.datetime(2018, 4, 3, 11, 37, 11, 13144), datetime.datetime(2018, 4, 3, 11, 37, 12, 13144), datetime.datetime(2018, 4, 3, 11, 37, 13, 13144), datetime.datetime(2018, 4, 3, 11, 37, 14, 13144), datetime.datetime(2018, 4, 3, 11, 37, 15, 13143), datetime.datetime(2018, 4, 3, 11, 37, 16, 13142), datetime.datetime(2018, 4, 3, 11, 37, 17, 13141), datetime.datetime(2018, 4, 3, 11, 37, 18, 13140), datetime.datetime(2018, 4, 3, 11, 37, 19, 13139), datetime.datetime(2018, 4, 3, 11, 37, 20, 13139), datetime.datetime(2018, 4, 3, 11, 37, 21, 13139), datetime.datetime(2018, 4, 3, 11, 37, 22, 13139), datetime.datetime(2018, 4, 3, 11, 37, 23, 13138), datetime.datetime(2018, 4, 3, 11, 37, 24, 13137), datetime.datetime(2018, 4, 3, 11, 37, 25, 13136), datetime.datetime(2018, 4, 3, 11, 37, 26, 13135), datetime.datetime(2018, 4, 3, 11, 37, 27, 13134), datetime.datetime(2018, 4, 3, 11, 37, 28, 13134), datetime.datetime(2018, 4, 3, 11, 37, 29, 13133), datetime.datetime(2018, 4, 3, 11, 37, 30, 13132), datetime.datetime(2018, 4, 3, 11, 37, 31, 13131), datetime.datetime(2018, 4, 3, 11, 37, 32, 13130), datetime.datetime(2018, 4, 3, 11, 37, 33, 13129), datetime.datetime(2018, 4, 3, 11, 37, 34, 13128), datetime.datetime(2018, 4, 3, 11, 37, 35, 13127), datetime.datetime(2018, 4, 3, 11, 37, 36, 13126), datetime.datetime(2018, 4, 3, 11, 37, 37, 13125), datetime.datetime(2018, 4, 3, 11, 37, 38, 13124), datetime.datetime(2018, 4, 3, 11, 37, 39, 13123), datetime.datetime(2018, 4, 3, 11, 37, 40, 13122), datetime.datetime(2018, 4, 3, 11, 37, 41, 13122), datetime.datetime(2018, 4, 3, 11, 37, 42, 13121), datetime.datetime(2018, 4, 3, 11, 37, 43, 13120), datetime.datetime(2018, 4, 3, 11, 37, 44, 13119), datetime.datetime(2018, 4, 3, 11, 37, 45, 13118), datetime.datetime(2018, 4, 3, 11, 37, 46, 13117), datetime.datetime(2018, 4, 3, 11, 37, 47, 13117), datetime.datetime(2018, 4, 3, 11, 37, 48, 13117), datetime.datetime(2018, 4, 3, 11, 37, 49, 13117), datetime.datetime(2018, 4, 3, 11, 37, 50, 13116), datetime.datetime(2018, 4, 3, 11, 37, 51, 13115), datetime.datetime(2018, 4, 3, 11, 37, 52, 13114), datetime.datetime(2018, 4, 3, 11, 37, 53, 13113), datetime.datetime(2018, 4, 3, 11, 37, 54, 13112), datetime.datetime(2018, 4, 3, 11, 37, 55, 13112), datetime.datetime(2018, 4, 3, 11, 37, 56, 13112), datetime.datetime(2018, 4, 3, 11, 37, 57, 13112), datetime.datetime(2018, 4, 3, 11, 37, 58, 13111), datetime.datetime(2018, 4, 3, 11, 37, 59, 13110), datetime.datetime(2018, 4, 3, 11, 38, 0, 13109), datetime.datetime(2018, 4, 3, 11, 38, 1, 13109), datetime.datetime(2018, 4, 3, 11, 38, 2, 13109), datetime.datetime(2018, 4, 3, 11, 38, 3, 13109), datetime.datetime(2018, 4, 3, 11, 38, 4, 13109), datetime.datetime(2018, 4, 3, 11, 38, 5, 13109), datetime.datetime(2018, 4, 3, 11, 38, 6, 13109), datetime.datetime(2018, 4, 3, 11, 38, 7, 13108), datetime.datetime(2018, 4, 3, 11, 38, 8, 13107), datetime.datetime(2018, 4, 3, 11, 38, 9, 13107), datetime.datetime(2018, 4, 3, 11, 38, 10, 13107), datetime.datetime(2018, 4, 3, 11, 38, 11, 13107), datetime.datetime(2018, 4, 3, 11, 38, 12, 13107), datetime.datetime(2018, 4, 3, 11, 38, 13, 13107), datetime.datetime(2018, 4, 3, 11, 38, 14, 13107), datetime.datetime(2018, 4, 3, 11, 38, 15, 13107), datetime.datetime(2018, 4, 3, 11, 38, 16, 13107), datetime.datetime(2018, 4, 3, 11, 38, 17, 13107), datetime.datetime(2018, 4, 3, 11, 38, 18, 13107), datetime.datetime(2018, 4, 3, 11, 38, 19, 13107), datetime.datetime(2018, 4, 3, 11, 38, 20, 13107), datetime.datetime(2018, 4, 3, 11, 38, 21, 13107), datetime.datetime(2018, 4, 3, 11, 38, 22, 13107), datetime.datetime(2018, 4, 3, 11, 38, 23, 13107), datetime.datetime(2018, 4, 3, 11, 38, 24, 13107), datetime.datetime(2018, 4, 3, 11, 38, 25, 13107), datetime.datetime(2018, 4, 3, 11, 38, 26, 13107), datetime.datetime(2018, 4, 3, 11, 38, 27, 13107), datetime.datetime(2018, 4, 3, 11, 38, 28, 13107), datetime.datetime(2018, 4, 3, 11, 38, 29, 13107), datetime.datetime(2018, 4, 3, 11, 38, 30, 13107), datetime.datetime(2018, 4, 3, 11, 38, 31, 13107), datetime.datetime(2018, 4, 3, 11, 38, 32, 13107), datetime.datetime(2018, 4, 3, 11, 38, 33, 13107), datetime.datetime(2018, 4, 3, 11, 38, 34, 13107), datetime.datetime(2018, 4, 3, 11, 38, 35, 13107), datetime.datetime(2018, 4, 3, 11, 38, 36, 13107), datetime.datetime(2018, 4, 3, 11, 38, 37, 13107), datetime.datetime(2018, 4, 3, 11, 38, 38, 13107), datetime.datetime(2018, 4, 3, 11, 38, 39, 13106), datetime.datetime(2018, 4, 3, 11, 38, 40, 13105), datetime.datetime(2018, 4, 3, 11, 38, 41, 13104), datetime.datetime(2018, 4, 3, 11, 38, 42, 13103), datetime.datetime(2018, 4, 3, 11, 38, 43, 13102), datetime.datetime(2018, 4, 3, 11, 38, 44, 13102), datetime.datetime(2018, 4, 3, 11, 38, 45, 13102), datetime.datetime(2018, 4, 3, 11, 38, 46, 13102), datetime.datetime(2018, 4, 3, 11, 38, 47, 13102), datetime.datetime(2018, 4, 3, 11, 38, 48, 13102), datetime.datetime(2018, 4, 3, 11, 38, 49, 13102), datetime.datetime(2018, 4, 3, 11, 38, 50, 13102), datetime.datetime(2018, 4, 3, 11, 38, 51, 13102), datetime.datetime(2018, 4, 3, 11, 38, 52, 13102), datetime.datetime(2018, 4, 3, 11, 38, 53, 13102), datetime.datetime(2018, 4, 3, 11, 38, 54, 13102), datetime.datetime(2018, 4, 3, 11, 38, 55, 13102), datetime.datetime(2018, 4, 3, 11, 38, 56, 13102), datetime.datetime(2018, 4, 3, 11, 38, 57, 13102), datetime.datetime(2018, 4, 3, 11, 38, 58, 13101), datetime.datetime(2018, 4, 3, 11, 38, 59, 13100), datetime.datetime(2018, 4, 3, 11, 39, 0, 13100), datetime.datetime(2018, 4, 3, 11, 39, 1, 13100), datetime.datetime(2018, 4, 3, 11, 39, 2, 13100), datetime.datetime(2018, 4, 3, 11, 39, 3, 13100), datetime.datetime(2018, 4, 3, 11, 39, 4, 13100), datetime.datetime(2018, 4, 3, 11, 39, 5, 13100), datetime.datetime(2018, 4, 3, 11, 39, 6, 13100), datetime.datetime(2018, 4, 3, 11, 39, 7, 13100), datetime.datetime(2018, 4, 3, 11, 39, 8, 13100), datetime.datetime(2018, 4, 3, 11, 39, 9, 13100), datetime.datetime(2018, 4, 3, 11, 39, 10, 13100), datetime.datetime(2018, 4, 3, 11, 39, 11, 13100), datetime.datetime(2018, 4, 3, 11, 39, 12, 13100), datetime.datetime(2018, 4, 3, 11, 39, 13, 13100), datetime.datetime(2018, 4, 3, 11, 39, 14, 13100), datetime.datetime(2018, 4, 3, 11, 39, 15, 13100), datetime.datetime(2018, 4, 3, 11, 39, 16, 13100), datetime.datetime(2018, 4, 3, 11, 39, 17, 13100), datetime.datetime(2018, 4, 3, 11, 39, 18, 13100), datetime.datetime(2018, 4, 3, 11, 39, 19, 13100), datetime.datetime(2018, 4, 3, 11, 39, 20, 13100), datetime.datetime(2018, 4, 3, 11, 39, 21, 13100), datetime.datetime(2018, 4, 3, 11, 39, 22, 13100), datetime.datetime(2018, 4, 3, 11, 39, 23, 13100), datetime.datetime(2018, 4, 3, 11, 39, 24, 13100), datetime.datetime(2018, 4, 3, 11, 39, 25, 13100), datetime.datetime(2018, 4, 3, 11, 39, 26, 13100), datetime.datetime(2018, 4, 3, 11, 39, 27, 13100), datetime.datetime(2018, 4, 3, 11, 39, 28, 13100), datetime.datetime(2018, 4, 3, 11, 39, 29, 13100), datetime.datetime(2018, 4, 3, 11, 39, 30, 13100), datetime.datetime(2018, 4, 3, 11, 39, 31, 13100), datetime.datetime(2018, 4, 3, 11, 39, 32, 13100), datetime.datetime(2018, 4, 3, 11, 39, 33, 13100), datetime.datetime(2018, 4, 3, 11, 39, 34, 13100), datetime.datetime(2018, 4, 3, 11, 39, 35, 13100), datetime.datetime(2018, 4, 3, 11, 39, 36, 13100), datetime.datetime(2018, 4, 3, 11, 39, 37, 13100), datetime.datetime(2018, 4, 3, 11, 39, 38, 13100), datetime.datetime(2018, 4, 3, 11, 39, 39, 13100), datetime.datetime(2018, 4, 3, 11, 39, 40, 13100), datetime.datetime(2018, 4, 3, 11, 39, 41, 13100), datetime.datetime(2018, 4, 3, 11, 39, 42, 13100), datetime.datetime(2018, 4, 3, 11, 39, 43, 13100), datetime.datetime(2018, 4, 3, 11, 39, 44, 13100), datetime.datetime(2018, 4, 3, 11, 39, 45, 13100), datetime.datetime(2018, 4, 3, 11, 39, 46, 13100), datetime.datetime(2018, 4, 3, 11, 39, 47, 13100), datetime.datetime(2018, 4, 3, 11, 39, 48, 13100), datetime.datetime(2018, 4, 3, 11, 39, 49, 13100), datetime.datetime(2018, 4, 3, 11, 39, 50, 13100), datetime.datetime(2018, 4, 3, 11, 39, 51, 13100), datetime.datetime(2018, 4, 3, 11, 39, 52, 13100), datetime.datetime(2018, 4, 3, 11, 39, 53, 13100), datetime.datetime(2018, 4, 3, 11, 39, 54, 13100), datetime.datetime(2018, 4, 3, 11, 39, 55, 13100), datetime.datetime(2018, 4, 3, 11, 39, 56, 13100), datetime.datetime(2018, 4, 3, 11, 39, 57, 13100), datetime.datetime(2018, 4, 3, 11, 39, 58, 13100), datetime.datetime(2018, 4, 3, 11, 39, 59, 13100), datetime.datetime(2018, 4, 3, 11, 40, 0, 13100), datetime.datetime(2018, 4, 3, 11, 40, 1, 13101), datetime.datetime(2018, 4, 3, 11, 40, 2, 13101), datetime.datetime(2018, 4, 3, 11, 40, 3, 13101), datetime.datetime(2018, 4, 3, 11, 40, 4, 13101), datetime.datetime(2018, 4, 3, 11, 40, 5, 13101), datetime.datetime(2018, 4, 3, 11, 40, 6, 13101), datetime.datetime(2018, 4, 3, 11, 40, 7, 13101), datetime.datetime(2018, 4, 3, 11, 40, 8, 13101), datetime.datetime(2018, 4, 3, 11, 40, 9, 13101), datetime.datetime(2018, 4, 3, 11, 40, 10, 13101), datetime.datetime(2018, 4, 3, 11, 40, 11, 13101), datetime.datetime(2018, 4, 3, 11, 40, 12, 13101), datetime.datetime(2018, 4, 3, 11, 40, 13, 13101), datetime.datetime(2018, 4, 3, 11, 40, 14, 13101), datetime.datetime(2018, 4, 3, 11, 40, 15, 13101), datetime.datetime(2018, 4, 3, 11, 40, 16, 13101), datetime.datetime(2018, 4, 3, 11, 40, 17, 13101), datetime.datetime(2018, 4, 3, 11, 40, 18, 13101), datetime.datetime(2018, 4, 3, 11, 40, 19, 13101), datetime.datetime(2018, 4, 3, 11, 40, 20, 13101), datetime.datetime(2018, 4, 3, 11, 40, 21, 13101), datetime.datetime(2018, 4, 3, 11, 40, 22, 13101), datetime.datetime(2018, 4, 3, 11, 40, 23, 13101), datetime.datetime(2018, 4, 3, 11, 40, 24, 13101), datetime.datetime(2018, 4, 3, 11, 40, 25, 13101), datetime.datetime(2018, 4, 3, 11, 40, 26, 13101), datetime.datetime(2018, 4, 3, 11, 40, 27, 13101), datetime.datetime(2018, 4, 3, 11, 40, 28, 13101), datetime.datetime(2018, 4, 3, 11, 40, 29, 13101), datetime.datetime(2018, 4, 3, 11, 40, 30, 13101), datetime.datetime(2018, 4, 3, 11, 40, 31, 13101), datetime.datetime(2018, 4, 3, 11, 40, 32, 13101), datetime.datetime(2018, 4, 3, 11, 40, 33, 13101), datetime.datetime(2018, 4, 3, 11, 40, 34, 13101), datetime.datetime(2018, 4, 3, 11, 40, 35, 13101), datetime.datetime(2018, 4, 3, 11, 40, 36, 13101), datetime.datetime(2018, 4, 3, 11, 40, 37, 13101), datetime.datetime(2018, 4, 3, 11, 40, 38, 13101), datetime.datetime(2018, 4, 3, 11, 40, 39, 13101), datetime.datetime(2018, 4, 3, 11, 40, 40, 13101), datetime.datetime(2018, 4, 3, 11, 40, 41, 13101), datetime.datetime(2018, 4, 3, 11, 40, 42, 13101), datetime.datetime(2018, 4, 3, 11, 40, 43, 13101), datetime.datetime(2018, 4, 3, 11, 40, 44, 13101), datetime.datetime(2018, 4, 3, 11, 40, 45, 13101), datetime.datetime(2018, 4, 3, 11, 40, 46, 13101), datetime.datetime(2018, 4, 3, 11, 40, 47, 13101), datetime.datetime(2018, 4, 3, 11, 40, 48, 13101), datetime.datetime(2018, 4, 3, 11, 40, 49, 13101), datetime.datetime(2018, 4, 3, 11, 40, 50, 13101), datetime.datetime(2018, 4, 3, 11, 40, 51, 13101), datetime.datetime(2018, 4, 3, 11, 40, 52, 13101), datetime.datetime(2018, 4, 3, 11, 40, 53, 13101), datetime.datetime(2018, 4, 3, 11, 40, 54, 13101), datetime.datetime(2018, 4, 3, 11, 40, 55, 13101), datetime.datetime(2018, 4, 3, 11, 40, 56, 13101), datetime.datetime(2018, 4, 3, 11, 40, 57, 13101), datetime.datetime(2018, 4, 3, 11, 40, 58, 13101), datetime.datetime(2018, 4, 3, 11, 40, 59, 13101), datetime.datetime(2018, 4, 3, 11, 41, 0, 13100), datetime.datetime(2018, 4, 3, 11, 41, 1, 13100), datetime.datetime(2018, 4, 3, 11, 41, 2, 13100), datetime.datetime(2018, 4, 3, 11, 41, 3, 13100), datetime.datetime(2018, 4, 3, 11, 41, 4, 13100), datetime.datetime(2018, 4, 3, 11, 41, 5, 13100), datetime.datetime(2018, 4, 3, 11, 41, 6, 13100), datetime.datetime(2018, 4, 3, 11, 41, 7, 13100), datetime.datetime(2018, 4, 3, 11, 41, 8, 13100), datetime.datetime(2018, 4, 3, 11, 41, 9, 13100), datetime.datetime(2018, 4, 3, 11, 41, 10, 13100), datetime.datetime(2018, 4, 3, 11, 41, 11, 13100), datetime.datetime(2018, 4, 3, 11, 41, 12, 13100), datetime.datetime(2018, 4, 3, 11, 41, 13, 13100), datetime.datetime(2018, 4, 3, 11, 41, 14, 13100), datetime.datetime(2018, 4, 3, 11, 41, 15, 13100), datetime.datetime(2018, 4, 3, 11, 41, 16, 13100), datetime.datetime(2018, 4, 3, 11, 41, 17, 13100), datetime.datetime(2018, 4, 3, 11, 41, 18, 13100), datetime.datetime(2018, 4, 3, 11, 41, 19, 13100), datetime.datetime(2018, 4, 3, 11, 41, 20, 13100), datetime.datetime(2018, 4, 3, 11, 41, 21, 13100), datetime.datetime(2018, 4, 3, 11, 41, 22, 13100), datetime.datetime(2018, 4, 3, 11, 41, 23, 13100), datetime.datetime(2018, 4, 3, 11, 41, 24, 13100), datetime.datetime(2018, 4, 3, 11, 41, 25, 13100), datetime.datetime(2018, 4, 3, 11, 41, 26, 13100), datetime.datetime(2018, 4, 3, 11, 41, 27, 13100), datetime.datetime(2018, 4, 3, 11, 41, 28, 13100), datetime.datetime(2018, 4, 3, 11, 41, 29, 13100), datetime.datetime(2018, 4, 3, 11, 41, 30, 13100), datetime.datetime(2018, 4, 3, 11, 41, 31, 13100), datetime.datetime(2018, 4, 3, 11, 41, 32, 13100), datetime.datetime(2018, 4, 3, 11, 41, 33, 13100), datetime.datetime(2018, 4, 3, 11, 41, 34, 13100), datetime.datetime(2018, 4, 3, 11, 41, 35, 13100), datetime.datetime(2018, 4, 3, 11, 41, 36, 13100), datetime.datetime(2018, 4, 3, 11, 41, 37, 13100), datetime.datetime(2018, 4, 3, 11, 41, 38, 13100), datetime.datetime(2018, 4, 3, 11, 41, 39, 13100), datetime.datetime(2018, 4, 3, 11, 41, 40, 13100), datetime.datetime(2018, 4, 3, 11, 41, 41, 13100), datetime.datetime(2018, 4, 3, 11, 41, 42, 13100), datetime.datetime(2018, 4, 3, 11, 41, 43, 13100), datetime.datetime(2018, 4, 3, 11, 41, 44, 13100), datetime.datetime(2018, 4, 3, 11, 41, 45, 13100), datetime.datetime(2018, 4, 3, 11, 41, 46, 13100), datetime.datetime(2018, 4, 3, 11, 41, 47, 13100), datetime.datetime(2018, 4, 3, 11, 41, 48, 13100), datetime.datetime(2018, 4, 3, 11, 41, 49, 13100), datetime.datetime(2018, 4, 3, 11, 41, 50, 13100), datetime.datetime(2018, 4, 3, 11, 41, 51, 13100), datetime.datetime(2018, 4, 3, 11, 41, 52, 13100), datetime.datetime(2018, 4, 3, 11, 41, 53, 13100), datetime.datetime(2018, 4, 3, 11, 41, 54, 13100), datetime.datetime(2018, 4, 3, 11, 41, 55, 13100), datetime.datetime(2018, 4, 3, 11, 41, 56, 13100), datetime.datetime(2018, 4, 3, 11, 41, 57, 13100), datetime.datetime(2018, 4, 3, 11, 41, 58, 13100), datetime.datetime(2018, 4, 3, 11, 41, 59, 13100), datetime.datetime(2018, 4, 3, 11, 42, 0, 13100), datetime.datetime(2018, 4, 3, 11, 42, 1, 13100), datetime.datetime(2018, 4, 3, 11, 42, 2, 13100), datetime.datetime(2018, 4, 3, 11, 42, 3, 13100), datetime.datetime(2018, 4, 3, 11, 42, 4, 13100), datetime.datetime(2018, 4, 3, 11, 42, 5, 13100), datetime.datetime(2018, 4, 3, 11, 42, 6, 13100), datetime.datetime(2018, 4, 3, 11, 42, 7, 13100), datetime.datetime(2018, 4, 3, 11, 42, 8, 13100), datetime.datetime(2018, 4, 3, 11, 42, 9, 13100), datetime.datetime(2018, 4, 3, 11, 42, 10, 13100), datetime.datetime(2018, 4, 3, 11, 42, 11, 13100), datetime.datetime(2018, 4, 3, 11, 42, 12, 13100), datetime.datetime(2018, 4, 3, 11, 42, 13, 13100), datetime.datetime(2018, 4, 3, 11, 42, 14, 13100), datetime.datetime(2018, 4, 3, 11, 42, 15, 13100), datetime.datetime(2018, 4, 3, 11, 42, 16, 13100), datetime.datetime(2018, 4, 3, 11, 42, 17, 13100), datetime.datetime(2018, 4, 3, 11, 42, 18, 13100), datetime.datetime(2018, 4, 3, 11, 42, 19, 13100), datetime.datetime(2018, 4, 3, 11, 42, 20, 13100), datetime.datetime(2018, 4, 3, 11, 42, 21, 13100), datetime.datetime(2018, 4, 3, 11, 42, 22, 13100), datetime.datetime(2018, 4, 3, 11, 42, 23, 13100), datetime.datetime(2018, 4, 3, 11, 42, 24, 13100), datetime.datetime(2018, 4, 3, 11, 42, 25, 13100), datetime.datetime(2018, 4, 3, 11, 42, 26, 13100), datetime.datetime(2018, 4, 3, 11, 42, 27, 13100), datetime.datetime(2018, 4, 3, 11, 42, 28, 13100), datetime.datetime(2018, 4, 3, 11, 42, 29, 13100), datetime.datetime(2018, 4, 3, 11, 42, 30, 13100), datetime.datetime(2018, 4, 3, 11, 42, 31, 13100), datetime.datetime(2018, 4, 3, 11, 42, 32, 13100), datetime.datetime(2018, 4, 3, 11, 42, 33, 13100), datetime.datetime(2018, 4, 3, 11, 42, 34, 13100), datetime.datetime(2018, 4, 3, 11, 42, 35, 13100), datetime.datetime(2018, 4, 3, 11, 42, 36, 13100), datetime.datetime(2018, 4, 3, 11, 42, 37, 13100), datetime.datetime(2018, 4, 3, 11, 42, 38, 13100), datetime.datetime(2018, 4, 3, 11, 42, 39, 13100), datetime.datetime(2018, 4, 3, 11, 42, 40, 13100), datetime.datetime(2018, 4, 3, 11, 42, 41, 13100), datetime.datetime(2018, 4, 3, 11, 42, 42, 13100), datetime.datetime(2018, 4, 3, 11, 42, 43, 13100), datetime.datetime(2018, 4, 3, 11, 42, 44, 13100), datetime.datetime(2018, 4, 3, 11, 42, 45, 13100), datetime.datetime(2018, 4, 3, 11, 42, 46, 13100), datetime.datetime(2018, 4, 3, 11, 42, 47, 13100), datetime.datetime(2018, 4, 3, 11, 42, 48, 13100), datetime.datetime(2018, 4, 3, 11, 42, 49, 13100), datetime.datetime(2018, 4, 3, 11, 42, 50, 13100), datetime.datetime(2018, 4, 3, 11, 42, 51, 13100), datetime.datetime(2018, 4, 3, 11, 42, 52, 13100), datetime.datetime(2018, 4, 3, 11, 42, 53, 13100), datetime.datetime(2018, 4, 3, 11, 42, 54, 13100), datetime.datetime(2018, 4, 3, 11, 42, 55, 13100), datetime.datetime(2018, 4, 3, 11, 42, 56, 13100), datetime.datetime(2018, 4, 3, 11, 42, 57, 13100), datetime.datetime(2018, 4, 3, 11, 42, 58, 13100), datetime.datetime(2018, 4, 3, 11, 42, 59, 13100), datetime.datetime(2018, 4, 3, 11, 43, 0, 13100), datetime.datetime(2018, 4, 3, 11, 43, 1, 13100), datetime.datetime(2018, 4, 3, 11, 43, 2, 13100), datetime.datetime(2018, 4, 3, 11, 43, 3, 13100), datetime.datetime(2018, 4, 3, 11, 43, 4, 13101), datetime.datetime(2018, 4, 3, 11, 43, 5, 13101), datetime.datetime(2018, 4, 3, 11, 43, 6, 13101), datetime.datetime(2018, 4, 3, 11, 43, 7, 13101), datetime.datetime(2018, 4, 3, 11, 43, 8, 13101), datetime.datetime(2018, 4, 3, 11, 43, 9, 13101), datetime.datetime(2018, 4, 3, 11, 43, 10, 13101), datetime.datetime(2018, 4, 3, 11, 43, 11, 13101), datetime.datetime(2018, 4, 3, 11, 43, 12, 13101), datetime.datetime(2018, 4, 3, 11, 43, 13, 13101), datetime.datetime(2018, 4, 3, 11, 43, 14, 13101), datetime.datetime(2018, 4, 3, 11, 43, 15, 13101), datetime.datetime(2018, 4, 3, 11, 43, 16, 13101), datetime.datetime(2018, 4, 3, 11, 43, 17, 13101), datetime.datetime(2018, 4, 3, 11, 43, 18, 13101), datetime.datetime(2018, 4, 3, 11, 43, 19, 13101), datetime.datetime(2018, 4, 3, 11, 43, 20, 13101), datetime.datetime(2018, 4, 3, 11, 43, 21, 13101), datetime.datetime(2018, 4, 3, 11, 43, 22, 13101), datetime.datetime(2018, 4, 3, 11, 43, 23, 13101), datetime.datetime(2018, 4, 3, 11, 43, 24, 13101), datetime.datetime(2018, 4, 3, 11, 43, 25, 13101), datetime.datetime(2018, 4, 3, 11, 43, 26, 13101), datetime.datetime(2018, 4, 3, 11, 43, 27, 13101), datetime.datetime(2018, 4, 3, 11, 43, 28, 13101), datetime.datetime(2018, 4, 3, 11, 43, 29, 13101), datetime.datetime(2018, 4, 3, 11, 43, 30, 13101), datetime.datetime(2018, 4, 3, 11, 43, 31, 13101), datetime.datetime(2018, 4, 3, 11, 43, 32, 13101), datetime.datetime(2018, 4, 3, 11, 43, 33, 13101), datetime.datetime(2018, 4, 3, 11, 43, 34, 13101), datetime.datetime(2018, 4, 3, 11, 43, 35, 13101), datetime.datetime(2018, 4, 3, 11, 43, 36, 13101), datetime.datetime(2018, 4, 3, 11, 43, 37, 13101), datetime.datetime(2018, 4, 3, 11, 43, 38, 13101), datetime.datetime(2018, 4, 3, 11, 43, 39, 13101), datetime.datetime(2018, 4, 3, 11, 43, 40, 13101), datetime.datetime(2018, 4, 3, 11, 43, 41, 13101), datetime.datetime(2018, 4, 3, 11, 43, 42, 13101), datetime.datetime(2018, 4, 3, 11, 43, 43, 13101), datetime.datetime(2018, 4, 3, 11, 43, 44, 13101), datetime.datetime(2018, 4, 3, 11, 43, 45, 13101), datetime.datetime(2018, 4, 3, 11, 43, 46, 13101), datetime.datetime(2018, 4, 3, 11, 43, 47, 13101), datetime.datetime(2018, 4, 3, 11, 43, 48, 13101), datetime.datetime(2018, 4, 3, 11, 43, 49, 13101), datetime.datetime(2018, 4, 3, 11, 43, 50, 13101), datetime.datetime(2018, 4, 3, 11, 43, 51, 13101), datetime.datetime(2018, 4, 3, 11, 43, 52, 13101), datetime.datetime(2018, 4, 3, 11, 43, 53, 13101), datetime.datetime(2018, 4, 3, 11, 43, 54, 13101), datetime.datetime(2018, 4, 3, 11, 43, 55, 13101), datetime.datetime(2018, 4, 3, 11, 43, 56, 13101), datetime.datetime(2018, 4, 3, 11, 43, 57, 13101), datetime.datetime(2018, 4, 3, 11, 43, 58, 13101), datetime.datetime(2018, 4, 3, 11, 43, 59, 13101), datetime.datetime(2018, 4, 3, 11, 44, 0, 13100), datetime.datetime(2018, 4, 3, 11, 44, 1, 13100), datetime.datetime(2018, 4, 3, 11, 44, 2, 13100), datetime.datetime(2018, 4, 3, 11, 44, 3, 13100), datetime.datetime(2018, 4, 3, 11, 44, 4, 13100), datetime.datetime(2018, 4, 3, 11, 44, 5, 13100), datetime.datetime(2018, 4, 3, 11, 44, 6, 13100), datetime.datetime(2018, 4, 3, 11, 44, 7, 13100), datetime.datetime(2018, 4, 3, 11, 44, 8, 13100), datetime.datetime(2018, 4, 3, 11, 44, 9, 13100), datetime.datetime(2018, 4, 3, 11, 44, 10, 13100), datetime.datetime(2018, 4, 3, 11, 44, 11, 13100), datetime.datetime(2018, 4, 3, 11, 44, 12, 13100), datetime.datetime(2018, 4, 3, 11, 44, 13, 13100), datetime.datetime(2018, 4, 3, 11, 44, 14, 13100), datetime.datetime(2018, 4, 3, 11, 44, 15, 13100), datetime.datetime(2018, 4, 3, 11, 44, 16, 13100), datetime.datetime(2018, 4, 3, 11, 44, 17, 13100), datetime.datetime(2018, 4, 3, 11, 44, 18, 13100), datetime.datetime(2018, 4, 3, 11, 44, 19, 13100), datetime.datetime(2018, 4, 3, 11, 44, 20, 13100), datetime.datetime(2018, 4, 3, 11, 44, 21, 13100), datetime.datetime(2018, 4, 3, 11, 44, 22, 13100), datetime.datetime(2018, 4, 3, 11, 44, 23, 13100), datetime.datetime(2018, 4, 3, 11, 44, 24, 13100), datetime.datetime(2018, 4, 3, 11, 44, 25, 13100), datetime.datetime(2018, 4, 3, 11, 44, 26, 13100), datetime.datetime(2018, 4, 3, 11, 44, 27, 13100), datetime.datetime(2018, 4, 3, 11, 44, 28, 13100), datetime.datetime(2018, 4, 3, 11, 44, 29, 13100), datetime.datetime(2018, 4, 3, 11, 44, 30, 13100), datetime.datetime(2018, 4, 3, 11, 44, 31, 13100), datetime.datetime(2018, 4, 3, 11, 44, 32, 13100), datetime.datetime(2018, 4, 3, 11, 44, 33, 13100), datetime.datetime(2018, 4, 3, 11, 44, 34, 13100), datetime.datetime(2018, 4, 3, 11, 44, 35, 13100), datetime.datetime(2018, 4, 3, 11, 44, 36, 13100), datetime.datetime(2018, 4, 3, 11, 44, 37, 13100), datetime.datetime(2018, 4, 3, 11, 44, 38, 13100), datetime.datetime(2018, 4, 3, 11, 44, 39, 13099), datetime.datetime(2018, 4, 3, 11, 44, 40, 13098), datetime.datetime(2018, 4, 3, 11, 44, 41, 13097), datetime.datetime(2018, 4, 3, 11, 44, 42, 13096), datetime.datetime(2018, 4, 3, 11, 44, 43, 13095), datetime.datetime(2018, 4, 3, 11, 44, 44, 13095), datetime.datetime(2018, 4, 3, 11, 44, 45, 13095), datetime.datetime(2018, 4, 3, 11, 44, 46, 13095), datetime.datetime(2018, 4, 3, 11, 44, 47, 13095), datetime.datetime(2018, 4, 3, 11, 44, 48, 13095), datetime.datetime(2018, 4, 3, 11, 44, 49, 13095), datetime.datetime(2018, 4, 3, 11, 44, 50, 13095), datetime.datetime(2018, 4, 3, 11, 44, 51, 13095), datetime.datetime(2018, 4, 3, 11, 44, 52, 13095), datetime.datetime(2018, 4, 3, 11, 44, 53, 13095), datetime.datetime(2018, 4, 3, 11, 44, 54, 13095), datetime.datetime(2018, 4, 3, 11, 44, 55, 13095), datetime.datetime(2018, 4, 3, 11, 44, 56, 13095), datetime.datetime(2018, 4, 3, 11, 44, 57, 13095), datetime.datetime(2018, 4, 3, 11, 44, 58, 13094), datetime.datetime(2018, 4, 3, 11, 44, 59, 13093), datetime.datetime(2018, 4, 3, 11, 45, 0, 13092), datetime.datetime(2018, 4, 3, 11, 45, 1, 13092), datetime.datetime(2018, 4, 3, 11, 45, 2, 13092), datetime.datetime(2018, 4, 3, 11, 45, 3, 13092), datetime.datetime(2018, 4, 3, 11, 45, 4, 13092), datetime.datetime(2018, 4, 3, 11, 45, 5, 13092), datetime.datetime(2018, 4, 3, 11, 45, 6, 13092), datetime.datetime(2018, 4, 3, 11, 45, 7, 13092), datetime.datetime(2018, 4, 3, 11, 45, 8, 13092), datetime.datetime(2018, 4, 3, 11, 45, 9, 13092), datetime.datetime(2018, 4, 3, 11, 45, 10, 13092), datetime.datetime(2018, 4, 3, 11, 45, 11, 13092), datetime.datetime(2018, 4, 3, 11, 45, 12, 13092), datetime.datetime(2018, 4, 3, 11, 45, 13, 13092), datetime.datetime(2018, 4, 3, 11, 45, 14, 13092), datetime.datetime(2018, 4, 3, 11, 45, 15, 13092), datetime.datetime(2018, 4, 3, 11, 45, 16, 13092), datetime.datetime(2018, 4, 3, 11, 45, 17, 13092), datetime.datetime(2018, 4, 3, 11, 45, 18, 13092), datetime.datetime(2018, 4, 3, 11, 45, 19, 13092), datetime.datetime(2018, 4, 3, 11, 45, 20, 13092), datetime.datetime(2018, 4, 3, 11, 45, 21, 13092), datetime.datetime(2018, 4, 3, 11, 45, 22, 13092), datetime.datetime(2018, 4, 3, 11, 45, 23, 13092), datetime.datetime(2018, 4, 3, 11, 45, 24, 13092), datetime.datetime(2018, 4, 3, 11, 45, 25, 13092), datetime.datetime(2018, 4, 3, 11, 45, 26, 13092), datetime.datetime(2018, 4, 3, 11, 45, 27, 13092), datetime.datetime(2018, 4, 3, 11, 45, 28, 13092), datetime.datetime(2018, 4, 3, 11, 45, 29, 13092), datetime.datetime(2018, 4, 3, 11, 45, 30, 13092), datetime.datetime(2018, 4, 3, 11, 45, 31, 13092), datetime.datetime(2018, 4, 3, 11, 45, 32, 13092), datetime.datetime(2018, 4, 3, 11, 45, 33, 13092), datetime.datetime(2018, 4, 3, 11, 45, 34, 13092), datetime.datetime(2018, 4, 3, 11, 45, 35, 13092), datetime.datetime(2018, 4, 3, 11, 45, 36, 13092), datetime.datetime(2018, 4, 3, 11, 45, 37, 13092), datetime.datetime(2018, 4, 3, 11, 45, 38, 13092), datetime.datetime(2018, 4, 3, 11, 45, 39, 13092), datetime.datetime(2018, 4, 3, 11, 45, 40, 13092), datetime.datetime(2018, 4, 3, 11, 45, 41, 13092), datetime.datetime(2018, 4, 3, 11, 45, 42, 13092), datetime.datetime(2018, 4, 3, 11, 45, 43, 13092), datetime.datetime(2018, 4, 3, 11, 45, 44, 13092), datetime.datetime(2018, 4, 3, 11, 45, 45, 13092), datetime.datetime(2018, 4, 3, 11, 45, 46, 13092), datetime.datetime(2018, 4, 3, 11, 45, 47, 13092), datetime.datetime(2018, 4, 3, 11, 45, 48, 13092), datetime.datetime(2018, 4, 3, 11, 45, 49, 13092), datetime.datetime(2018, 4, 3, 11, 45, 50, 13092), datetime.datetime(2018, 4, 3, 11, 45, 51, 13092), datetime.datetime(2018, 4, 3, 11, 45, 52, 13092), datetime.datetime(2018, 4, 3, 11, 45, 53, 13092), datetime.datetime(2018, 4, 3, 11, 45, 54, 13092), datetime.datetime(2018, 4, 3, 11, 45, 55, 13092), datetime.datetime(2018, 4, 3, 11, 45, 56, 13092), datetime.datetime(2018, 4, 3, 11, 45, 57, 13092), datetime.datetime(2018, 4, 3, 11, 45, 58, 13092), datetime.datetime(2018, 4, 3, 11, 45, 59, 13092), datetime.datetime(2018, 4, 3, 11, 46, 0, 13092), datetime.datetime(2018, 4, 3, 11, 46, 1, 13092), datetime.datetime(2018, 4, 3, 11, 46, 2, 13092), datetime.datetime(2018, 4, 3, 11, 46, 3, 13092), datetime.datetime(2018, 4, 3, 11, 46, 4, 13092), datetime.datetime(2018, 4, 3, 11, 46, 5, 13092), datetime.datetime(2018, 4, 3, 11, 46, 6, 13092), datetime.datetime(2018, 4, 3, 11, 46, 7, 13092), datetime.datetime(2018, 4, 3, 11, 46, 8, 13092), datetime.datetime(2018, 4, 3, 11, 46, 9, 13092), datetime.datetime(2018, 4, 3, 11, 46, 10, 13092), datetime.datetime(2018, 4, 3, 11, 46, 11, 13092), datetime.datetime(2018, 4, 3, 11, 46, 12, 13092), datetime.datetime(2018, 4, 3, 11, 46, 13, 13092), datetime.datetime(2018, 4, 3, 11, 46, 14, 13092), datetime.datetime(2018, 4, 3, 11, 46, 15, 13092), datetime.datetime(2018, 4, 3, 11, 46, 16, 13092), datetime.datetime(2018, 4, 3, 11, 46, 17, 13092), datetime.datetime(2018, 4, 3, 11, 46, 18, 13092), datetime.datetime(2018, 4, 3, 11, 46, 19, 13092), datetime.datetime(2018, 4, 3, 11, 46, 20, 13092), datetime.datetime(2018, 4, 3, 11, 46, 21, 13092), datetime.datetime(2018, 4, 3, 11, 46, 22, 13092)])
-
-angles_great = ([26.484891789803182, 26.496774611411713, 26.508686461324217, 26.520623924446106, 26.53259041587197, 26.54458422805451, 26.556607068541023, 26.56865722978422, 26.580736419331387, 26.592842929635236, 26.60498017579035, 26.61714474270214, 26.629338337917904, 26.641562668984935, 26.653816028355937, 26.666098416030913, 26.678411539557153, 26.69075539893466, 26.70312828661614, 26.715531910148883, 26.727967977080183, 26.740433072315454, 26.752930610949285, 26.76545888543438, 26.778017895770745, 26.79060934950566, 26.803233246639138, 26.81588958717117, 26.828578371101763, 26.84129959843091, 26.85405326915862, 26.86683938328488, 26.879659648356995, 26.89251406437496, 26.905402631338774, 26.918323641701146, 26.931278803009366, 26.944269822810732, 26.957294993557944, 26.97035431525101, 26.983451202984508, 26.996580534116568, 27.009747431289057, 27.02295018695469, 27.03618880111347, 27.04946327376539, 27.062775312457745, 27.076123209643242, 27.089510380416467, 27.102933409682834, 27.116394004989637, 27.129893873884168, 27.14343130881913, 27.157006309794532, 27.17062058435766, 27.184275840055808, 27.19796866179439, 27.211700757120703, 27.225473833582033, 27.23928618363109, 27.25313951481517, 27.26703382713427, 27.280969120588388, 27.29494710272482, 27.30896435844898, 27.323026010402742, 27.337128643491525, 27.35127396526262, 27.36546197571603, 27.37969267485175, 27.393967770217078, 27.40828726181201, 27.422651149636547, 27.437057726143397, 27.451510406427143, 27.466007482940494, 27.480550663230744, 27.495139947297893, 27.50977533514194, 27.52445682676288, 27.53918612970801, 27.55396153643004, 27.568786462023553, 27.583657491393964, 27.598576332088566, 27.61354639920194, 27.628562570092214, 27.64362996740126, 27.65874688358179, 27.673913318633804, 27.689130980104594, 27.70439986799416, 27.719719982302497, 27.73509132302961, 27.750515597722792, 27.76599280638204, 27.781521241460062, 27.79710431805145, 27.81274203615619, 27.828432688227004, 27.844177981811175, 27.859977916908708, 27.875834201066894, 27.89174683428573, 27.90771581656522, 27.92374114790536, 27.939822828306156, 27.95596427286219, 27.972162066478877, 27.9884196242508, 28.004735238630666, 28.021112324713062, 28.037549174950698, 28.054045789343572, 28.070603875438977, 28.08722343323691, 28.103904462737372, 28.12064867148766, 28.137456059487768, 28.1543266267377, 28.171262080784746, 28.18826242162891, 28.205327649270185, 28.22245947125587, 28.23965618003867, 28.256921190713168, 28.274252795732078, 28.29165099509539, 28.309119203897698, 28.326657422139, 28.344263942272, 28.361942179391285, 28.379690425949562, 28.397510389494126, 28.415402070024975, 28.4333671750894, 28.451405704687403, 28.469519366366278, 28.48770645257873, 28.50596867087205, 28.524306021246243, 28.54272191879589, 28.5612146559737, 28.579784232779673, 28.598432356761098, 28.617160735465273, 28.635969368892198, 28.65485996458916, 28.67383081500887, 28.69288362769862, 28.712018402658412, 28.731238554982827, 28.750540669577283, 28.76993157663095, 28.78940786104924, 28.808969522832157, 28.828619977074283, 28.848355808681035, 28.868183847841582, 28.88810067946134, 28.908109718634893, 28.928207550267654, 28.9484010045488, 28.968686666383736, 28.989064535772467, 29.009538027809583, 29.03011055758966, 29.05077871001812, 29.07154248509496, 29.092408713009345, 29.113370563572115, 29.134434866972434, 29.155601623210305, 29.176870832285722, 29.198242494198695, 29.219716608949213, 29.241300006726455, 29.26298927243583, 29.28478440607734, 29.30668882274557, 29.328702522440523, 29.350828920256777, 29.373064601099756, 29.395416395158623, 29.417880887338793, 29.440458077640272, 29.463154796252223, 29.485967628080065, 29.508899988218385, 29.531948461572593, 29.555123293426444, 29.578417653590773, 29.60183495716016, 29.625378619229195, 29.649048639797876, 29.6728450188662, 29.696771171528756, 29.720823682690956, 29.745012797636555, 29.769331686176386, 29.79378376340503, 29.818372444417076, 29.843097729212523, 29.867963032885953, 29.892964940342786, 29.918110281772186, 29.94339905717416, 29.9688312665487, 29.994406909895815, 30.02013281740467, 30.04600898907526, 30.07203200981301, 30.098208709807086, 30.124539089057482, 30.151026562658792, 30.177671130611014, 30.204472792914142, 30.231438379757353, 30.258564476046057, 30.285854496874844, 30.31330844224371, 30.34093314234183, 30.368728597169195, 30.39669480672581, 30.424835186106264, 30.45314973531055, 30.48164186943326, 30.510315003568973, 30.53917255281228, 30.568211102068588, 30.597434066432484, 30.626848276093146, 30.656450315955983, 30.68624701621016, 30.71623837685569, 30.746427812987143, 30.77681532460453, 30.807404326802434, 30.838198234675435, 30.869197048223537, 30.900407597635912, 30.931829882912556, 30.96346390405347, 30.995316491247824, 31.02738764449562, 31.059684193986023, 31.092202724624453, 31.124950066600082, 31.157926219912902, 31.191138014752088, 31.22458545111764, 31.258271944104145, 31.292200908806183, 31.326372345223756, 31.36079649864062, 31.39546995396219, 31.430399541377636, 31.465585260886957, 31.501033942679324, 31.53674900184932, 31.572730438396945, 31.608985082511374, 31.645512934192602, 31.6823208236298, 31.719412165917557, 31.756786961055866, 31.794455454328485, 31.832417645735415, 31.870676950371244, 31.90923678333055, 31.948103974802507, 31.987285354976287, 32.0267775087573, 32.06658726633472, 32.106724872992295, 32.14718691363545, 32.18798363354794, 32.22911503272976, 32.270587941370074, 32.31240918965806, 32.354582192688305, 32.39711036555539, 32.44000395354307, 32.48325954155676, 32.5268907899748, 32.5708976987972, 32.61529051330769, 32.6600692335063, 32.70524410467676, 32.750818541913674, 32.796799375406195, 32.843190020248926, 32.890000721725606, 32.937238310025414, 32.98490620024293, 33.03301122256733, 33.081560207187785, 33.13056339938804, 33.18002421426269, 33.2299494820009, 33.28034603279183, 33.33122411191926, 33.38259054957234, 33.434452175940244, 33.48681582121215, 33.539691730671805, 33.593090149602965, 33.647011078005626, 33.70147159135273, 33.75647851983342, 33.81203869363689, 33.86816235804689, 33.92485975834716, 33.98214113982147, 34.040013332658994, 34.09848658214347, 34.15757113355867, 34.21728064728292, 34.277625368599985, 34.33861212769902, 34.40025458495839, 34.462566400756415, 34.52555440528227, 34.58923567400889, 34.65361703712543, 34.71871557010482, 34.7845449333254, 34.85111195697635, 34.91843713162516, 34.986530702555605, 35.05540291505143, 35.12507767477473, 35.19556181191467, 35.26687581703878, 35.339029935430794, 35.41204465765823, 35.485933644099426, 35.560717385321894, 35.636406126609394, 35.71302377362401, 35.79058740183868, 35.86911067163173, 35.94861748866526, 36.029128343506784, 36.110660311629225, 36.1932338836001, 36.276869549986905, 36.36159121645174, 36.44741937356212, 36.53437792698014, 36.62249078236789, 36.71178184538746, 36.802275021700964, 36.89399421697048, 36.98697016704728, 37.08122677759346, 37.176787954271106, 37.27369126312066, 37.37195719470963, 37.47161989998387, 37.572713529889235, 37.675261990087805, 37.77930284662003, 37.88487366552633, 37.99200176756339, 38.10072471877165, 38.211083500286136, 38.323112263052685, 38.4368554033009, 38.552343656882066, 38.66962825021494, 38.788750164434546, 38.90975038067591, 39.03267329516863, 39.15757354942607, 39.28449553967783, 39.41348707724811, 39.54460280365026, 39.67789736039764, 39.81342538900362, 39.95124494607613, 40.09141067312855, 40.233990872052566, 40.379043599456125, 40.52663374213635, 40.67683301707951, 40.82970972617732, 40.98533558641606, 41.14378914497119, 41.30514211882898, 41.469479885354076, 41.636884406816506, 41.80744447567548, 41.98124546929562, 42.158383010325316, 42.338952721412944, 42.52305705539605, 42.71079505001761, 42.902279403398914, 43.0976193985667, 43.29693456383142, 43.50034101240899, 43.70796510279904, 43.91994002369038, 44.13640237886643, 44.35748877211057, 44.58334946758455, 44.8141381445447, 45.05001189734192, 45.29113465051629, 45.537683988986245, 45.7898340825756, 46.04777617658114, 46.311708346488764, 46.581825252689846, 46.8583488763324, 47.14149436837528, 47.43149737034485, 47.72859693886206, 48.0330492060208, 48.34511030391492, 48.665063685395, 48.99319280331159, 49.32979818598815, 49.67519743722111, 50.02971499099604, 50.3936991869606, 50.76750861004623, 51.151515505562685, 51.54611943957642, 51.95173022343763, 52.368781574158604, 52.79772428422458, 53.23902963668827, 53.693192820264514, 54.16073634442481, 54.642199794113594, 55.13815349012656, 55.6491916589215, 56.17593926280747, 56.71904175466103, 57.27918556849378, 57.857084459073974, 58.45347608683198, 59.06913567823858, 59.70488968618337, 60.36156456355591, 61.040055065137466, 61.74127643627682, 62.466171243079444, 63.215743523353325, 63.99100414509562, 64.79301861781686, 65.62287294159506, 66.48170092783248, 67.37064321812046, 68.29088826537462, 69.24361769232135, 70.23006093301127, 71.25143376111664, 72.30895878049888, 73.4038449346411, 74.53728750664804, 75.71044079848943, 76.92441813099998, 78.18025769293355, 79.47891571077392, 80.82123912797819, 82.20793828422003, 83.63958008520055, 85.1165197007566, 86.63891422523908, 88.20668169637796, 89.81944645376888, 91.47653913887318, 93.17696254407205, 94.91934380134231, 96.7019617030131, 98.52267839987422, 100.37897355212195, 102.2679238387915, 104.18623027851378, 106.13021139932613, 108.0958715405641, 110.07890768305059, 112.07478458117669, 114.07878257422594, 116.08607271845514, 118.09174410785104, 120.09095413829212, 122.07893533773769, 124.05105683793049, 126.00296097818006, 127.93052232422768, 129.82994329089487, 131.6978087835966, 133.5310588775847, 135.32702979908288, 137.08345392528668, 138.79845978436353, 140.4705720554527, 142.09865692715195, 143.6819357578959, 145.21994409482105, 146.71249069263058, 148.15964385321618, 149.56171776527972, 150.91920420244142, 152.2327588628616, 153.50320136924066, 154.73141964617068, 155.91846554278388, 157.0653909082124, 158.17337053499355, 159.24356555528615, 160.27719174276254, 161.27546487109493, 162.2396143743339, 163.17084236577347, 164.07037827946414, 164.93936958718652, 165.77901840223453, 166.5904312152537, 167.37471451688958, 168.13294747703105, 168.86615462405356, 169.57534682595434, 170.26148030921712, 170.92549763994742, 171.56828674273734, 172.19069456104393, 172.79355437794592, 173.37765849538707, 173.94374457379772, 174.4925639339866, 175.02477227411399, 175.54106627347525, 176.04206064909567, 176.52835645762227, 177.00054109532357, 177.45916097733326, 177.90474885840655, 178.3377965121637, 178.75879571222492, 179.1681972510755, 179.5664519212006, 179.9539558735721, 180.33113257991855, 180.69836453083346, 181.05599323577533, 181.40438752495933, 181.74387524746564, 182.07478425237443, 182.3974014076308, 182.7120409019366, 183.01897594285865, 183.31845241720703, 183.61075719292688, 183.89612249645003, 184.1747805542082, 184.4469635926332, 184.71287651740016, 184.9727242341841, 185.22672530903856, 185.47505732688188, 185.7178978726325, 185.95542453120888, 186.18781488752938, 186.4152192057558, 186.63780141042815, 186.8556981053299, 187.06905955462278, 187.27803602246848, 187.48273679189376, 187.683298466682, 187.8798439902383, 188.0724963059677, 188.26136469689686, 188.4465584460526, 188.6281868364616, 188.8063454907722, 188.98113003163283, 189.15263608169184, 189.32095926359764, 189.48618153962025, 189.6483848720297, 189.80766488347442, 189.96408987584604, 190.11774181141465, 190.26868899207193, 190.4169997197096, 190.56275595659764, 190.70599868387117, 190.84680986380013, 190.9852577982763, 191.121397128813, 191.25526883654524, 191.3869548837431, 191.51648259116322, 191.64393392107564, 191.7693361942371, 191.89274405216088, 192.01421213636038, 192.13378142797063, 192.25150656850496, 192.36741487872007, 192.48156100012935, 192.5939722534894, 192.70470328031365, 192.81378140135877, 192.9212612581381, 193.02715651102994, 193.1315081411694, 193.2343707900698, 193.33574445773112, 193.43568378566675, 193.53421609463336, 193.63136870538762, 193.72718259906455, 193.82167143604252, 193.91486253707816, 194.0067832229282, 194.09747447472762, 194.1869499528548, 194.27525063844473, 194.3623765314974, 194.44835495276953, 194.5332268833961, 194.6170059837555, 194.699705914226, 194.78136765594266, 194.8619912089055, 194.94159023349283, 195.02021937121802, 195.09786496170273, 195.17456798608197, 195.25032844435574, 195.32517365728074, 195.3991172852353, 195.4721866489761, 195.54438174850313, 195.61572990457307, 195.6862447775643, 195.7559400278551, 195.82482931582385, 195.8929263018489, 195.96025830668688, 196.02681166995947, 196.09262737280173, 196.15771907559193, 196.2220731179518, 196.28573048101632, 196.34867750440716, 196.41095516925932, 196.4725498151945, 196.53348876296937, 196.59377201258388, 196.65341322441645, 196.71243971922368, 196.7708378366273, 196.82862123700562, 196.8858172411153, 196.94242584895636, 196.99846072090716, 197.05392185696766, 197.10882291751622, 197.16317756293117, 197.21698579321253, 197.27027492911697, 197.32303131026615, 197.3752685970384, 197.42700044981208, 197.47822686858717, 197.52896151374205, 197.57921804565498, 197.62899646432604, 197.67831043013354, 197.72714628269912, 197.77554500315784, 197.82347927075298, 197.87097640624125, 197.918050070001, 197.96468660165382, 198.01089966157815, 198.0566892497739, 198.10208268699782, 198.14706631287152, 198.19165378777336, 198.23584511170333, 198.2796539450398, 198.3230666274044, 198.36612413993217, 198.4087991618664, 198.4511190139638, 198.49307003584602, 198.5346658878914, 198.57592023047826, 198.6168194032283, 198.65737706651984, 198.69760688073123, 198.73750884586244, 198.7770829619135, 198.81632922888437, 198.85524764677513, 198.89386553634236, 198.93218289758613, 198.97017240974975, 199.0078750539682, 199.0452771698632, 199.08239241781305, 199.11922079781777, 199.155748649499, 199.19200329361342, 199.2279710697827, 199.26367929876355, 199.29910065979922, 199.33426247364645, 199.36916474030522, 199.40380745977552, 199.438176971679, 199.4723005967724, 199.50617833505567, 199.53979652615047, 199.5731824908135, 199.6063225686664, 199.63921675970917, 199.67187872432018, 199.7043084624994, 199.73650597424682, 199.76848491994085, 199.80023163920305, 199.83175979241184, 199.86305571918882, 199.89414674029072, 199.9250191953392, 199.95568674471255, 199.98613572803245, 200.01637980567727, 200.046418977647, 200.07626690431997, 200.1059099253178, 200.13534804064057, 200.16459491066655, 200.1936505353958, 200.22251491482825, 200.25118804896397, 200.27968359818126, 200.30798790210181, 200.33611462110392, 200.36405009480927, 200.39182164397454, 200.41940194784306, 200.44681832717148, 200.4740571215815, 200.50113199145142, 200.52804293678128, 200.55477629719272, 200.58134573306407, 200.60775124439533, 200.63400649156486, 200.6600978141943, 200.68602521228368, 200.7118023462113, 200.73741555559886, 200.76287850082466, 200.78820484226705, 200.81336725916938, 200.83837941190998, 200.86325496086715, 200.88798024566262, 200.91256892667465, 200.93700734352495, 200.96130915659185, 200.98547436587538, 201.00948931099714, 201.03338131271383, 201.05713671064714, 201.08075550479705, 201.10423769516356, 201.127596942125, 201.15081958530303, 201.173919285076, 201.19689604144395, 201.21973619402846, 201.24246706358628, 201.26506132936066, 201.28753265173, 201.30989469107263, 201.3321337870102, 201.3542499395427, 201.37624314867014, 201.39812707477085, 201.41990171784485, 201.4415534175138, 201.46309583415604, 201.48452896777152, 201.5058528183603, 201.52706738592235, 201.54815901007936, 201.56915501158798, 201.59004173006988, 201.6108328259034, 201.63150097833184, 201.65207350811193, 201.67255041524362, 201.6929180393486, 201.71319004080522, 201.7333527592351, 201.75343351539493, 201.77340498852803, 201.79328083901277, 201.81306106684914, 201.83273201165878, 201.85232099419838, 201.87182801446792, 201.89122575171075, 201.91054152668355, 201.92976167900798, 201.948886208684, 201.96792877609, 201.98687572084762, 202.0057407033352, 202.0245100631744, 202.04319746074356, 202.06180289604265, 202.08032636907174, 202.09875421945242, 202.11711376794142, 202.13537769378203, 202.15355965735262, 202.1716733190315, 202.189691358062, 202.20764109520078, 202.2254952096912, 202.2432810222899, 202.26099853299692, 202.27862042105554, 202.2961876676008, 202.31365929149771, 202.3310626135029, 202.3483976336164, 202.36565069145985, 202.38282178703327, 202.3999382410933, 202.41697273288332, 202.43393892278164, 202.45082315040992, 202.46765273652483, 202.48440036036968, 202.50107968232285, 202.51770436276266, 202.53424708093243, 202.5507214972105, 202.56712761159687, 202.5834790844699, 202.5997622554512, 202.61596346416246, 202.6321236917387, 202.64820195704493, 202.66422558083778, 202.68018090273893, 202.6960679227484, 202.71190030124447, 202.72766437784887, 202.7433738129399, 202.75901494613922, 202.7746014378252, 202.7901332879978, 202.8055968362787, 202.8209920826679, 202.8363463479221, 202.8516323112846, 202.86686363313373, 202.8820403134695, 202.8971623522919, 202.9122160892226, 202.92721518463995, 202.94217329892228, 202.95706311131292, 202.97189828219018, 202.9866788115541, 203.00141835978297, 203.01608960612018, 203.03070621094398, 203.0452818346328, 203.05980281680823, 203.07426915747033, 203.08868085661905, 203.10303791425443, 203.11735399075476, 203.13161542574176, 203.14582221921538, 203.15998803155398, 203.17409920237924, 203.18815573169113, 203.202171279868, 203.2161321865315, 203.23005211205998, 203.24391739607512, 203.25774169895521, 203.27151136032197, 203.28524004055367, 203.2989277396504, 203.31256079723374, 203.32615287368205, 203.33969030861704, 203.35318676241698, 203.36664223508188, 203.3800567266118, 203.39341657662834, 203.40674910588822, 203.4200269936347, 203.43325023986787, 203.44644616534433, 203.45960110968576, 203.47270141251386, 203.48577439458526, 203.4987927351433, 203.51177009456632, 203.52470647285432, 203.53761553038566, 203.5504699464036, 203.56328338128657, 203.57606949541284, 203.58880096802574, 203.60150511988195, 203.61416829060315, 203.626776819811, 203.63935802826217, 203.65191191595665, 203.66441116213778, 203.6768830875622, 203.6893003714733, 203.7016903346277, 203.71405297702543, 203.7263609779098, 203.73864165803747, 203.75089501740848, 203.76309373526612, 203.77526513236708, 203.78740920871135, 203.79949864354228, 203.81156075761652, 203.8235955509341, 203.83558936311664, 203.84754219416416, 203.859467704455, 203.87136589398915, 203.8832231023883, 203.89503932965243, 203.90682823615987, 203.9185761615323, 203.93029676614802, 203.9419900500071, 203.95364235273112, 203.9652673346985, 203.97686499590918, 203.98842167598482, 203.9999510353038, 204.01143941348778, 204.02290047091506, 204.03433420758566, 204.0457406234996, 204.0571060582785, 204.0684441723007, 204.07975496556625, 204.09102477769676, 204.10228092944894], [2.2497800608180657e-05, 0.04781829778655141, 0.0959480695415326, 0.1443885715480564, 0.19313776608855301, 0.24219343868762752, 0.291553374869885, 0.3412152267577981, 0.39117653975213396, 0.4414349126145125, 0.49198781070442144, 0.5428326460204955, 0.593966857241796, 0.6453877763256782, 0.6970928953120566, 0.7490794394365806, 0.8013449007391644, 0.8538865578163106, 0.9067018493470805, 0.9597881072888295, 1.0131427703206188, 1.0667633838432153, 1.1206473865356807, 1.1747923237987816, 1.2291955275898736, 1.283854970196547, 1.338767983576157, 1.3939324332945882, 1.449345971474313, 1.5050064636812164, 1.5609116687594764, 1.6170596657183895, 1.6734482134021338, 1.7300753908200055, 1.786939383703006, 1.844038164338726, 1.9013701319015783, 1.9589332586791532, 2.01672605056757, 2.074747013462947, 2.1329942263745814, 2.1914664086420026, 2.2501620661613306, 2.3090797048286835, 2.3682182574270043, 2.4275762298524115, 2.4871525548878477, 2.5469459518728437, 2.6069553535903407, 2.6671799062666937, 2.7276181157980206, 2.788269555297499, 2.8491331575480716, 2.910208068776091, 2.9714936486513226, 3.032988829956709, 3.0946933992488392, 3.1566062893106546, 3.218727073255332, 3.2810553241960485, 3.3435904018025697, 3.4063320926314837, 3.469279756352556, 3.532432966078963, 3.595791935254117, 3.6593558101043713, 3.7231245906297263, 3.7870982768301813, 3.8512764418189134, 3.915659085595923, 3.980245781274387, 4.04503738262795, 4.110033035882969, 4.175233167926264, 4.240637778757837, 4.306246868377687, 4.372060863672638, 4.438053297659654, 4.504278811852098, 4.5707092317196425, 4.637345411035933, 4.704187776687793, 4.7712359017884, 4.838491066998223, 4.905953272317262, 4.973622944632341, 5.041500083943458, 5.109585970911084, 5.1778806055352185, 5.246384841589507, 5.315099532847597, 5.384024252422665, 5.4531602809751805, 5.52250847227879, 5.592069253220315, 5.6618430506865804, 5.731831145338055, 5.802033964061562, 5.872451933743924, 5.943086761932434, 6.0139384486270915, 6.085007847601544, 6.156296666403082, 6.227804905031707, 6.299534271034712, 6.371484764412096, 6.443658092711151, 6.516054682818702, 6.588675815395216, 6.661522771101164, 6.7345959768233685, 6.807897566995945, 6.881427541618894, 6.955187181352685, 7.02917819374461, 7.1034010056814925, 7.177857751597448, 7.2525484314924755, 7.327475606687516, 7.402639277182567, 7.478041150524923, 7.553682934261875, 7.629565482167071, 7.705690501787801, 7.782058846897714, 7.858671371270455, 7.935531490000608, 8.012638349314528, 8.089994510533154, 8.167601681203777, 8.245459861326399, 8.323572465995603, 8.40193949521139, 8.4805635102947, 8.559445365019178, 8.638587620705762, 8.717990277354453, 8.797655896286189, 8.877586185048264, 8.957782851187968, 9.038246748478949, 9.118980438242147, 9.199985628024852, 9.281264025374357, 9.362816484064309, 9.444646419189294, 9.526753830749309, 9.609141280065295, 9.69181132845819, 9.774764829701642, 9.858004345116587, 9.941531582250319, 10.02534824865013, 10.10945690563696, 10.193858406984454, 10.278556167787197, 10.363551041818836, 10.448846444173956, 10.534442374852555, 10.620343102722867, 10.706549481558536, 10.793063218906857, 10.879888583636058, 10.967025575746142, 11.054476756558048, 11.142245541166357, 11.23033278334472, 11.318742751961365, 11.407475447016292, 11.496534283604088, 11.585921823045691, 11.675639772888394, 11.765691548226782, 11.856078856608145, 11.946804259353424, 12.037871171557205, 12.129280446993132, 12.22103550075579, 12.31313889416612, 12.405593188545058, 12.498400945213545, 12.591565579266165, 12.685087944476566, 12.778973163486622, 12.873222090069982, 12.967838139321229, 13.06282472633495, 13.158183558658436, 13.253918051386274, 13.350030765839401, 13.446525117112403, 13.543403666526217, 13.640670682949077, 13.738327020154626, 13.836376947011098, 13.934823878613077, 14.033669522507855, 14.13291900133731, 14.232574022648736, 14.332638001536715, 14.433115206869479, 14.534036374498296, 14.6354612685784, 14.737294266461411, 14.839547320978381, 14.94222384722389, 15.045328967839817, 15.148864390373456, 15.25283352991939, 15.357239801572204, 15.462088327973778, 15.567329590252626, 15.672992616712724, 15.779113265847212, 15.885696660297969, 15.99274621515958, 16.100263637979335, 16.208255758946407, 16.316724285608085, 16.425674340606253, 16.535107631488195, 16.64503269599038, 16.755449534112806, 16.866363268497352, 16.9777773142386, 17.08969850152572, 17.2021302454533, 17.315074253568632, 17.428537356060883, 17.54252296802464, 17.657036212101783, 17.772082210934187, 17.88766267206914, 18.00378442569582, 18.12045088690881, 18.237668885897275, 18.35544013020851, 18.47377145003169, 18.592666260461396, 18.7121296841395, 18.832168551255183, 18.95278456935573, 19.073986276177607, 19.195775379268106, 19.318160416363686, 19.441143095011643, 19.564730245401147, 19.688928697721366, 19.813740159519593, 19.939173168532292, 20.06523113985405, 20.19192090367403, 20.319247582634116, 20.447216299376183, 20.575832176542107, 20.705103751868354, 20.835032732902214, 20.96562936492744, 21.096895355491334, 21.228839242330345, 21.36146614808636, 21.494782902948547, 21.628794629558783, 21.763506450558943, 21.898926903685496, 22.035062819127603, 22.171917611979858, 22.309499819978715, 22.44781627331335, 22.58687209462564, 22.726674114104753, 22.86722916193986, 23.008545775867425, 23.150629078529324, 23.293484192567433, 23.437121363265508, 23.581547420812722, 23.726767487850946, 23.87278839456936, 24.019620386251706, 24.167268585539873, 24.315741530170317, 24.465044342784918, 24.61518726866743, 24.766175430459732, 24.918019073445578, 25.070725027814138, 25.22430012375458, 25.378752899003373, 25.53409018374968, 25.69032393082455, 25.847457555322574, 26.0055013025275, 26.164462002628497, 26.32435160845662, 26.48517524265374, 26.646941442956322, 26.80966045464812, 26.973339107918306, 27.137987648050633, 27.303614612781566, 27.470228539847565, 27.637837966985092, 27.80645143193061, 27.976079179967876, 28.146729748833355, 28.318413383810793, 28.49113691508937, 28.664914003047418, 28.83974977032682, 29.015654462211327, 29.1926383239847, 29.370711600930687, 29.549884538333046, 29.730163966380946, 29.91156354545273, 30.094090105737568, 30.277757307613793, 30.462571981270585, 30.64854437199169, 30.835684725060872, 31.02400670085646, 31.213517129567634, 31.404226256478147, 31.59614432687175, 31.789285001126785, 31.983655109432423, 32.179268312167004, 32.37613485461428, 32.57426498205801, 32.77366552468737, 32.97435355797526, 33.17633932720547, 33.37962966256714, 33.58423480934404, 33.7901718430091, 33.997447593751474, 34.20607572194951, 34.416063057792385, 34.62742667675302, 34.84016999392599, 35.05431008478423, 35.26985719461149, 35.48682156869153, 35.70521686740268, 35.92504992093413, 36.146334389664204, 36.36908051887666, 36.593298553855256, 36.81900557007291, 37.04620498262422, 37.27491045188751, 37.50513563824113, 37.73689078696883, 37.970182728259786, 38.20502853758692, 38.4414350451394, 38.67941249620098, 38.91897455115001, 39.16012804017565, 39.402886623656244, 39.64726396197013, 39.89326005511731, 40.14089539366529, 40.39017339270866, 40.64110771262576, 40.89370859870034, 41.14798288112158, 41.40394080517322, 41.66158920104444, 41.92094172911358, 42.18200521956981, 42.44478650260229, 42.70929582349479, 42.97554342753106, 43.2435293147111, 43.51327056050782, 43.78476716492124, 44.058029373235115, 44.333060600544016, 44.60987109213171, 44.88846426309278, 45.1688435285218, 45.45101913370254, 45.734991078634984, 46.02076277841373, 46.30833764813337, 46.59772251798305, 46.8889139728682, 47.181918842978, 47.47673712831243, 47.7733688288715, 48.071810529560615, 48.3720622303798, 48.67412734642361, 48.9779956324083, 49.28367050342847, 49.59114512929494, 49.90041609491311, 50.21147315499925, 50.52430947936417, 50.8389216529133, 51.155299430362874, 51.47342915133456, 51.793300570544595, 52.11490344270923, 52.43822069235554, 52.763238659105184, 53.08994026748523, 53.41830502692818, 53.7483158619611, 54.079948866921896, 54.413186966337655, 54.74799600926251, 55.084355505128954, 55.42223130299114, 55.761599497186985, 56.10242252167603, 56.44466622551245, 56.78829304265579, 57.13326199197104, 57.479532092323176, 57.82705211729343, 58.17578108574676, 58.525671186359006, 58.87665411723845, 59.22868206706091, 59.58169356412385, 59.93562030653557, 60.29040082259354, 60.64595315002773, 61.00220215675725, 61.35907271070125, 61.7164760194005, 62.074316460206646, 62.432505240660454, 62.79093990792438, 63.14950434878254, 63.508102940586554, 63.86659907955301, 64.22486982227686, 64.58278539516387, 64.94020236424146, 65.29697729553708, 65.65294626451063, 66.00794534662205, 66.3617969569529, 66.71432351058476, 67.06532010184254, 67.41458182505116, 67.7618969443463, 68.10702640310704, 68.44973797490161, 68.78976528235235, 69.12684194808165, 69.46068793433354, 69.79099588259535, 70.11745160416528, 70.43972724996316, 70.75747448034133, 71.07032446508458, 71.37789471359943, 71.67978224472482, 71.97556358673222, 72.26480843770393, 72.54705234477636, 72.82182402489681, 73.08863170444502, 73.34697677961158, 73.59632649564124, 73.8361549279679, 74.06592249164711, 74.28507594135615, 74.49305520158303, 74.68930702700501, 74.87328500248847, 75.044449543089, 75.20226106386214, 75.3462209609985, 75.475844291067, 75.59068026158242, 75.69031223100541, 75.77437136912074, 75.84254348722665, 75.89456220794547, 75.93021579541293, 75.94936764584564, 75.95193579697357, 75.93790658841837, 75.90733466169338, 75.8603429602037, 75.79710906886773, 75.71787887449557, 75.62295290541074, 75.51267950126088, 75.38746164320703, 75.24773646335609, 75.09396841457159, 74.92665610066295, 74.74632544619628, 74.553516036116, 74.34876745536651, 74.13263294927063, 73.90567942352945, 73.66843963289823, 73.4214736528889, 73.16531423825676, 72.90048048337867, 72.62749148263161, 72.34683900963579, 72.05900800782227, 71.7644492696763, 71.4636135876831, 71.15693126376036, 70.8448052790691, 70.52763178458123, 70.20577961051188, 69.87960392669792, 69.54943941240867, 69.21561391672431, 68.87842796796829, 68.53817526427493, 68.19512901321104, 67.84954876196508, 67.50168722753632, 67.15177663635657, 66.80004238466843, 66.44668937814698, 66.09192252246736, 65.73592623273711, 65.37889175425305, 65.02097618136604, 64.66234343861618, 64.30315062035437, 63.94353433036403, 63.58364483280689, 63.22359824089884, 62.863517498044935, 62.50352554765025, 62.14373167274148, 61.7842383261562, 61.425141130542784, 61.0665357085496, 60.70851768282505, 60.35115535526081, 59.9945375183161, 59.63873247388263, 59.283822184230424, 58.92986129087285, 58.576918095701615, 58.22504724023007, 57.874317026349914, 57.52476843519617, 57.17645269318761, 56.82942102674302, 56.483714416997415, 56.13937384508581, 55.796443707237806, 55.454954739304675, 55.11494109223227, 54.77644033206102, 54.43947636445303, 54.104079925259555, 53.77027833523728, 53.43809208495371, 53.10754508007094, 52.77866122625107, 52.451457598967025, 52.125951273691726, 51.8021593258981, 51.48009541596449, 51.159773204269236, 50.84120635119067, 50.52440510201255, 50.20937970201864, 49.8961369813981, 49.58468718543469, 49.27503372922299, 48.96718685804676, 48.661149987000584, 48.35692311608446, 48.05451307548756, 47.75391986520989, 47.455146900346016, 47.158194180895954, 46.8630617068597, 46.56974947823726, 46.278254079934044, 45.988575511950046, 45.700710359190694, 45.414655206561385, 45.13041005406214, 44.84796465640918, 44.56731901360253, 44.288466295453006, 44.011403086866025, 43.736119142557826, 43.46261446252842, 43.19087538639947, 42.920901914170955, 42.65268380055914, 42.38621080028027, 42.12147949823974, 41.858479649153814, 41.59720100773873, 41.33763674380532, 41.07978002716442, 40.82361719743767, 40.56914483953051, 40.31634929306458, 40.06522031275614, 39.815751068416006, 39.56793131476043, 39.32174739141108, 39.07718905308418, 38.83425288468517, 38.59292181074111, 38.35318558596825, 38.11503738017741, 37.87846353299027, 37.64345379912305, 37.409994518197436, 37.178078860024236, 36.947696579319704, 36.718834015705504, 36.49147750880329, 36.26562022842389, 36.04124851418897, 35.81835553590936, 35.596924218112136, 35.37694431551353, 35.15840899792439, 34.94130460496636, 34.72561747626112, 34.51133736652489, 34.29845744556852, 34.08696063791908, 33.876836698292806, 33.66807879650053, 33.46067327216392, 33.25460646490464, 33.04987154453351, 32.84645485067219, 32.64434613803693, 32.443535161343966, 32.24401167530956, 32.04576201955535, 31.8487759487976, 31.653043217752543, 31.458553581136428, 31.265296793665502, 31.07326261005601, 30.882440785024194, 30.692817658191714, 30.504382984274816, 30.31712993308433, 30.131048259336506, 29.946124302652994, 29.762351232844633, 29.579715389533074, 29.398209942529157, 29.217824646549122, 29.038545841214624, 28.860370111431088, 28.68328038172558, 28.507273237003524, 28.332336724433866, 28.15846059873285, 27.985636322164016, 27.81385364944361, 27.64310404283517, 27.473378964602233, 27.30466816946104, 27.13696141212784, 26.970253569960754, 26.80453098258144, 26.639786819800733, 26.476014251429458, 26.313201324636573, 26.151342916780195, 25.99042707502928, 25.830446969194657, 25.67139235399257, 25.51325810678114, 25.356033982276617, 25.199713150289828, 25.044285365537018, 24.889743797829016, 24.736079909429364, 24.583286870148886, 24.431356142251122, 24.280280895546902, 24.130052592299766, 23.980662694773248, 23.832104372778176, 23.684372503672677, 23.537455134625702, 23.39135055808996, 23.2460468212344, 23.101537093869858, 22.957817960901743, 22.814877469499006, 22.67271391211436, 22.53131533591676, 22.39067832581161, 22.250794344062456, 22.11165826802742, 21.973261559970037, 21.83559909724843, 21.69866404967343, 21.562449587055863, 21.426950586753858, 21.292158511030948, 21.15806823724526, 21.02467464275491, 20.89196918982344, 20.759948463356263, 20.62860392561692, 20.497932161510818, 20.367926340848797, 20.23857963344168, 20.109885209100298, 19.981841360277365, 19.854439549236407, 19.727674653335555, 19.601541549932932, 19.476035116386655, 19.351148522507557, 19.22687664565376, 19.103216070730678, 18.98015826000185, 18.857701505919984, 18.73583897829591, 18.614565554487747, 18.49387440430633, 18.373763820204363, 18.25422867953997, 18.135262152123982, 18.016859115314517, 17.899016154016994, 17.781728145589536, 17.664989967390262, 17.54879820432459, 17.433147733750644, 17.31803343302654, 17.203450179510405, 17.089394558107657, 16.97586144617641, 16.86284913616938, 16.7503490903501, 16.638359601171278, 16.52687554599104, 16.415895217262086, 16.30541007724796, 16.195418418401367, 16.085916825627724, 15.976900176285149, 15.868366762826353, 15.760308047514874, 15.652724030350711, 15.54561129623928, 15.43891008102534, 15.332630629992648, 15.226803678992471, 15.121425812930221, 15.016493616711315, 14.912001967693875, 14.807947450783317, 14.704328358432345, 14.601139567999086, 14.498379371936243, 14.396155345723248, 14.294358206333378, 14.192982831124755, 14.092027512550091, 13.991487981741148, 13.891360823603346, 13.791643476815747, 13.692331672510115, 13.593423703139159, 13.49491529983465, 13.396803047502003, 13.299086092367569, 13.201758458015826, 13.104819290673127, 13.008264321471241, 12.912091842862878, 12.816297585979802, 12.720878989501077, 12.625834345879412, 12.531159386246573, 12.436852403055267, 12.342909981210912, 12.249329559392567, 12.156108576279294, 12.063243616776509, 11.970732973336917, 11.878574084639581, 11.786763535589916, 11.695298764866983, 11.60417806492349, 11.51339802066485, 11.422957778317418, 11.332852215239319, 11.243081331430547, 11.153641711796524, 11.064530795016307, 10.975746873542603, 10.887286532280829, 10.799148917457337, 10.711330613977545, 10.623829914294157, 10.536644257086238, 10.449771081032846, 10.363209532360335, 10.276956195974122, 10.191010218100558, 10.105368183645062, 10.020028385060337, 9.934989114799093, 9.850247811540392, 9.76580276773694, 9.681652275841444, 9.597793774532965, 9.514226410037859, 9.43094676726154, 9.34795399243036, 9.265245524223385, 9.182820508866962, 9.100676385040158, 9.018811445195679, 8.937223128012583, 8.855911433490874, 8.774873800309612, 8.694107667147858, 8.613612180231964, 8.53338563201464, 8.45342716872224, 8.373733375260178, 8.294303397854806, 8.215136382732481, 8.136229768572264, 8.057582701600506, 7.979193474269914, 7.9010603790332, 7.823181708343069, 7.74555746219952, 7.668184225507969, 7.591061998268416, 7.514188219159923, 7.437562888182488, 7.361183444015174, 7.285049032884335, 7.209158801016324, 7.133511467750671, 7.05810489865326, 6.982938239950447, 6.908010637868584, 6.833320384860379, 6.758866627152186, 6.684648510970358, 6.610664328767602, 6.536913226770274, 6.463394351204726, 6.390106421410489, 6.317048156727094, 6.244219130267718, 6.1716176344850675, 6.099243242492319, 6.027095100515829, 5.955171927895125, 5.883473297743386, 5.811997929400141, 5.740744542204921, 5.669713563044551, 5.598903284371736, 5.528313279299654, 5.457942694054659, 5.387791101749928, 5.31785722172499, 5.248141053979847, 5.178641744740852, 5.109358440234358, 5.040290713573542, 4.971438137871583, 4.902800286241655, 4.834376304910114, 4.766166193876958, 4.6981695262553655, 4.6303854482716895, 4.562813959925931, 4.4954546343312645, 4.42830704460087, 4.361399365265071, 4.294676527923686, 4.228164572672925, 4.161863926399611, 4.095774589103744, 4.029896133898502, 3.964228133897061, 3.8987714428730667, 3.8335256339396966, 3.768491133983774, 3.7036675161184753, 3.639055207230624, 3.5746546342070435, 3.510465797047733, 3.4464889091961046, 3.3827246109823927, 3.319173115850009, 3.255834637242365, 3.1927100289331074, 3.1297997178090586, 3.067104130757042, 3.0046239081072925, 2.942359690190045, 2.8803125442223565, 2.8184828970910507, 2.756871602569774, 2.6954797278755835, 2.6343081267821264, 2.5733578665064596, 2.5126300142656417, 2.4521254238333183, 2.391845589313371, 2.331791577922857, 2.271964883765657, 2.21236657405883, 2.1529981429062564, 2.093861297855228, 2.0349573195662147, 1.976288129029921, 1.9178550069068157, 1.859659874187603, 1.801704651862987, 1.7439908340368486, 1.686520768586715, 1.6292961630598788, 1.5723191518904556, 1.515591869512561, 1.4591164503603105, 1.40289502886782, 1.346930059634322, 1.2912237838156386, 1.2357785492892965, 1.1805968106545288, 1.1256811292322744, 1.071033959621766, 1.0166579698656482, 0.9625557212848598, 0.9087297752003396, 0.8551829063764379, 0.8019177294949463, 0.7489370726810681, 0.6962436039774478, 0.6438400447875828, 0.5917291698758235, 0.53991375400652, 0.48839630513975835, 0.43717967808116814, 0.38626648751254106, 0.3356593214352423, 0.285360767850637, 0.23537322799710533, 0.1856991964945199, 0.1363409811997682, 0.08730079658824523, 0.03858075708374676], [datetime.datetime(2018, 4, 1, 6, 53, 5, 939948), datetime.datetime(2018, 4, 1, 6, 53, 6, 939948), datetime.datetime(2018, 4, 1, 6, 53, 7, 939947), datetime.datetime(2018, 4, 1, 6, 53, 8, 939947), datetime.datetime(2018, 4, 1, 6, 53, 9, 939947), datetime.datetime(2018, 4, 1, 6, 53, 10, 939947), datetime.datetime(2018, 4, 1, 6, 53, 11, 939947), datetime.datetime(2018, 4, 1, 6, 53, 12, 939947), datetime.datetime(2018, 4, 1, 6, 53, 13, 939947), datetime.datetime(2018, 4, 1, 6, 53, 14, 939947), datetime.datetime(2018, 4, 1, 6, 53, 15, 939947), datetime.datetime(2018, 4, 1, 6, 53, 16, 939947), datetime.datetime(2018, 4, 1, 6, 53, 17, 939947), datetime.datetime(2018, 4, 1, 6, 53, 18, 939947), datetime.datetime(2018, 4, 1, 6, 53, 19, 939947), datetime.datetime(2018, 4, 1, 6, 53, 20, 939947), datetime.datetime(2018, 4, 1, 6, 53, 21, 939947), datetime.datetime(2018, 4, 1, 6, 53, 22, 939947), datetime.datetime(2018, 4, 1, 6, 53, 23, 939947), datetime.datetime(2018, 4, 1, 6, 53, 24, 939947), datetime.datetime(2018, 4, 1, 6, 53, 25, 939947), datetime.datetime(2018, 4, 1, 6, 53, 26, 939947), datetime.datetime(2018, 4, 1, 6, 53, 27, 939947), datetime.datetime(2018, 4, 1, 6, 53, 28, 939947), datetime.datetime(2018, 4, 1, 6, 53, 29, 939947), datetime.datetime(2018, 4, 1, 6, 53, 30, 939947), datetime.datetime(2018, 4, 1, 6, 53, 31, 939947), datetime.datetime(2018, 4, 1, 6, 53, 32, 939947), datetime.datetime(2018, 4, 1, 6, 53, 33, 939947), datetime.datetime(2018, 4, 1, 6, 53, 34, 939947), datetime.datetime(2018, 4, 1, 6, 53, 35, 939947), datetime.datetime(2018, 4, 1, 6, 53, 36, 939947), datetime.datetime(2018, 4, 1, 6, 53, 37, 939947), datetime.datetime(2018, 4, 1, 6, 53, 38, 939947), datetime.datetime(2018, 4, 1, 6, 53, 39, 939947), datetime.datetime(2018, 4, 1, 6, 53, 40, 939947), datetime.datetime(2018, 4, 1, 6, 53, 41, 939947), datetime.datetime(2018, 4, 1, 6, 53, 42, 939947), datetime.datetime(2018, 4, 1, 6, 53, 43, 939947), datetime.datetime(2018, 4, 1, 6, 53, 44, 939947), datetime.datetime(2018, 4, 1, 6, 53, 45, 939947), datetime.datetime(2018, 4, 1, 6, 53, 46, 939947), datetime.datetime(2018, 4, 1, 6, 53, 47, 939947), datetime.datetime(2018, 4, 1, 6, 53, 48, 939947), datetime.datetime(2018, 4, 1, 6, 53, 49, 939947), datetime.datetime(2018, 4, 1, 6, 53, 50, 939947), datetime.datetime(2018, 4, 1, 6, 53, 51, 939947), datetime.datetime(2018, 4, 1, 6, 53, 52, 939947), datetime.datetime(2018, 4, 1, 6, 53, 53, 939947), datetime.datetime(2018, 4, 1, 6, 53, 54, 939947), datetime.datetime(2018, 4, 1, 6, 53, 55, 939947), datetime.datetime(2018, 4, 1, 6, 53, 56, 939947), datetime.datetime(2018, 4, 1, 6, 53, 57, 939947), datetime.datetime(2018, 4, 1, 6, 53, 58, 939947), datetime.datetime(2018, 4, 1, 6, 53, 59, 939947), datetime.datetime(2018, 4, 1, 6, 54, 0, 939947), datetime.datetime(2018, 4, 1, 6, 54, 1, 939947), datetime.datetime(2018, 4, 1, 6, 54, 2, 939946), datetime.datetime(2018, 4, 1, 6, 54, 3, 939945), datetime.datetime(2018, 4, 1, 6, 54, 4, 939944), datetime.datetime(2018, 4, 1, 6, 54, 5, 939943), datetime.datetime(2018, 4, 1, 6, 54, 6, 939942), datetime.datetime(2018, 4, 1, 6, 54, 7, 939941), datetime.datetime(2018, 4, 1, 6, 54, 8, 939940), datetime.datetime(2018, 4, 1, 6, 54, 9, 939939), datetime.datetime(2018, 4, 1, 6, 54, 10, 939938), datetime.datetime(2018, 4, 1, 6, 54, 11, 939937), datetime.datetime(2018, 4, 1, 6, 54, 12, 939937), datetime.datetime(2018, 4, 1, 6, 54, 13, 939936), datetime.datetime(2018, 4, 1, 6, 54, 14, 939935), datetime.datetime(2018, 4, 1, 6, 54, 15, 939934), datetime.datetime(2018, 4, 1, 6, 54, 16, 939933), datetime.datetime(2018, 4, 1, 6, 54, 17, 939932), datetime.datetime(2018, 4, 1, 6, 54, 18, 939931), datetime.datetime(2018, 4, 1, 6, 54, 19, 939930), datetime.datetime(2018, 4, 1, 6, 54, 20, 939930), datetime.datetime(2018, 4, 1, 6, 54, 21, 939930), datetime.datetime(2018, 4, 1, 6, 54, 22, 939930), datetime.datetime(2018, 4, 1, 6, 54, 23, 939929), datetime.datetime(2018, 4, 1, 6, 54, 24, 939928), datetime.datetime(2018, 4, 1, 6, 54, 25, 939927), datetime.datetime(2018, 4, 1, 6, 54, 26, 939926), datetime.datetime(2018, 4, 1, 6, 54, 27, 939925), datetime.datetime(2018, 4, 1, 6, 54, 28, 939925), datetime.datetime(2018, 4, 1, 6, 54, 29, 939924), datetime.datetime(2018, 4, 1, 6, 54, 30, 939923), datetime.datetime(2018, 4, 1, 6, 54, 31, 939922), datetime.datetime(2018, 4, 1, 6, 54, 32, 939921), datetime.datetime(2018, 4, 1, 6, 54, 33, 939920), datetime.datetime(2018, 4, 1, 6, 54, 34, 939919), datetime.datetime(2018, 4, 1, 6, 54, 35, 939918), datetime.datetime(2018, 4, 1, 6, 54, 36, 939917), datetime.datetime(2018, 4, 1, 6, 54, 37, 939916), datetime.datetime(2018, 4, 1, 6, 54, 38, 939915), datetime.datetime(2018, 4, 1, 6, 54, 39, 939914), datetime.datetime(2018, 4, 1, 6, 54, 40, 939913), datetime.datetime(2018, 4, 1, 6, 54, 41, 939913), datetime.datetime(2018, 4, 1, 6, 54, 42, 939912), datetime.datetime(2018, 4, 1, 6, 54, 43, 939911), datetime.datetime(2018, 4, 1, 6, 54, 44, 939910), datetime.datetime(2018, 4, 1, 6, 54, 45, 939909), datetime.datetime(2018, 4, 1, 6, 54, 46, 939908), datetime.datetime(2018, 4, 1, 6, 54, 47, 939908), datetime.datetime(2018, 4, 1, 6, 54, 48, 939908), datetime.datetime(2018, 4, 1, 6, 54, 49, 939908), datetime.datetime(2018, 4, 1, 6, 54, 50, 939907), datetime.datetime(2018, 4, 1, 6, 54, 51, 939906), datetime.datetime(2018, 4, 1, 6, 54, 52, 939905), datetime.datetime(2018, 4, 1, 6, 54, 53, 939904), datetime.datetime(2018, 4, 1, 6, 54, 54, 939903), datetime.datetime(2018, 4, 1, 6, 54, 55, 939903), datetime.datetime(2018, 4, 1, 6, 54, 56, 939903), datetime.datetime(2018, 4, 1, 6, 54, 57, 939903), datetime.datetime(2018, 4, 1, 6, 54, 58, 939902), datetime.datetime(2018, 4, 1, 6, 54, 59, 939901), datetime.datetime(2018, 4, 1, 6, 55, 0, 939900), datetime.datetime(2018, 4, 1, 6, 55, 1, 939900), datetime.datetime(2018, 4, 1, 6, 55, 2, 939900), datetime.datetime(2018, 4, 1, 6, 55, 3, 939900), datetime.datetime(2018, 4, 1, 6, 55, 4, 939900), datetime.datetime(2018, 4, 1, 6, 55, 5, 939900), datetime.datetime(2018, 4, 1, 6, 55, 6, 939900), datetime.datetime(2018, 4, 1, 6, 55, 7, 939899), datetime.datetime(2018, 4, 1, 6, 55, 8, 939898), datetime.datetime(2018, 4, 1, 6, 55, 9, 939898), datetime.datetime(2018, 4, 1, 6, 55, 10, 939898), datetime.datetime(2018, 4, 1, 6, 55, 11, 939898), datetime.datetime(2018, 4, 1, 6, 55, 12, 939898), datetime.datetime(2018, 4, 1, 6, 55, 13, 939898), datetime.datetime(2018, 4, 1, 6, 55, 14, 939898), datetime.datetime(2018, 4, 1, 6, 55, 15, 939898), datetime.datetime(2018, 4, 1, 6, 55, 16, 939898), datetime.datetime(2018, 4, 1, 6, 55, 17, 939898), datetime.datetime(2018, 4, 1, 6, 55, 18, 939898), datetime.datetime(2018, 4, 1, 6, 55, 19, 939898), datetime.datetime(2018, 4, 1, 6, 55, 20, 939898), datetime.datetime(2018, 4, 1, 6, 55, 21, 939898), datetime.datetime(2018, 4, 1, 6, 55, 22, 939898), datetime.datetime(2018, 4, 1, 6, 55, 23, 939898), datetime.datetime(2018, 4, 1, 6, 55, 24, 939898), datetime.datetime(2018, 4, 1, 6, 55, 25, 939898), datetime.datetime(2018, 4, 1, 6, 55, 26, 939898), datetime.datetime(2018, 4, 1, 6, 55, 27, 939898), datetime.datetime(2018, 4, 1, 6, 55, 28, 939898), datetime.datetime(2018, 4, 1, 6, 55, 29, 939898), datetime.datetime(2018, 4, 1, 6, 55, 30, 939898), datetime.datetime(2018, 4, 1, 6, 55, 31, 939897), datetime.datetime(2018, 4, 1, 6, 55, 32, 939896), datetime.datetime(2018, 4, 1, 6, 55, 33, 939895), datetime.datetime(2018, 4, 1, 6, 55, 34, 939894), datetime.datetime(2018, 4, 1, 6, 55, 35, 939893), datetime.datetime(2018, 4, 1, 6, 55, 36, 939893), datetime.datetime(2018, 4, 1, 6, 55, 37, 939893), datetime.datetime(2018, 4, 1, 6, 55, 38, 939893), datetime.datetime(2018, 4, 1, 6, 55, 39, 939892), datetime.datetime(2018, 4, 1, 6, 55, 40, 939891), datetime.datetime(2018, 4, 1, 6, 55, 41, 939891), datetime.datetime(2018, 4, 1, 6, 55, 42, 939891), datetime.datetime(2018, 4, 1, 6, 55, 43, 939891), datetime.datetime(2018, 4, 1, 6, 55, 44, 939891), datetime.datetime(2018, 4, 1, 6, 55, 45, 939891), datetime.datetime(2018, 4, 1, 6, 55, 46, 939891), datetime.datetime(2018, 4, 1, 6, 55, 47, 939891), datetime.datetime(2018, 4, 1, 6, 55, 48, 939891), datetime.datetime(2018, 4, 1, 6, 55, 49, 939891), datetime.datetime(2018, 4, 1, 6, 55, 50, 939891), datetime.datetime(2018, 4, 1, 6, 55, 51, 939891), datetime.datetime(2018, 4, 1, 6, 55, 52, 939891), datetime.datetime(2018, 4, 1, 6, 55, 53, 939891), datetime.datetime(2018, 4, 1, 6, 55, 54, 939891), datetime.datetime(2018, 4, 1, 6, 55, 55, 939891), datetime.datetime(2018, 4, 1, 6, 55, 56, 939891), datetime.datetime(2018, 4, 1, 6, 55, 57, 939891), datetime.datetime(2018, 4, 1, 6, 55, 58, 939891), datetime.datetime(2018, 4, 1, 6, 55, 59, 939891), datetime.datetime(2018, 4, 1, 6, 56, 0, 939891), datetime.datetime(2018, 4, 1, 6, 56, 1, 939891), datetime.datetime(2018, 4, 1, 6, 56, 2, 939891), datetime.datetime(2018, 4, 1, 6, 56, 3, 939891), datetime.datetime(2018, 4, 1, 6, 56, 4, 939891), datetime.datetime(2018, 4, 1, 6, 56, 5, 939891), datetime.datetime(2018, 4, 1, 6, 56, 6, 939891), datetime.datetime(2018, 4, 1, 6, 56, 7, 939891), datetime.datetime(2018, 4, 1, 6, 56, 8, 939891), datetime.datetime(2018, 4, 1, 6, 56, 9, 939891), datetime.datetime(2018, 4, 1, 6, 56, 10, 939891), datetime.datetime(2018, 4, 1, 6, 56, 11, 939891), datetime.datetime(2018, 4, 1, 6, 56, 12, 939891), datetime.datetime(2018, 4, 1, 6, 56, 13, 939891), datetime.datetime(2018, 4, 1, 6, 56, 14, 939891), datetime.datetime(2018, 4, 1, 6, 56, 15, 939891), datetime.datetime(2018, 4, 1, 6, 56, 16, 939891), datetime.datetime(2018, 4, 1, 6, 56, 17, 939891), datetime.datetime(2018, 4, 1, 6, 56, 18, 939891), datetime.datetime(2018, 4, 1, 6, 56, 19, 939891), datetime.datetime(2018, 4, 1, 6, 56, 20, 939891), datetime.datetime(2018, 4, 1, 6, 56, 21, 939891), datetime.datetime(2018, 4, 1, 6, 56, 22, 939891), datetime.datetime(2018, 4, 1, 6, 56, 23, 939891), datetime.datetime(2018, 4, 1, 6, 56, 24, 939891), datetime.datetime(2018, 4, 1, 6, 56, 25, 939891), datetime.datetime(2018, 4, 1, 6, 56, 26, 939891), datetime.datetime(2018, 4, 1, 6, 56, 27, 939891), datetime.datetime(2018, 4, 1, 6, 56, 28, 939891), datetime.datetime(2018, 4, 1, 6, 56, 29, 939891), datetime.datetime(2018, 4, 1, 6, 56, 30, 939891), datetime.datetime(2018, 4, 1, 6, 56, 31, 939891), datetime.datetime(2018, 4, 1, 6, 56, 32, 939891), datetime.datetime(2018, 4, 1, 6, 56, 33, 939891), datetime.datetime(2018, 4, 1, 6, 56, 34, 939891), datetime.datetime(2018, 4, 1, 6, 56, 35, 939891), datetime.datetime(2018, 4, 1, 6, 56, 36, 939891), datetime.datetime(2018, 4, 1, 6, 56, 37, 939891), datetime.datetime(2018, 4, 1, 6, 56, 38, 939891), datetime.datetime(2018, 4, 1, 6, 56, 39, 939891), datetime.datetime(2018, 4, 1, 6, 56, 40, 939891), datetime.datetime(2018, 4, 1, 6, 56, 41, 939891), datetime.datetime(2018, 4, 1, 6, 56, 42, 939891), datetime.datetime(2018, 4, 1, 6, 56, 43, 939891), datetime.datetime(2018, 4, 1, 6, 56, 44, 939891), datetime.datetime(2018, 4, 1, 6, 56, 45, 939891), datetime.datetime(2018, 4, 1, 6, 56, 46, 939891), datetime.datetime(2018, 4, 1, 6, 56, 47, 939891), datetime.datetime(2018, 4, 1, 6, 56, 48, 939891), datetime.datetime(2018, 4, 1, 6, 56, 49, 939891), datetime.datetime(2018, 4, 1, 6, 56, 50, 939891), datetime.datetime(2018, 4, 1, 6, 56, 51, 939891), datetime.datetime(2018, 4, 1, 6, 56, 52, 939891), datetime.datetime(2018, 4, 1, 6, 56, 53, 939891), datetime.datetime(2018, 4, 1, 6, 56, 54, 939891), datetime.datetime(2018, 4, 1, 6, 56, 55, 939891), datetime.datetime(2018, 4, 1, 6, 56, 56, 939891), datetime.datetime(2018, 4, 1, 6, 56, 57, 939891), datetime.datetime(2018, 4, 1, 6, 56, 58, 939891), datetime.datetime(2018, 4, 1, 6, 56, 59, 939891), datetime.datetime(2018, 4, 1, 6, 57, 0, 939891), datetime.datetime(2018, 4, 1, 6, 57, 1, 939891), datetime.datetime(2018, 4, 1, 6, 57, 2, 939890), datetime.datetime(2018, 4, 1, 6, 57, 3, 939889), datetime.datetime(2018, 4, 1, 6, 57, 4, 939888), datetime.datetime(2018, 4, 1, 6, 57, 5, 939887), datetime.datetime(2018, 4, 1, 6, 57, 6, 939886), datetime.datetime(2018, 4, 1, 6, 57, 7, 939885), datetime.datetime(2018, 4, 1, 6, 57, 8, 939884), datetime.datetime(2018, 4, 1, 6, 57, 9, 939883), datetime.datetime(2018, 4, 1, 6, 57, 10, 939882), datetime.datetime(2018, 4, 1, 6, 57, 11, 939881), datetime.datetime(2018, 4, 1, 6, 57, 12, 939881), datetime.datetime(2018, 4, 1, 6, 57, 13, 939880), datetime.datetime(2018, 4, 1, 6, 57, 14, 939879), datetime.datetime(2018, 4, 1, 6, 57, 15, 939878), datetime.datetime(2018, 4, 1, 6, 57, 16, 939877), datetime.datetime(2018, 4, 1, 6, 57, 17, 939876), datetime.datetime(2018, 4, 1, 6, 57, 18, 939875), datetime.datetime(2018, 4, 1, 6, 57, 19, 939874), datetime.datetime(2018, 4, 1, 6, 57, 20, 939873), datetime.datetime(2018, 4, 1, 6, 57, 21, 939872), datetime.datetime(2018, 4, 1, 6, 57, 22, 939871), datetime.datetime(2018, 4, 1, 6, 57, 23, 939870), datetime.datetime(2018, 4, 1, 6, 57, 24, 939869), datetime.datetime(2018, 4, 1, 6, 57, 25, 939869), datetime.datetime(2018, 4, 1, 6, 57, 26, 939868), datetime.datetime(2018, 4, 1, 6, 57, 27, 939867), datetime.datetime(2018, 4, 1, 6, 57, 28, 939866), datetime.datetime(2018, 4, 1, 6, 57, 29, 939865), datetime.datetime(2018, 4, 1, 6, 57, 30, 939864), datetime.datetime(2018, 4, 1, 6, 57, 31, 939863), datetime.datetime(2018, 4, 1, 6, 57, 32, 939862), datetime.datetime(2018, 4, 1, 6, 57, 33, 939861), datetime.datetime(2018, 4, 1, 6, 57, 34, 939860), datetime.datetime(2018, 4, 1, 6, 57, 35, 939859), datetime.datetime(2018, 4, 1, 6, 57, 36, 939859), datetime.datetime(2018, 4, 1, 6, 57, 37, 939858), datetime.datetime(2018, 4, 1, 6, 57, 38, 939857), datetime.datetime(2018, 4, 1, 6, 57, 39, 939856), datetime.datetime(2018, 4, 1, 6, 57, 40, 939855), datetime.datetime(2018, 4, 1, 6, 57, 41, 939854), datetime.datetime(2018, 4, 1, 6, 57, 42, 939853), datetime.datetime(2018, 4, 1, 6, 57, 43, 939852), datetime.datetime(2018, 4, 1, 6, 57, 44, 939851), datetime.datetime(2018, 4, 1, 6, 57, 45, 939850), datetime.datetime(2018, 4, 1, 6, 57, 46, 939849), datetime.datetime(2018, 4, 1, 6, 57, 47, 939849), datetime.datetime(2018, 4, 1, 6, 57, 48, 939848), datetime.datetime(2018, 4, 1, 6, 57, 49, 939847), datetime.datetime(2018, 4, 1, 6, 57, 50, 939846), datetime.datetime(2018, 4, 1, 6, 57, 51, 939845), datetime.datetime(2018, 4, 1, 6, 57, 52, 939844), datetime.datetime(2018, 4, 1, 6, 57, 53, 939843), datetime.datetime(2018, 4, 1, 6, 57, 54, 939842), datetime.datetime(2018, 4, 1, 6, 57, 55, 939842), datetime.datetime(2018, 4, 1, 6, 57, 56, 939841), datetime.datetime(2018, 4, 1, 6, 57, 57, 939840), datetime.datetime(2018, 4, 1, 6, 57, 58, 939839), datetime.datetime(2018, 4, 1, 6, 57, 59, 939838), datetime.datetime(2018, 4, 1, 6, 58, 0, 939837), datetime.datetime(2018, 4, 1, 6, 58, 1, 939837), datetime.datetime(2018, 4, 1, 6, 58, 2, 939837), datetime.datetime(2018, 4, 1, 6, 58, 3, 939837), datetime.datetime(2018, 4, 1, 6, 58, 4, 939837), datetime.datetime(2018, 4, 1, 6, 58, 5, 939837), datetime.datetime(2018, 4, 1, 6, 58, 6, 939837), datetime.datetime(2018, 4, 1, 6, 58, 7, 939837), datetime.datetime(2018, 4, 1, 6, 58, 8, 939837), datetime.datetime(2018, 4, 1, 6, 58, 9, 939837), datetime.datetime(2018, 4, 1, 6, 58, 10, 939837), datetime.datetime(2018, 4, 1, 6, 58, 11, 939837), datetime.datetime(2018, 4, 1, 6, 58, 12, 939837), datetime.datetime(2018, 4, 1, 6, 58, 13, 939837), datetime.datetime(2018, 4, 1, 6, 58, 14, 939837), datetime.datetime(2018, 4, 1, 6, 58, 15, 939837), datetime.datetime(2018, 4, 1, 6, 58, 16, 939837), datetime.datetime(2018, 4, 1, 6, 58, 17, 939837), datetime.datetime(2018, 4, 1, 6, 58, 18, 939837), datetime.datetime(2018, 4, 1, 6, 58, 19, 939837), datetime.datetime(2018, 4, 1, 6, 58, 20, 939837), datetime.datetime(2018, 4, 1, 6, 58, 21, 939837), datetime.datetime(2018, 4, 1, 6, 58, 22, 939837), datetime.datetime(2018, 4, 1, 6, 58, 23, 939836), datetime.datetime(2018, 4, 1, 6, 58, 24, 939835), datetime.datetime(2018, 4, 1, 6, 58, 25, 939834), datetime.datetime(2018, 4, 1, 6, 58, 26, 939833), datetime.datetime(2018, 4, 1, 6, 58, 27, 939832), datetime.datetime(2018, 4, 1, 6, 58, 28, 939832), datetime.datetime(2018, 4, 1, 6, 58, 29, 939832), datetime.datetime(2018, 4, 1, 6, 58, 30, 939832), datetime.datetime(2018, 4, 1, 6, 58, 31, 939831), datetime.datetime(2018, 4, 1, 6, 58, 32, 939830), datetime.datetime(2018, 4, 1, 6, 58, 33, 939829), datetime.datetime(2018, 4, 1, 6, 58, 34, 939828), datetime.datetime(2018, 4, 1, 6, 58, 35, 939827), datetime.datetime(2018, 4, 1, 6, 58, 36, 939827), datetime.datetime(2018, 4, 1, 6, 58, 37, 939827), datetime.datetime(2018, 4, 1, 6, 58, 38, 939827), datetime.datetime(2018, 4, 1, 6, 58, 39, 939826), datetime.datetime(2018, 4, 1, 6, 58, 40, 939825), datetime.datetime(2018, 4, 1, 6, 58, 41, 939825), datetime.datetime(2018, 4, 1, 6, 58, 42, 939825), datetime.datetime(2018, 4, 1, 6, 58, 43, 939825), datetime.datetime(2018, 4, 1, 6, 58, 44, 939825), datetime.datetime(2018, 4, 1, 6, 58, 45, 939825), datetime.datetime(2018, 4, 1, 6, 58, 46, 939825), datetime.datetime(2018, 4, 1, 6, 58, 47, 939825), datetime.datetime(2018, 4, 1, 6, 58, 48, 939825), datetime.datetime(2018, 4, 1, 6, 58, 49, 939825), datetime.datetime(2018, 4, 1, 6, 58, 50, 939825), datetime.datetime(2018, 4, 1, 6, 58, 51, 939825), datetime.datetime(2018, 4, 1, 6, 58, 52, 939825), datetime.datetime(2018, 4, 1, 6, 58, 53, 939825), datetime.datetime(2018, 4, 1, 6, 58, 54, 939825), datetime.datetime(2018, 4, 1, 6, 58, 55, 939825), datetime.datetime(2018, 4, 1, 6, 58, 56, 939825), datetime.datetime(2018, 4, 1, 6, 58, 57, 939825), datetime.datetime(2018, 4, 1, 6, 58, 58, 939825), datetime.datetime(2018, 4, 1, 6, 58, 59, 939825), datetime.datetime(2018, 4, 1, 6, 59, 0, 939825), datetime.datetime(2018, 4, 1, 6, 59, 1, 939825), datetime.datetime(2018, 4, 1, 6, 59, 2, 939825), datetime.datetime(2018, 4, 1, 6, 59, 3, 939825), datetime.datetime(2018, 4, 1, 6, 59, 4, 939825), datetime.datetime(2018, 4, 1, 6, 59, 5, 939825), datetime.datetime(2018, 4, 1, 6, 59, 6, 939825), datetime.datetime(2018, 4, 1, 6, 59, 7, 939825), datetime.datetime(2018, 4, 1, 6, 59, 8, 939825), datetime.datetime(2018, 4, 1, 6, 59, 9, 939825), datetime.datetime(2018, 4, 1, 6, 59, 10, 939825), datetime.datetime(2018, 4, 1, 6, 59, 11, 939825), datetime.datetime(2018, 4, 1, 6, 59, 12, 939825), datetime.datetime(2018, 4, 1, 6, 59, 13, 939825), datetime.datetime(2018, 4, 1, 6, 59, 14, 939825), datetime.datetime(2018, 4, 1, 6, 59, 15, 939825), datetime.datetime(2018, 4, 1, 6, 59, 16, 939825), datetime.datetime(2018, 4, 1, 6, 59, 17, 939825), datetime.datetime(2018, 4, 1, 6, 59, 18, 939825), datetime.datetime(2018, 4, 1, 6, 59, 19, 939825), datetime.datetime(2018, 4, 1, 6, 59, 20, 939825), datetime.datetime(2018, 4, 1, 6, 59, 21, 939825), datetime.datetime(2018, 4, 1, 6, 59, 22, 939825), datetime.datetime(2018, 4, 1, 6, 59, 23, 939825), datetime.datetime(2018, 4, 1, 6, 59, 24, 939825), datetime.datetime(2018, 4, 1, 6, 59, 25, 939825), datetime.datetime(2018, 4, 1, 6, 59, 26, 939825), datetime.datetime(2018, 4, 1, 6, 59, 27, 939825), datetime.datetime(2018, 4, 1, 6, 59, 28, 939825), datetime.datetime(2018, 4, 1, 6, 59, 29, 939825), datetime.datetime(2018, 4, 1, 6, 59, 30, 939825), datetime.datetime(2018, 4, 1, 6, 59, 31, 939825), datetime.datetime(2018, 4, 1, 6, 59, 32, 939825), datetime.datetime(2018, 4, 1, 6, 59, 33, 939825), datetime.datetime(2018, 4, 1, 6, 59, 34, 939825), datetime.datetime(2018, 4, 1, 6, 59, 35, 939825), datetime.datetime(2018, 4, 1, 6, 59, 36, 939825), datetime.datetime(2018, 4, 1, 6, 59, 37, 939825), datetime.datetime(2018, 4, 1, 6, 59, 38, 939825), datetime.datetime(2018, 4, 1, 6, 59, 39, 939825), datetime.datetime(2018, 4, 1, 6, 59, 40, 939825), datetime.datetime(2018, 4, 1, 6, 59, 41, 939825), datetime.datetime(2018, 4, 1, 6, 59, 42, 939825), datetime.datetime(2018, 4, 1, 6, 59, 43, 939825), datetime.datetime(2018, 4, 1, 6, 59, 44, 939825), datetime.datetime(2018, 4, 1, 6, 59, 45, 939825), datetime.datetime(2018, 4, 1, 6, 59, 46, 939825), datetime.datetime(2018, 4, 1, 6, 59, 47, 939825), datetime.datetime(2018, 4, 1, 6, 59, 48, 939825), datetime.datetime(2018, 4, 1, 6, 59, 49, 939825), datetime.datetime(2018, 4, 1, 6, 59, 50, 939825), datetime.datetime(2018, 4, 1, 6, 59, 51, 939825), datetime.datetime(2018, 4, 1, 6, 59, 52, 939825), datetime.datetime(2018, 4, 1, 6, 59, 53, 939825), datetime.datetime(2018, 4, 1, 6, 59, 54, 939825), datetime.datetime(2018, 4, 1, 6, 59, 55, 939825), datetime.datetime(2018, 4, 1, 6, 59, 56, 939825), datetime.datetime(2018, 4, 1, 6, 59, 57, 939825), datetime.datetime(2018, 4, 1, 6, 59, 58, 939825), datetime.datetime(2018, 4, 1, 6, 59, 59, 939825), datetime.datetime(2018, 4, 1, 7, 0, 0, 939825), datetime.datetime(2018, 4, 1, 7, 0, 1, 939825), datetime.datetime(2018, 4, 1, 7, 0, 2, 939824), datetime.datetime(2018, 4, 1, 7, 0, 3, 939823), datetime.datetime(2018, 4, 1, 7, 0, 4, 939822), datetime.datetime(2018, 4, 1, 7, 0, 5, 939821), datetime.datetime(2018, 4, 1, 7, 0, 6, 939820), datetime.datetime(2018, 4, 1, 7, 0, 7, 939819), datetime.datetime(2018, 4, 1, 7, 0, 8, 939818), datetime.datetime(2018, 4, 1, 7, 0, 9, 939817), datetime.datetime(2018, 4, 1, 7, 0, 10, 939816), datetime.datetime(2018, 4, 1, 7, 0, 11, 939815), datetime.datetime(2018, 4, 1, 7, 0, 12, 939815), datetime.datetime(2018, 4, 1, 7, 0, 13, 939814), datetime.datetime(2018, 4, 1, 7, 0, 14, 939813), datetime.datetime(2018, 4, 1, 7, 0, 15, 939812), datetime.datetime(2018, 4, 1, 7, 0, 16, 939811), datetime.datetime(2018, 4, 1, 7, 0, 17, 939810), datetime.datetime(2018, 4, 1, 7, 0, 18, 939809), datetime.datetime(2018, 4, 1, 7, 0, 19, 939808), datetime.datetime(2018, 4, 1, 7, 0, 20, 939807), datetime.datetime(2018, 4, 1, 7, 0, 21, 939806), datetime.datetime(2018, 4, 1, 7, 0, 22, 939805), datetime.datetime(2018, 4, 1, 7, 0, 23, 939804), datetime.datetime(2018, 4, 1, 7, 0, 24, 939803), datetime.datetime(2018, 4, 1, 7, 0, 25, 939803), datetime.datetime(2018, 4, 1, 7, 0, 26, 939802), datetime.datetime(2018, 4, 1, 7, 0, 27, 939801), datetime.datetime(2018, 4, 1, 7, 0, 28, 939800), datetime.datetime(2018, 4, 1, 7, 0, 29, 939799), datetime.datetime(2018, 4, 1, 7, 0, 30, 939798), datetime.datetime(2018, 4, 1, 7, 0, 31, 939797), datetime.datetime(2018, 4, 1, 7, 0, 32, 939796), datetime.datetime(2018, 4, 1, 7, 0, 33, 939795), datetime.datetime(2018, 4, 1, 7, 0, 34, 939794), datetime.datetime(2018, 4, 1, 7, 0, 35, 939793), datetime.datetime(2018, 4, 1, 7, 0, 36, 939793), datetime.datetime(2018, 4, 1, 7, 0, 37, 939792), datetime.datetime(2018, 4, 1, 7, 0, 38, 939791), datetime.datetime(2018, 4, 1, 7, 0, 39, 939790), datetime.datetime(2018, 4, 1, 7, 0, 40, 939789), datetime.datetime(2018, 4, 1, 7, 0, 41, 939788), datetime.datetime(2018, 4, 1, 7, 0, 42, 939787), datetime.datetime(2018, 4, 1, 7, 0, 43, 939786), datetime.datetime(2018, 4, 1, 7, 0, 44, 939785), datetime.datetime(2018, 4, 1, 7, 0, 45, 939784), datetime.datetime(2018, 4, 1, 7, 0, 46, 939783), datetime.datetime(2018, 4, 1, 7, 0, 47, 939783), datetime.datetime(2018, 4, 1, 7, 0, 48, 939782), datetime.datetime(2018, 4, 1, 7, 0, 49, 939781), datetime.datetime(2018, 4, 1, 7, 0, 50, 939780), datetime.datetime(2018, 4, 1, 7, 0, 51, 939779), datetime.datetime(2018, 4, 1, 7, 0, 52, 939778), datetime.datetime(2018, 4, 1, 7, 0, 53, 939777), datetime.datetime(2018, 4, 1, 7, 0, 54, 939776), datetime.datetime(2018, 4, 1, 7, 0, 55, 939776), datetime.datetime(2018, 4, 1, 7, 0, 56, 939775), datetime.datetime(2018, 4, 1, 7, 0, 57, 939774), datetime.datetime(2018, 4, 1, 7, 0, 58, 939773), datetime.datetime(2018, 4, 1, 7, 0, 59, 939772), datetime.datetime(2018, 4, 1, 7, 1, 0, 939771), datetime.datetime(2018, 4, 1, 7, 1, 1, 939771), datetime.datetime(2018, 4, 1, 7, 1, 2, 939771), datetime.datetime(2018, 4, 1, 7, 1, 3, 939771), datetime.datetime(2018, 4, 1, 7, 1, 4, 939771), datetime.datetime(2018, 4, 1, 7, 1, 5, 939771), datetime.datetime(2018, 4, 1, 7, 1, 6, 939771), datetime.datetime(2018, 4, 1, 7, 1, 7, 939770), datetime.datetime(2018, 4, 1, 7, 1, 8, 939769), datetime.datetime(2018, 4, 1, 7, 1, 9, 939768), datetime.datetime(2018, 4, 1, 7, 1, 10, 939767), datetime.datetime(2018, 4, 1, 7, 1, 11, 939766), datetime.datetime(2018, 4, 1, 7, 1, 12, 939766), datetime.datetime(2018, 4, 1, 7, 1, 13, 939766), datetime.datetime(2018, 4, 1, 7, 1, 14, 939766), datetime.datetime(2018, 4, 1, 7, 1, 15, 939765), datetime.datetime(2018, 4, 1, 7, 1, 16, 939764), datetime.datetime(2018, 4, 1, 7, 1, 17, 939763), datetime.datetime(2018, 4, 1, 7, 1, 18, 939762), datetime.datetime(2018, 4, 1, 7, 1, 19, 939761), datetime.datetime(2018, 4, 1, 7, 1, 20, 939761), datetime.datetime(2018, 4, 1, 7, 1, 21, 939761), datetime.datetime(2018, 4, 1, 7, 1, 22, 939761), datetime.datetime(2018, 4, 1, 7, 1, 23, 939760), datetime.datetime(2018, 4, 1, 7, 1, 24, 939759), datetime.datetime(2018, 4, 1, 7, 1, 25, 939759), datetime.datetime(2018, 4, 1, 7, 1, 26, 939759), datetime.datetime(2018, 4, 1, 7, 1, 27, 939759), datetime.datetime(2018, 4, 1, 7, 1, 28, 939759), datetime.datetime(2018, 4, 1, 7, 1, 29, 939759), datetime.datetime(2018, 4, 1, 7, 1, 30, 939759), datetime.datetime(2018, 4, 1, 7, 1, 31, 939758), datetime.datetime(2018, 4, 1, 7, 1, 32, 939757), datetime.datetime(2018, 4, 1, 7, 1, 33, 939756), datetime.datetime(2018, 4, 1, 7, 1, 34, 939755), datetime.datetime(2018, 4, 1, 7, 1, 35, 939754), datetime.datetime(2018, 4, 1, 7, 1, 36, 939754), datetime.datetime(2018, 4, 1, 7, 1, 37, 939754), datetime.datetime(2018, 4, 1, 7, 1, 38, 939754), datetime.datetime(2018, 4, 1, 7, 1, 39, 939753), datetime.datetime(2018, 4, 1, 7, 1, 40, 939752), datetime.datetime(2018, 4, 1, 7, 1, 41, 939751), datetime.datetime(2018, 4, 1, 7, 1, 42, 939750), datetime.datetime(2018, 4, 1, 7, 1, 43, 939749), datetime.datetime(2018, 4, 1, 7, 1, 44, 939749), datetime.datetime(2018, 4, 1, 7, 1, 45, 939749), datetime.datetime(2018, 4, 1, 7, 1, 46, 939749), datetime.datetime(2018, 4, 1, 7, 1, 47, 939749), datetime.datetime(2018, 4, 1, 7, 1, 48, 939749), datetime.datetime(2018, 4, 1, 7, 1, 49, 939749), datetime.datetime(2018, 4, 1, 7, 1, 50, 939748), datetime.datetime(2018, 4, 1, 7, 1, 51, 939747), datetime.datetime(2018, 4, 1, 7, 1, 52, 939746), datetime.datetime(2018, 4, 1, 7, 1, 53, 939745), datetime.datetime(2018, 4, 1, 7, 1, 54, 939744), datetime.datetime(2018, 4, 1, 7, 1, 55, 939744), datetime.datetime(2018, 4, 1, 7, 1, 56, 939744), datetime.datetime(2018, 4, 1, 7, 1, 57, 939744), datetime.datetime(2018, 4, 1, 7, 1, 58, 939743), datetime.datetime(2018, 4, 1, 7, 1, 59, 939742), datetime.datetime(2018, 4, 1, 7, 2, 0, 939741), datetime.datetime(2018, 4, 1, 7, 2, 1, 939740), datetime.datetime(2018, 4, 1, 7, 2, 2, 939739), datetime.datetime(2018, 4, 1, 7, 2, 3, 939738), datetime.datetime(2018, 4, 1, 7, 2, 4, 939737), datetime.datetime(2018, 4, 1, 7, 2, 5, 939736), datetime.datetime(2018, 4, 1, 7, 2, 6, 939735), datetime.datetime(2018, 4, 1, 7, 2, 7, 939734), datetime.datetime(2018, 4, 1, 7, 2, 8, 939733), datetime.datetime(2018, 4, 1, 7, 2, 9, 939732), datetime.datetime(2018, 4, 1, 7, 2, 10, 939731), datetime.datetime(2018, 4, 1, 7, 2, 11, 939730), datetime.datetime(2018, 4, 1, 7, 2, 12, 939729), datetime.datetime(2018, 4, 1, 7, 2, 13, 939728), datetime.datetime(2018, 4, 1, 7, 2, 14, 939727), datetime.datetime(2018, 4, 1, 7, 2, 15, 939726), datetime.datetime(2018, 4, 1, 7, 2, 16, 939725), datetime.datetime(2018, 4, 1, 7, 2, 17, 939724), datetime.datetime(2018, 4, 1, 7, 2, 18, 939723), datetime.datetime(2018, 4, 1, 7, 2, 19, 939722), datetime.datetime(2018, 4, 1, 7, 2, 20, 939722), datetime.datetime(2018, 4, 1, 7, 2, 21, 939721), datetime.datetime(2018, 4, 1, 7, 2, 22, 939720), datetime.datetime(2018, 4, 1, 7, 2, 23, 939719), datetime.datetime(2018, 4, 1, 7, 2, 24, 939718), datetime.datetime(2018, 4, 1, 7, 2, 25, 939717), datetime.datetime(2018, 4, 1, 7, 2, 26, 939716), datetime.datetime(2018, 4, 1, 7, 2, 27, 939715), datetime.datetime(2018, 4, 1, 7, 2, 28, 939715), datetime.datetime(2018, 4, 1, 7, 2, 29, 939714), datetime.datetime(2018, 4, 1, 7, 2, 30, 939713), datetime.datetime(2018, 4, 1, 7, 2, 31, 939712), datetime.datetime(2018, 4, 1, 7, 2, 32, 939711), datetime.datetime(2018, 4, 1, 7, 2, 33, 939710), datetime.datetime(2018, 4, 1, 7, 2, 34, 939709), datetime.datetime(2018, 4, 1, 7, 2, 35, 939708), datetime.datetime(2018, 4, 1, 7, 2, 36, 939707), datetime.datetime(2018, 4, 1, 7, 2, 37, 939706), datetime.datetime(2018, 4, 1, 7, 2, 38, 939705), datetime.datetime(2018, 4, 1, 7, 2, 39, 939704), datetime.datetime(2018, 4, 1, 7, 2, 40, 939703), datetime.datetime(2018, 4, 1, 7, 2, 41, 939702), datetime.datetime(2018, 4, 1, 7, 2, 42, 939701), datetime.datetime(2018, 4, 1, 7, 2, 43, 939700), datetime.datetime(2018, 4, 1, 7, 2, 44, 939699), datetime.datetime(2018, 4, 1, 7, 2, 45, 939698), datetime.datetime(2018, 4, 1, 7, 2, 46, 939697), datetime.datetime(2018, 4, 1, 7, 2, 47, 939696), datetime.datetime(2018, 4, 1, 7, 2, 48, 939695), datetime.datetime(2018, 4, 1, 7, 2, 49, 939694), datetime.datetime(2018, 4, 1, 7, 2, 50, 939693), datetime.datetime(2018, 4, 1, 7, 2, 51, 939692), datetime.datetime(2018, 4, 1, 7, 2, 52, 939691), datetime.datetime(2018, 4, 1, 7, 2, 53, 939690), datetime.datetime(2018, 4, 1, 7, 2, 54, 939689), datetime.datetime(2018, 4, 1, 7, 2, 55, 939688), datetime.datetime(2018, 4, 1, 7, 2, 56, 939687), datetime.datetime(2018, 4, 1, 7, 2, 57, 939686), datetime.datetime(2018, 4, 1, 7, 2, 58, 939685), datetime.datetime(2018, 4, 1, 7, 2, 59, 939684), datetime.datetime(2018, 4, 1, 7, 3, 0, 939683), datetime.datetime(2018, 4, 1, 7, 3, 1, 939683), datetime.datetime(2018, 4, 1, 7, 3, 2, 939682), datetime.datetime(2018, 4, 1, 7, 3, 3, 939681), datetime.datetime(2018, 4, 1, 7, 3, 4, 939680), datetime.datetime(2018, 4, 1, 7, 3, 5, 939679), datetime.datetime(2018, 4, 1, 7, 3, 6, 939678), datetime.datetime(2018, 4, 1, 7, 3, 7, 939677), datetime.datetime(2018, 4, 1, 7, 3, 8, 939676), datetime.datetime(2018, 4, 1, 7, 3, 9, 939676), datetime.datetime(2018, 4, 1, 7, 3, 10, 939675), datetime.datetime(2018, 4, 1, 7, 3, 11, 939674), datetime.datetime(2018, 4, 1, 7, 3, 12, 939673), datetime.datetime(2018, 4, 1, 7, 3, 13, 939672), datetime.datetime(2018, 4, 1, 7, 3, 14, 939671), datetime.datetime(2018, 4, 1, 7, 3, 15, 939670), datetime.datetime(2018, 4, 1, 7, 3, 16, 939669), datetime.datetime(2018, 4, 1, 7, 3, 17, 939668), datetime.datetime(2018, 4, 1, 7, 3, 18, 939667), datetime.datetime(2018, 4, 1, 7, 3, 19, 939666), datetime.datetime(2018, 4, 1, 7, 3, 20, 939666), datetime.datetime(2018, 4, 1, 7, 3, 21, 939665), datetime.datetime(2018, 4, 1, 7, 3, 22, 939664), datetime.datetime(2018, 4, 1, 7, 3, 23, 939663), datetime.datetime(2018, 4, 1, 7, 3, 24, 939662), datetime.datetime(2018, 4, 1, 7, 3, 25, 939661), datetime.datetime(2018, 4, 1, 7, 3, 26, 939660), datetime.datetime(2018, 4, 1, 7, 3, 27, 939659), datetime.datetime(2018, 4, 1, 7, 3, 28, 939658), datetime.datetime(2018, 4, 1, 7, 3, 29, 939657), datetime.datetime(2018, 4, 1, 7, 3, 30, 939656), datetime.datetime(2018, 4, 1, 7, 3, 31, 939655), datetime.datetime(2018, 4, 1, 7, 3, 32, 939654), datetime.datetime(2018, 4, 1, 7, 3, 33, 939654), datetime.datetime(2018, 4, 1, 7, 3, 34, 939653), datetime.datetime(2018, 4, 1, 7, 3, 35, 939652), datetime.datetime(2018, 4, 1, 7, 3, 36, 939651), datetime.datetime(2018, 4, 1, 7, 3, 37, 939650), datetime.datetime(2018, 4, 1, 7, 3, 38, 939649), datetime.datetime(2018, 4, 1, 7, 3, 39, 939648), datetime.datetime(2018, 4, 1, 7, 3, 40, 939647), datetime.datetime(2018, 4, 1, 7, 3, 41, 939646), datetime.datetime(2018, 4, 1, 7, 3, 42, 939645), datetime.datetime(2018, 4, 1, 7, 3, 43, 939644), datetime.datetime(2018, 4, 1, 7, 3, 44, 939644), datetime.datetime(2018, 4, 1, 7, 3, 45, 939643), datetime.datetime(2018, 4, 1, 7, 3, 46, 939642), datetime.datetime(2018, 4, 1, 7, 3, 47, 939641), datetime.datetime(2018, 4, 1, 7, 3, 48, 939640), datetime.datetime(2018, 4, 1, 7, 3, 49, 939639), datetime.datetime(2018, 4, 1, 7, 3, 50, 939638), datetime.datetime(2018, 4, 1, 7, 3, 51, 939637), datetime.datetime(2018, 4, 1, 7, 3, 52, 939636), datetime.datetime(2018, 4, 1, 7, 3, 53, 939635), datetime.datetime(2018, 4, 1, 7, 3, 54, 939634), datetime.datetime(2018, 4, 1, 7, 3, 55, 939634), datetime.datetime(2018, 4, 1, 7, 3, 56, 939633), datetime.datetime(2018, 4, 1, 7, 3, 57, 939632), datetime.datetime(2018, 4, 1, 7, 3, 58, 939631), datetime.datetime(2018, 4, 1, 7, 3, 59, 939630), datetime.datetime(2018, 4, 1, 7, 4, 0, 939629), datetime.datetime(2018, 4, 1, 7, 4, 1, 939629), datetime.datetime(2018, 4, 1, 7, 4, 2, 939628), datetime.datetime(2018, 4, 1, 7, 4, 3, 939627), datetime.datetime(2018, 4, 1, 7, 4, 4, 939627), datetime.datetime(2018, 4, 1, 7, 4, 5, 939627), datetime.datetime(2018, 4, 1, 7, 4, 6, 939627), datetime.datetime(2018, 4, 1, 7, 4, 7, 939626), datetime.datetime(2018, 4, 1, 7, 4, 8, 939625), datetime.datetime(2018, 4, 1, 7, 4, 9, 939624), datetime.datetime(2018, 4, 1, 7, 4, 10, 939623), datetime.datetime(2018, 4, 1, 7, 4, 11, 939622), datetime.datetime(2018, 4, 1, 7, 4, 12, 939622), datetime.datetime(2018, 4, 1, 7, 4, 13, 939622), datetime.datetime(2018, 4, 1, 7, 4, 14, 939622), datetime.datetime(2018, 4, 1, 7, 4, 15, 939621), datetime.datetime(2018, 4, 1, 7, 4, 16, 939620), datetime.datetime(2018, 4, 1, 7, 4, 17, 939619), datetime.datetime(2018, 4, 1, 7, 4, 18, 939618), datetime.datetime(2018, 4, 1, 7, 4, 19, 939617), datetime.datetime(2018, 4, 1, 7, 4, 20, 939617), datetime.datetime(2018, 4, 1, 7, 4, 21, 939617), datetime.datetime(2018, 4, 1, 7, 4, 22, 939617), datetime.datetime(2018, 4, 1, 7, 4, 23, 939616), datetime.datetime(2018, 4, 1, 7, 4, 24, 939615), datetime.datetime(2018, 4, 1, 7, 4, 25, 939614), datetime.datetime(2018, 4, 1, 7, 4, 26, 939613), datetime.datetime(2018, 4, 1, 7, 4, 27, 939612), datetime.datetime(2018, 4, 1, 7, 4, 28, 939612), datetime.datetime(2018, 4, 1, 7, 4, 29, 939611), datetime.datetime(2018, 4, 1, 7, 4, 30, 939610), datetime.datetime(2018, 4, 1, 7, 4, 31, 939609), datetime.datetime(2018, 4, 1, 7, 4, 32, 939608), datetime.datetime(2018, 4, 1, 7, 4, 33, 939607), datetime.datetime(2018, 4, 1, 7, 4, 34, 939606), datetime.datetime(2018, 4, 1, 7, 4, 35, 939605), datetime.datetime(2018, 4, 1, 7, 4, 36, 939605), datetime.datetime(2018, 4, 1, 7, 4, 37, 939605), datetime.datetime(2018, 4, 1, 7, 4, 38, 939605), datetime.datetime(2018, 4, 1, 7, 4, 39, 939604), datetime.datetime(2018, 4, 1, 7, 4, 40, 939603), datetime.datetime(2018, 4, 1, 7, 4, 41, 939602), datetime.datetime(2018, 4, 1, 7, 4, 42, 939601), datetime.datetime(2018, 4, 1, 7, 4, 43, 939600), datetime.datetime(2018, 4, 1, 7, 4, 44, 939600), datetime.datetime(2018, 4, 1, 7, 4, 45, 939600), datetime.datetime(2018, 4, 1, 7, 4, 46, 939600), datetime.datetime(2018, 4, 1, 7, 4, 47, 939600), datetime.datetime(2018, 4, 1, 7, 4, 48, 939600), datetime.datetime(2018, 4, 1, 7, 4, 49, 939600), datetime.datetime(2018, 4, 1, 7, 4, 50, 939599), datetime.datetime(2018, 4, 1, 7, 4, 51, 939598), datetime.datetime(2018, 4, 1, 7, 4, 52, 939597), datetime.datetime(2018, 4, 1, 7, 4, 53, 939596), datetime.datetime(2018, 4, 1, 7, 4, 54, 939595), datetime.datetime(2018, 4, 1, 7, 4, 55, 939595), datetime.datetime(2018, 4, 1, 7, 4, 56, 939595), datetime.datetime(2018, 4, 1, 7, 4, 57, 939595), datetime.datetime(2018, 4, 1, 7, 4, 58, 939594), datetime.datetime(2018, 4, 1, 7, 4, 59, 939593), datetime.datetime(2018, 4, 1, 7, 5, 0, 939592), datetime.datetime(2018, 4, 1, 7, 5, 1, 939591), datetime.datetime(2018, 4, 1, 7, 5, 2, 939590), datetime.datetime(2018, 4, 1, 7, 5, 3, 939589), datetime.datetime(2018, 4, 1, 7, 5, 4, 939588), datetime.datetime(2018, 4, 1, 7, 5, 5, 939587), datetime.datetime(2018, 4, 1, 7, 5, 6, 939586), datetime.datetime(2018, 4, 1, 7, 5, 7, 939585), datetime.datetime(2018, 4, 1, 7, 5, 8, 939584), datetime.datetime(2018, 4, 1, 7, 5, 9, 939583), datetime.datetime(2018, 4, 1, 7, 5, 10, 939582), datetime.datetime(2018, 4, 1, 7, 5, 11, 939581), datetime.datetime(2018, 4, 1, 7, 5, 12, 939580), datetime.datetime(2018, 4, 1, 7, 5, 13, 939579), datetime.datetime(2018, 4, 1, 7, 5, 14, 939578), datetime.datetime(2018, 4, 1, 7, 5, 15, 939577), datetime.datetime(2018, 4, 1, 7, 5, 16, 939576), datetime.datetime(2018, 4, 1, 7, 5, 17, 939575), datetime.datetime(2018, 4, 1, 7, 5, 18, 939574), datetime.datetime(2018, 4, 1, 7, 5, 19, 939573), datetime.datetime(2018, 4, 1, 7, 5, 20, 939572), datetime.datetime(2018, 4, 1, 7, 5, 21, 939571), datetime.datetime(2018, 4, 1, 7, 5, 22, 939570), datetime.datetime(2018, 4, 1, 7, 5, 23, 939569), datetime.datetime(2018, 4, 1, 7, 5, 24, 939568), datetime.datetime(2018, 4, 1, 7, 5, 25, 939567), datetime.datetime(2018, 4, 1, 7, 5, 26, 939566), datetime.datetime(2018, 4, 1, 7, 5, 27, 939565), datetime.datetime(2018, 4, 1, 7, 5, 28, 939564), datetime.datetime(2018, 4, 1, 7, 5, 29, 939563), datetime.datetime(2018, 4, 1, 7, 5, 30, 939562), datetime.datetime(2018, 4, 1, 7, 5, 31, 939561), datetime.datetime(2018, 4, 1, 7, 5, 32, 939560), datetime.datetime(2018, 4, 1, 7, 5, 33, 939559), datetime.datetime(2018, 4, 1, 7, 5, 34, 939558), datetime.datetime(2018, 4, 1, 7, 5, 35, 939557), datetime.datetime(2018, 4, 1, 7, 5, 36, 939556), datetime.datetime(2018, 4, 1, 7, 5, 37, 939555), datetime.datetime(2018, 4, 1, 7, 5, 38, 939554), datetime.datetime(2018, 4, 1, 7, 5, 39, 939552), datetime.datetime(2018, 4, 1, 7, 5, 40, 939551), datetime.datetime(2018, 4, 1, 7, 5, 41, 939550), datetime.datetime(2018, 4, 1, 7, 5, 42, 939549), datetime.datetime(2018, 4, 1, 7, 5, 43, 939548), datetime.datetime(2018, 4, 1, 7, 5, 44, 939547), datetime.datetime(2018, 4, 1, 7, 5, 45, 939546), datetime.datetime(2018, 4, 1, 7, 5, 46, 939545), datetime.datetime(2018, 4, 1, 7, 5, 47, 939544), datetime.datetime(2018, 4, 1, 7, 5, 48, 939543), datetime.datetime(2018, 4, 1, 7, 5, 49, 939542), datetime.datetime(2018, 4, 1, 7, 5, 50, 939541), datetime.datetime(2018, 4, 1, 7, 5, 51, 939540), datetime.datetime(2018, 4, 1, 7, 5, 52, 939539), datetime.datetime(2018, 4, 1, 7, 5, 53, 939538), datetime.datetime(2018, 4, 1, 7, 5, 54, 939537), datetime.datetime(2018, 4, 1, 7, 5, 55, 939536), datetime.datetime(2018, 4, 1, 7, 5, 56, 939535), datetime.datetime(2018, 4, 1, 7, 5, 57, 939534), datetime.datetime(2018, 4, 1, 7, 5, 58, 939533), datetime.datetime(2018, 4, 1, 7, 5, 59, 939532), datetime.datetime(2018, 4, 1, 7, 6, 0, 939531), datetime.datetime(2018, 4, 1, 7, 6, 1, 939531), datetime.datetime(2018, 4, 1, 7, 6, 2, 939530), datetime.datetime(2018, 4, 1, 7, 6, 3, 939529), datetime.datetime(2018, 4, 1, 7, 6, 4, 939529), datetime.datetime(2018, 4, 1, 7, 6, 5, 939528), datetime.datetime(2018, 4, 1, 7, 6, 6, 939527), datetime.datetime(2018, 4, 1, 7, 6, 7, 939526), datetime.datetime(2018, 4, 1, 7, 6, 8, 939525), datetime.datetime(2018, 4, 1, 7, 6, 9, 939524), datetime.datetime(2018, 4, 1, 7, 6, 10, 939523), datetime.datetime(2018, 4, 1, 7, 6, 11, 939522), datetime.datetime(2018, 4, 1, 7, 6, 12, 939522), datetime.datetime(2018, 4, 1, 7, 6, 13, 939521), datetime.datetime(2018, 4, 1, 7, 6, 14, 939520), datetime.datetime(2018, 4, 1, 7, 6, 15, 939519), datetime.datetime(2018, 4, 1, 7, 6, 16, 939518), datetime.datetime(2018, 4, 1, 7, 6, 17, 939517), datetime.datetime(2018, 4, 1, 7, 6, 18, 939516), datetime.datetime(2018, 4, 1, 7, 6, 19, 939515), datetime.datetime(2018, 4, 1, 7, 6, 20, 939514), datetime.datetime(2018, 4, 1, 7, 6, 21, 939513), datetime.datetime(2018, 4, 1, 7, 6, 22, 939512), datetime.datetime(2018, 4, 1, 7, 6, 23, 939511), datetime.datetime(2018, 4, 1, 7, 6, 24, 939510), datetime.datetime(2018, 4, 1, 7, 6, 25, 939509), datetime.datetime(2018, 4, 1, 7, 6, 26, 939508), datetime.datetime(2018, 4, 1, 7, 6, 27, 939507), datetime.datetime(2018, 4, 1, 7, 6, 28, 939507), datetime.datetime(2018, 4, 1, 7, 6, 29, 939506), datetime.datetime(2018, 4, 1, 7, 6, 30, 939505), datetime.datetime(2018, 4, 1, 7, 6, 31, 939504), datetime.datetime(2018, 4, 1, 7, 6, 32, 939503), datetime.datetime(2018, 4, 1, 7, 6, 33, 939502), datetime.datetime(2018, 4, 1, 7, 6, 34, 939501), datetime.datetime(2018, 4, 1, 7, 6, 35, 939500), datetime.datetime(2018, 4, 1, 7, 6, 36, 939500), datetime.datetime(2018, 4, 1, 7, 6, 37, 939499), datetime.datetime(2018, 4, 1, 7, 6, 38, 939498), datetime.datetime(2018, 4, 1, 7, 6, 39, 939497), datetime.datetime(2018, 4, 1, 7, 6, 40, 939496), datetime.datetime(2018, 4, 1, 7, 6, 41, 939495), datetime.datetime(2018, 4, 1, 7, 6, 42, 939494), datetime.datetime(2018, 4, 1, 7, 6, 43, 939493), datetime.datetime(2018, 4, 1, 7, 6, 44, 939492), datetime.datetime(2018, 4, 1, 7, 6, 45, 939491), datetime.datetime(2018, 4, 1, 7, 6, 46, 939490), datetime.datetime(2018, 4, 1, 7, 6, 47, 939490), datetime.datetime(2018, 4, 1, 7, 6, 48, 939489), datetime.datetime(2018, 4, 1, 7, 6, 49, 939488), datetime.datetime(2018, 4, 1, 7, 6, 50, 939487), datetime.datetime(2018, 4, 1, 7, 6, 51, 939486), datetime.datetime(2018, 4, 1, 7, 6, 52, 939485), datetime.datetime(2018, 4, 1, 7, 6, 53, 939484), datetime.datetime(2018, 4, 1, 7, 6, 54, 939483), datetime.datetime(2018, 4, 1, 7, 6, 55, 939483), datetime.datetime(2018, 4, 1, 7, 6, 56, 939482), datetime.datetime(2018, 4, 1, 7, 6, 57, 939481), datetime.datetime(2018, 4, 1, 7, 6, 58, 939480), datetime.datetime(2018, 4, 1, 7, 6, 59, 939479), datetime.datetime(2018, 4, 1, 7, 7, 0, 939478), datetime.datetime(2018, 4, 1, 7, 7, 1, 939478), datetime.datetime(2018, 4, 1, 7, 7, 2, 939478), datetime.datetime(2018, 4, 1, 7, 7, 3, 939478), datetime.datetime(2018, 4, 1, 7, 7, 4, 939478), datetime.datetime(2018, 4, 1, 7, 7, 5, 939478), datetime.datetime(2018, 4, 1, 7, 7, 6, 939478), datetime.datetime(2018, 4, 1, 7, 7, 7, 939477), datetime.datetime(2018, 4, 1, 7, 7, 8, 939476), datetime.datetime(2018, 4, 1, 7, 7, 9, 939475), datetime.datetime(2018, 4, 1, 7, 7, 10, 939474), datetime.datetime(2018, 4, 1, 7, 7, 11, 939473), datetime.datetime(2018, 4, 1, 7, 7, 12, 939473), datetime.datetime(2018, 4, 1, 7, 7, 13, 939473), datetime.datetime(2018, 4, 1, 7, 7, 14, 939473), datetime.datetime(2018, 4, 1, 7, 7, 15, 939472), datetime.datetime(2018, 4, 1, 7, 7, 16, 939471), datetime.datetime(2018, 4, 1, 7, 7, 17, 939470), datetime.datetime(2018, 4, 1, 7, 7, 18, 939469), datetime.datetime(2018, 4, 1, 7, 7, 19, 939468), datetime.datetime(2018, 4, 1, 7, 7, 20, 939468), datetime.datetime(2018, 4, 1, 7, 7, 21, 939468), datetime.datetime(2018, 4, 1, 7, 7, 22, 939468), datetime.datetime(2018, 4, 1, 7, 7, 23, 939467), datetime.datetime(2018, 4, 1, 7, 7, 24, 939466), datetime.datetime(2018, 4, 1, 7, 7, 25, 939465), datetime.datetime(2018, 4, 1, 7, 7, 26, 939464), datetime.datetime(2018, 4, 1, 7, 7, 27, 939463), datetime.datetime(2018, 4, 1, 7, 7, 28, 939463), datetime.datetime(2018, 4, 1, 7, 7, 29, 939462), datetime.datetime(2018, 4, 1, 7, 7, 30, 939461), datetime.datetime(2018, 4, 1, 7, 7, 31, 939460), datetime.datetime(2018, 4, 1, 7, 7, 32, 939459), datetime.datetime(2018, 4, 1, 7, 7, 33, 939458), datetime.datetime(2018, 4, 1, 7, 7, 34, 939457), datetime.datetime(2018, 4, 1, 7, 7, 35, 939456), datetime.datetime(2018, 4, 1, 7, 7, 36, 939456), datetime.datetime(2018, 4, 1, 7, 7, 37, 939456), datetime.datetime(2018, 4, 1, 7, 7, 38, 939456), datetime.datetime(2018, 4, 1, 7, 7, 39, 939455), datetime.datetime(2018, 4, 1, 7, 7, 40, 939454), datetime.datetime(2018, 4, 1, 7, 7, 41, 939453), datetime.datetime(2018, 4, 1, 7, 7, 42, 939452), datetime.datetime(2018, 4, 1, 7, 7, 43, 939451), datetime.datetime(2018, 4, 1, 7, 7, 44, 939451), datetime.datetime(2018, 4, 1, 7, 7, 45, 939450), datetime.datetime(2018, 4, 1, 7, 7, 46, 939449), datetime.datetime(2018, 4, 1, 7, 7, 47, 939448), datetime.datetime(2018, 4, 1, 7, 7, 48, 939447), datetime.datetime(2018, 4, 1, 7, 7, 49, 939446), datetime.datetime(2018, 4, 1, 7, 7, 50, 939445), datetime.datetime(2018, 4, 1, 7, 7, 51, 939444), datetime.datetime(2018, 4, 1, 7, 7, 52, 939443), datetime.datetime(2018, 4, 1, 7, 7, 53, 939442), datetime.datetime(2018, 4, 1, 7, 7, 54, 939441), datetime.datetime(2018, 4, 1, 7, 7, 55, 939441), datetime.datetime(2018, 4, 1, 7, 7, 56, 939440), datetime.datetime(2018, 4, 1, 7, 7, 57, 939439), datetime.datetime(2018, 4, 1, 7, 7, 58, 939438), datetime.datetime(2018, 4, 1, 7, 7, 59, 939437), datetime.datetime(2018, 4, 1, 7, 8, 0, 939436), datetime.datetime(2018, 4, 1, 7, 8, 1, 939436), datetime.datetime(2018, 4, 1, 7, 8, 2, 939436), datetime.datetime(2018, 4, 1, 7, 8, 3, 939436), datetime.datetime(2018, 4, 1, 7, 8, 4, 939436), datetime.datetime(2018, 4, 1, 7, 8, 5, 939436), datetime.datetime(2018, 4, 1, 7, 8, 6, 939436), datetime.datetime(2018, 4, 1, 7, 8, 7, 939436), datetime.datetime(2018, 4, 1, 7, 8, 8, 939436), datetime.datetime(2018, 4, 1, 7, 8, 9, 939436), datetime.datetime(2018, 4, 1, 7, 8, 10, 939436), datetime.datetime(2018, 4, 1, 7, 8, 11, 939436), datetime.datetime(2018, 4, 1, 7, 8, 12, 939436), datetime.datetime(2018, 4, 1, 7, 8, 13, 939436), datetime.datetime(2018, 4, 1, 7, 8, 14, 939436), datetime.datetime(2018, 4, 1, 7, 8, 15, 939435), datetime.datetime(2018, 4, 1, 7, 8, 16, 939434), datetime.datetime(2018, 4, 1, 7, 8, 17, 939434), datetime.datetime(2018, 4, 1, 7, 8, 18, 939434), datetime.datetime(2018, 4, 1, 7, 8, 19, 939434), datetime.datetime(2018, 4, 1, 7, 8, 20, 939434), datetime.datetime(2018, 4, 1, 7, 8, 21, 939434), datetime.datetime(2018, 4, 1, 7, 8, 22, 939434), datetime.datetime(2018, 4, 1, 7, 8, 23, 939434), datetime.datetime(2018, 4, 1, 7, 8, 24, 939434), datetime.datetime(2018, 4, 1, 7, 8, 25, 939434), datetime.datetime(2018, 4, 1, 7, 8, 26, 939434), datetime.datetime(2018, 4, 1, 7, 8, 27, 939434), datetime.datetime(2018, 4, 1, 7, 8, 28, 939434), datetime.datetime(2018, 4, 1, 7, 8, 29, 939434), datetime.datetime(2018, 4, 1, 7, 8, 30, 939434), datetime.datetime(2018, 4, 1, 7, 8, 31, 939434), datetime.datetime(2018, 4, 1, 7, 8, 32, 939434), datetime.datetime(2018, 4, 1, 7, 8, 33, 939434), datetime.datetime(2018, 4, 1, 7, 8, 34, 939434), datetime.datetime(2018, 4, 1, 7, 8, 35, 939434), datetime.datetime(2018, 4, 1, 7, 8, 36, 939434), datetime.datetime(2018, 4, 1, 7, 8, 37, 939434), datetime.datetime(2018, 4, 1, 7, 8, 38, 939434), datetime.datetime(2018, 4, 1, 7, 8, 39, 939434), datetime.datetime(2018, 4, 1, 7, 8, 40, 939434), datetime.datetime(2018, 4, 1, 7, 8, 41, 939434), datetime.datetime(2018, 4, 1, 7, 8, 42, 939434), datetime.datetime(2018, 4, 1, 7, 8, 43, 939434), datetime.datetime(2018, 4, 1, 7, 8, 44, 939434), datetime.datetime(2018, 4, 1, 7, 8, 45, 939434), datetime.datetime(2018, 4, 1, 7, 8, 46, 939434), datetime.datetime(2018, 4, 1, 7, 8, 47, 939434), datetime.datetime(2018, 4, 1, 7, 8, 48, 939434), datetime.datetime(2018, 4, 1, 7, 8, 49, 939434), datetime.datetime(2018, 4, 1, 7, 8, 50, 939434), datetime.datetime(2018, 4, 1, 7, 8, 51, 939434), datetime.datetime(2018, 4, 1, 7, 8, 52, 939434), datetime.datetime(2018, 4, 1, 7, 8, 53, 939434), datetime.datetime(2018, 4, 1, 7, 8, 54, 939434), datetime.datetime(2018, 4, 1, 7, 8, 55, 939434), datetime.datetime(2018, 4, 1, 7, 8, 56, 939434), datetime.datetime(2018, 4, 1, 7, 8, 57, 939434), datetime.datetime(2018, 4, 1, 7, 8, 58, 939434), datetime.datetime(2018, 4, 1, 7, 8, 59, 939434), datetime.datetime(2018, 4, 1, 7, 9, 0, 939433), datetime.datetime(2018, 4, 1, 7, 9, 1, 939432), datetime.datetime(2018, 4, 1, 7, 9, 2, 939431), datetime.datetime(2018, 4, 1, 7, 9, 3, 939430), datetime.datetime(2018, 4, 1, 7, 9, 4, 939429), datetime.datetime(2018, 4, 1, 7, 9, 5, 939428), datetime.datetime(2018, 4, 1, 7, 9, 6, 939427), datetime.datetime(2018, 4, 1, 7, 9, 7, 939426), datetime.datetime(2018, 4, 1, 7, 9, 8, 939425), datetime.datetime(2018, 4, 1, 7, 9, 9, 939424), datetime.datetime(2018, 4, 1, 7, 9, 10, 939423), datetime.datetime(2018, 4, 1, 7, 9, 11, 939422), datetime.datetime(2018, 4, 1, 7, 9, 12, 939421)])
-
+# ---------------------------------------------------------------------------------------
+# the analysis modules pull in numpy and ephem, so their names are only imported from
+# utils on first use and are not part of from utils import *
+_LAZY = {
+	'IncrementalCalculator': 'incremental',
+	'run_batch':             'linkbatch',
+	'loss_profile':          'losses',
+	'PassCache':             'passcache',
+	'propagate_pass':        'propagator',
+	'to_datetimes':          'propagator',
+	'reference_angles':      'refpasses',
+	'reference_pass':        'refpasses',
+}
+
+# reference passes (poor, good, great) are stored in data/reference_passes and loaded on
+# first use; utils.angles_poor etc. remain available for older code
+def __getattr__(name):
+	if name in ('angles_poor', 'angles_good', 'angles_great'):
+		return importlib.import_module('refpasses').reference_angles(name[len('angles_'):])
+	if name in _LAZY:
+		return getattr(importlib.import_module(_LAZY[name]), name)
+	raise AttributeError("module %r has no attribute %r" % (__name__, name))
+# -------------------------------------------------------------------------------
@@ -0,0 +1,183 @@
+
+import collections
+import math
+
+import numpy as np
+
+from linkbatch import anchor_state, apply_deltas
+from losses import loss_profile
+from propagator import ephem_date, make_observer, pass_window, posix_time, propagate, read_tle
+
+# ---------------------------------------------------------------------------------------
+# link window solver
+#
+# instead of sampling every second of a pass and counting samples with positive margin,
+# the times where the margin crosses zero are solved for directly:
+#   1. the margin only depends on elevation, so the elevations where it crosses zero are
+#      found from the link budget alone (a dense elevation grid, then bisection)
+#   2. elevation rises to culmination and falls after it, so each of those elevations is
+#      reached once on each side; those times are found by root finding on el(t)
+# only step 2 propagates the orbit, a few dozen evaluations per pass
+# ---------------------------------------------------------------------------------------
+
+LinkWindow = collections.namedtuple('LinkWindow', ['rise', 'culmination', 'set', 'max_elevation',
+                                                   'mask_rise', 'mask_set', 'crossings',
+                                                   'windows', 'duration', 'evaluations'])
+
+
+def find_root(f, a, b, fa, fb, tolerance):
+    """
+    Root of f between a and b, where fa and fb have opposite signs (Illinois method)
+    """
+    side = 0
+    c = a
+    for _ in range(100):
+        c_next = (a * fb - b * fa) / (fb - fa)
+        if abs(c_next - c) < tolerance:
+            return c_next
+        c = c_next
+        fc = f(c)
+        if fc == 0.0:
+            return c
+        if (fc > 0.0) == (fb > 0.0):
+            b, fb = c, fc
+            if side == -1:
+                fa /= 2.0
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb /= 2.0
+            side = 1
+    return c
+
+
+def find_maximum(f, a, b, tolerance):
+    """
+    Location of the maximum of a unimodal f between a and b (golden section search)
+    """
+    ratio = (math.sqrt(5.0) - 1.0) / 2.0
+    c = b - ratio * (b - a)
+    d = a + ratio * (b - a)
+    fc = f(c)
+    fd = f(d)
+    while b - a > tolerance:
+        if fc > fd:
+            b, d, fd = d, c, fc
+            c = b - ratio * (b - a)
+            fc = f(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + ratio * (b - a)
+            fd = f(d)
+    return (a + b) / 2.0
+
+
+def positive_margin_elevations(margin_at, low, high, resolution=0.01):
+    """
+    Elevation intervals between low and high (degrees) where margin_at(el) > 0. Sign
+    changes are located on a grid of the given resolution and refined by bisection, so
+    positive stretches narrower than the resolution can be missed
+    """
+    if high <= low:
+        return []
+    grid = np.linspace(low, high, max(2, int(math.ceil((high - low) / resolution)) + 1))
+    positive = margin_at(grid) > 0.0
+
+    levels = []
+    for i in np.flatnonzero(positive[1:] != positive[:-1]).tolist():
+        a, b = grid[i], grid[i + 1]
+        while b - a > 1e-9:
+            mid = 0.5 * (a + b)
+            if (margin_at(np.array([mid]))[0] > 0.0) == positive[i]:
+                a = mid
+            else:
+                b = mid
+        levels.append(b)
+
+    bounds = [low] + levels + [high]
+    return [(bounds[k], bounds[k + 1]) for k in range(len(bounds) - 1) if positive[0] == (k % 2 == 0)]
+
+
+def solve_pass(body, observer, rise, culmination, setting, margin_at, elevation_mask=0.0,
+               report_elevations=(), tolerance=0.01):
+    """
+    Link windows for one pass given its approximate rise, culmination and set times
+    (POSIX seconds) from pass_window. Returns a LinkWindow
+    """
+    evaluations = [0]
+
+    def elevation(t):
+        evaluations[0] += 1
+        return float(propagate(body, observer, [t]).el[0])
+
+    # refine culmination, then bracket both sides of the pass below the horizon
+    culmination = find_maximum(elevation, culmination - 30.0, culmination + 30.0, tolerance)
+    max_el = elevation(culmination)
+    start, end = rise - 60.0, setting + 60.0
+    el_start, el_end = elevation(start), elevation(end)
+
+    def crossing(level):
+        """times (rising, setting) at which the pass reaches level degrees"""
+        level = float(level)
+        rising = find_root(lambda t: elevation(t) - level, start, culmination, el_start - level, max_el - level, tolerance)
+        falling = find_root(lambda t: elevation(t) - level, culmination, end, max_el - level, el_end - level, tolerance)
+        return rising, falling
+
+    crossings = dict((level, crossing(level)) for level in report_elevations if level < max_el)
+    if max_el <= elevation_mask:
+        return LinkWindow(rise, culmination, setting, max_el, None, None, crossings, [], 0.0, evaluations[0])
+    mask_rise, mask_set = crossing(elevation_mask)
+
+    windows = []
+    for low, high in positive_margin_elevations(margin_at, elevation_mask, max_el):
+        low_rise, low_set = (mask_rise, mask_set) if low == elevation_mask else crossing(low)
+        if high >= max_el:
+            windows.append((low_rise, low_set))
+        else:
+            high_rise, high_set = crossing(high)
+            windows.append((low_rise, high_rise))
+            windows.append((high_set, low_set))
+    windows.sort()
+
+    duration = float(sum(end_time - start_time for start_time, end_time in windows))
+    return LinkWindow(rise, culmination, setting, max_el, mask_rise, mask_set, crossings,
+                      windows, duration, evaluations[0])
+
+
+def find_link_windows(tle, lb_calc, ureg, start, end, observer=None, elevation_mask=0.0,
+                      report_elevations=(), atmosphere='atmosphere', pointing='eggbeater', tolerance=0.01):
+    """
+    Link windows (times with positive link margin) for every pass that rises between
+    start and end (POSIX seconds or any date ephem accepts). lb_calc must be configured;
+    it is run once and the margin at other elevations is shifted from that run. Windows
+    are limited to elevations above elevation_mask (degrees), and the times each pass
+    crosses report_elevations are returned in LinkWindow.crossings. Times are solved to
+    within tolerance seconds. Returns a list of LinkWindow, one per pass
+    """
+    body = read_tle(tle)
+    observer = make_observer() if observer is None else observer
+    start = start if isinstance(start, (int, float)) else posix_time(start)
+    end = end if isinstance(end, (int, float)) else posix_time(end)
+
+    lb_calc.run()
+    if not lb_calc.is_valid:
+        raise Exception('Run at elevation angle ', lb_calc.orbit_elevation_angle, ' was not valid')
+    anchor = anchor_state(lb_calc, ureg)
+    atm_profile = loss_profile(atmosphere)
+    rx_profile = loss_profile(pointing)
+
+    def margin_at(el):
+        return apply_deltas(anchor, el, atm_profile(el), rx_profile(el), ureg).link_margin
+
+    passes = []
+    date = start
+    while True:
+        rise, culmination, setting = pass_window(body, observer, ephem_date(date))
+        if rise > end:
+            break
+        passes.append(solve_pass(body, observer, rise, culmination, setting, margin_at,
+                                 elevation_mask, report_elevations, tolerance))
+        date = setting + 60.0
+    return passes
+# ---------------------------------------------------------------------------------------
@@ -0,0 +1,69 @@
+
+import math
+
+# ---------------------------------------------------------------------------------------
+# stand-in for lib.calculator.LinkBudgetCalculator, which is not part of this tree. the
+# budget is the usual one: every term additive in dB and a spherical earth
+# ---------------------------------------------------------------------------------------
+
+# run() raises once this many runs have been made in the process, to interrupt a
+# calculation part way through
+interrupt_after = [None]
+
+
+class SphericalEarthCalculator:
+    """
+    Minimal stand-in for lib.calculator.LinkBudgetCalculator with the same inputs and
+    outputs
+    """
+
+    runs = 0
+
+    def __init__(self, ureg):
+        self.ureg = ureg
+
+    def run(self):
+        SphericalEarthCalculator.runs += 1
+        if interrupt_after[0] is not None and SphericalEarthCalculator.runs > interrupt_after[0]:
+            raise KeyboardInterrupt()
+
+        u = self.ureg
+        el = self.orbit_elevation_angle.to(u.radian).magnitude
+        r_gs = 6378.137e3 + self.altitude_ground_station.to(u.meter).magnitude
+        r_sat = 6378.137e3 + self.altitude_satellite.to(u.meter).magnitude
+        d = math.sqrt(r_sat**2 - (r_gs * math.cos(el))**2) - r_gs * math.sin(el)
+        f = self.downlink_frequency.to(u.hertz).magnitude
+
+        self.link_distance = d * u.meter
+        self.downlink_path_loss = -20.0 * math.log10(4.0 * math.pi * d * f / 299792458.0)
+        self.received_power = (10.0 * math.log10(self.transmit_power.to(u.watt).magnitude) + self.transmit_losses
+                               + self.transmit_antenna_gain + self.transmit_pointing_loss + self.downlink_path_loss
+                               + self.atmospheric_loss + self.polarization_losses + self.receive_antenna_gain
+                               + self.receiving_pointing_loss)
+        noise_density = -228.6 + 10.0 * math.log10(290.0) + self.system_noise_figure
+        self.energy_noise_ratio = (self.received_power - noise_density
+                                   - 10.0 * math.log10(self.noise_bandwidth.to(u.hertz).magnitude)
+                                   + self.implementation_loss)
+        self.link_margin = self.energy_noise_ratio - self.target_energy_noise_ratio
+        self.is_valid = True
+
+
+def make_calculator(ureg):
+    lb_calc = SphericalEarthCalculator(ureg)
+    lb_calc.altitude_ground_station   =  400 * ureg.meter
+    lb_calc.implementation_loss       = -1.0   # dB
+    lb_calc.polarization_losses       =  0.0   # dB
+    lb_calc.receive_antenna_gain      =  5.4   # dB
+    lb_calc.system_noise_figure       =  5.0   # dB
+    lb_calc.altitude_satellite        =  860 * ureg.kilometer
+    lb_calc.transmit_power            =  5.0 * ureg.watt
+    lb_calc.transmit_losses           = -1.0   # dB
+    lb_calc.transmit_antenna_gain     =  4.0   # dBi
+    lb_calc.orbit_elevation_angle     =  0.001 * ureg.degrees
+    lb_calc.downlink_frequency        =  137.5 * ureg.megahertz
+    lb_calc.target_energy_noise_ratio =  20.0  # dB
+    lb_calc.noise_bandwidth           =  34.0  * ureg.kilohertz
+    lb_calc.transmit_pointing_loss    = -3.0   # dB
+    lb_calc.atmospheric_loss          = -4.6   # dB
+    lb_calc.receiving_pointing_loss   = -10.0  # dB
+    return lb_calc
@@ -0,0 +1,94 @@
+
+import os
+import random
+import sys
+import unittest
+
+import pint
+
+# the analysis modules live in docs/ and are imported the way the notebooks import them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs'))
+
+from incremental import ADDITIVE_INPUTS, DEPENDENCIES, IncrementalCalculator
+
+from tests.standin import make_calculator
+
+
+def magnitude(value):
+    return value.magnitude if hasattr(value, 'magnitude') else value
+
+
+class TestIncrementalCalculator(unittest.TestCase):
+
+    def setUp(self):
+        self.ureg = pint.UnitRegistry()
+        self.reference = make_calculator(self.ureg)
+        self.incremental = IncrementalCalculator(make_calculator(self.ureg), self.ureg)
+        self.incremental.run()
+
+    def assertMatchesReference(self):
+        self.reference.run()
+        for term in DEPENDENCIES:
+            self.assertAlmostEqual(magnitude(getattr(self.incremental, term)),
+                                   magnitude(getattr(self.reference, term)), delta=1e-6)
+
+    def set(self, name, value):
+        setattr(self.reference, name, value)
+        setattr(self.incremental, name, value)
+
+    def test_target_only_recomputes_margin(self):
+        self.set('target_energy_noise_ratio', 15.0)
+        self.incremental.run()
+        self.assertEqual(self.incremental.last_recomputed, ('link_margin',))
+        self.assertFalse(self.incremental.last_run_full)
+        self.assertMatchesReference()
+
+    def test_additive_inputs_are_shifted(self):
+        for name in ADDITIVE_INPUTS:
+            self.set(name, getattr(self.reference, name) + 1.5)
+            self.set('orbit_elevation_angle', 40.0 * self.ureg.degrees)
+            self.incremental.run()
+            self.assertFalse(self.incremental.last_run_full)
+            self.assertMatchesReference()
+
+    def test_full_run_reports_every_term(self):
+        self.set('noise_bandwidth', 50.0 * self.ureg.kilohertz)
+        self.incremental.run()
+        self.assertTrue(self.incremental.last_run_full)
+        self.assertEqual(self.incremental.last_recomputed, tuple(DEPENDENCIES))
+        self.assertMatchesReference()
+
+    def test_noise_figure_runs_calculator(self):
+        self.set('system_noise_figure', 3.0)
+        self.incremental.run()
+        self.assertTrue(self.incremental.last_run_full)
+        self.assertMatchesReference()
+
+    def test_random_changes_match_calculator(self):
+        rng = random.Random(1)
+        names = list(ADDITIVE_INPUTS) + ['system_noise_figure', 'orbit_elevation_angle', 'atmospheric_loss', 'receiving_pointing_loss',
+                                         'noise_bandwidth']
+        for _ in range(200):
+            for name in rng.sample(names, rng.randint(1, 3)):
+                if name == 'orbit_elevation_angle':
+                    value = rng.uniform(0.0, 90.0) * self.ureg.degrees
+                elif name == 'noise_bandwidth':
+                    value = rng.choice([20.0, 34.0]) * self.ureg.kilohertz
+                else:
+                    value = rng.uniform(-10.0, 20.0)
+                self.set(name, value)
+            self.incremental.run()
+            self.assertMatchesReference()
+
+    def test_invalid_elevation_clears_outputs(self):
+        self.incremental.orbit_elevation_angle = 30.0 * self.ureg.degrees
+        self.incremental.run()
+        self.incremental.orbit_elevation_angle = -5.0 * self.ureg.degrees
+        self.incremental.run()
+        self.assertFalse(self.incremental.is_valid)
+        for term in DEPENDENCIES:
+            self.assertIsNone(getattr(self.incremental, term))
+
+
+if __name__ == '__main__':
+    unittest.main()
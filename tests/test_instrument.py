@@ -0,0 +1,60 @@
+
+import os
+import sys
+import unittest
+
+import pint
+
+# the analysis modules live in docs/ and are imported the way the notebooks import them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs'))
+
+import instrument
+from incremental import IncrementalCalculator
+
+from tests.standin import make_calculator
+
+
+class TestWrapCalculator(unittest.TestCase):
+
+    def setUp(self):
+        self.ureg = pint.UnitRegistry()
+        instrument.reset()
+        instrument.enable()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_plain_calculator(self):
+        lb_calc = instrument.wrap_calculator(make_calculator(self.ureg))
+        instrument.wrap_calculator(lb_calc)
+        for _ in range(3):
+            lb_calc.run()
+        self.assertEqual(instrument.report()['calculator.run']['calls'], 3)
+
+        del lb_calc.run
+        lb_calc.run()
+        self.assertEqual(instrument.report()['calculator.run']['calls'], 3)
+
+    def test_incremental_calculator(self):
+        inner = make_calculator(self.ureg)
+        inc = instrument.wrap_calculator(IncrementalCalculator(inner, self.ureg), 'incremental.run')
+        # the wrapper stays on the incremental calculator instead of being forwarded
+        self.assertNotIn('run', vars(inner))
+        instrument.wrap_calculator(inner)
+
+        inc.run()
+        self.assertTrue(inc.last_run_full)
+        inc.orbit_elevation_angle = 30.0 * self.ureg.degrees
+        inc.run()
+        self.assertFalse(inc.last_run_full)
+        inc.run()
+        self.assertEqual(inc.last_recomputed, ())
+
+        counters = instrument.report()
+        self.assertEqual(counters['incremental.run']['calls'], 3)
+        self.assertEqual(counters['calculator.run']['calls'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+# the analysis modules live in docs/ and are imported the way the notebooks import them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs'))
+
+import instrument
+from passcache import PassCache
+from propagator import PassTrack, make_observer, read_tle
+
+PASS_DATE = '2018/04/03 02:00:00'
+
+
+def fake_track(samples):
+    return PassTrack(*(np.arange(samples, dtype=np.float64) + i for i in range(5)))
+
+
+class TestPassCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        instrument.reset()
+        instrument.enable()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+        shutil.rmtree(self.directory)
+
+    def test_miss_then_hit(self):
+        cache = PassCache(self.directory)
+        first = cache.pass_track(date=PASS_DATE)
+        self.assertEqual(len(cache.entries()), 1)
+
+        second = cache.pass_track(date=PASS_DATE)
+        self.assertEqual(len(cache.entries()), 1)
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+
+        counters = instrument.report()
+        self.assertEqual(counters['passcache.hit']['calls'], 2)  # the fresh entry and the repeat
+        self.assertEqual(counters['passcache.miss']['calls'], 1)
+
+    def test_key_depends_on_inputs(self):
+        cache = PassCache(self.directory)
+        observer = make_observer()
+        key = cache.key(None, observer, PASS_DATE)
+        self.assertEqual(key, cache.key(None, observer, PASS_DATE))
+        self.assertNotEqual(key, cache.key(None, observer, PASS_DATE, step=0.5))
+        self.assertNotEqual(key, cache.key(None, observer, '2018/04/03 02:00:01'))
+
+    def test_evict_by_age(self):
+        cache = PassCache(self.directory, max_bytes=None, max_age=3600.0)
+        cache.put('old', fake_track(10))
+        cache.put('new', fake_track(10))
+        stale = time.time() - 7200.0
+        os.utime(cache.path('old'), (stale, stale))
+
+        cache.evict()
+        self.assertIsNone(cache.get('old'))
+        self.assertIsNotNone(cache.get('new'))
+
+    def test_evict_least_recently_used_by_size(self):
+        cache = PassCache(self.directory, max_bytes=None, max_age=None)
+        now = time.time()
+        for i, name in enumerate(['a', 'b', 'c']):
+            cache.put(name, fake_track(100))
+            os.utime(cache.path(name), (now - 100.0 + i, now - 100.0 + i))
+        size = os.path.getsize(cache.path('a'))
+
+        # a hit makes 'a' the most recently used entry
+        self.assertIsNotNone(cache.get('a'))
+        cache.max_bytes = 2 * size
+        cache.evict()
+        self.assertEqual(sorted(os.path.basename(path) for path, _, _ in cache.entries()), ['a.npy', 'c.npy'])
+
+    def test_ephem_body(self):
+        cache = PassCache(self.directory)
+        body = read_tle()
+        first = cache.pass_track(tle=body, date=PASS_DATE)
+        second = cache.pass_track(tle=read_tle(), date=PASS_DATE)
+        self.assertEqual(len(cache.entries()), 1)
+        np.testing.assert_array_equal(first.el, second.el)
+        np.testing.assert_array_equal(first.el, cache.pass_track(date=PASS_DATE).el)
+
+        observer = make_observer()
+        self.assertNotEqual(cache.key(body, observer, PASS_DATE), cache.key(None, observer, PASS_DATE))
+
+    def test_entries_removed_by_another_process(self):
+        cache = PassCache(self.directory, max_bytes=0, max_age=None)
+        cache.put('a', fake_track(10))
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(os.listdir(self.directory), [])
+
+        # entries listed before another process removed them are skipped
+        cache.max_bytes = None
+        cache.put('b', fake_track(10))
+        cache.put('c', fake_track(10))
+        listed = cache.entries()
+        os.remove(cache.path('b'))
+        cache.entries = lambda: listed
+        cache.max_bytes = 0
+        cache.evict()
+        self.assertEqual(os.listdir(self.directory), [])
+
+        cache.max_bytes = None
+        cache.put('d', fake_track(10))
+        cache.put('e', fake_track(10))
+        listed = [entry for entry in PassCache.entries(cache)]
+        os.remove(cache.path('d'))
+        cache.entries = lambda: listed
+        cache.clear()
+        self.assertEqual(os.listdir(self.directory), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# the analysis modules live in docs/ and are imported the way the notebooks import them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs'))
+
+from refpasses import reference_pass
+from sweep import load_results, run_sweep
+
+from tests.standin import SphericalEarthCalculator, interrupt_after, make_calculator
+
+RANGES = {'receive_antenna_gain': [3.0, 5.4, 8.0], 'system_noise_figure': [2.0, 5.0]}
+
+
+def other_calculator(ureg):
+    return make_calculator(ureg)
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.passes = {'poor': reference_pass('poor'), 'good': reference_pass('good')}
+        interrupt_after[0] = None
+
+    def tearDown(self):
+        interrupt_after[0] = None
+        shutil.rmtree(self.directory)
+
+    def sweep(self, name, ranges=RANGES, passes=None, **kwargs):
+        passes = self.passes if passes is None else passes
+        return run_sweep(kwargs.pop('make_calculator', make_calculator), ranges, passes,
+                         os.path.join(self.directory, name), processes=0, chunk_size=1, **kwargs)
+
+    def rows(self, name):
+        results = load_results(os.path.join(self.directory, name))
+        order = np.lexsort((results['pass'], results['config_index']))
+        return dict((column, values[order]) for column, values in results.items())
+
+    def test_interrupted_sweep_resumes(self):
+        self.assertEqual(self.sweep('full.csv'), 6)
+
+        # stop after two configurations, then cut the last row in half as a crash would
+        SphericalEarthCalculator.runs = 0
+        interrupt_after[0] = 2
+        with self.assertRaises(KeyboardInterrupt):
+            self.sweep('resumed.csv')
+        interrupt_after[0] = None
+        path = os.path.join(self.directory, 'resumed.csv')
+        with open(path) as f:
+            text = f.read()
+        with open(path, 'w') as f:
+            f.write(text[:-10])
+
+        self.assertEqual(self.sweep('resumed.csv'), 5)
+        self.assertEqual(self.sweep('resumed.csv'), 0)
+
+        full = self.rows('full.csv')
+        resumed = self.rows('resumed.csv')
+        self.assertEqual(len(resumed['pass']), 12)
+        for column in full:
+            np.testing.assert_array_equal(full[column], resumed[column])
+
+    def test_changed_grid_is_refused(self):
+        self.sweep('results.csv')
+        before = self.rows('results.csv')
+
+        ranges = dict(RANGES, receive_antenna_gain=[10.0, 11.0, 12.0])
+        with self.assertRaisesRegex(Exception, r'different sweep \(ranges changed\)'):
+            self.sweep('results.csv', ranges=ranges)
+
+        after = self.rows('results.csv')
+        for column in before:
+            np.testing.assert_array_equal(before[column], after[column])
+
+    def test_changed_sweep_settings_are_refused(self):
+        self.sweep('results.csv')
+        changes = [('units', dict(units={'receive_antenna_gain': 'dimensionless'})),
+                   ('pointing', dict(atmosphere='atmosphere', pointing='monopole')),
+                   ('passes', dict(passes={'poor': self.passes['poor'], 'great': reference_pass('great')})),
+                   ('calculator', dict(make_calculator=other_calculator))]
+        for changed, change in changes:
+            with self.assertRaisesRegex(Exception, r'different sweep \(%s changed\)' % changed):
+                self.sweep('results.csv', **change)
+
+    def test_table_without_fingerprint_is_refused(self):
+        self.sweep('results.csv')
+        os.remove(os.path.join(self.directory, 'results.csv.sweep.json'))
+        with self.assertRaisesRegex(Exception, 'has no sweep fingerprint'):
+            self.sweep('results.csv')
+
+
+if __name__ == '__main__':
+    unittest.main()
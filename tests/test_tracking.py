@@ -0,0 +1,102 @@
+
+import asyncio
+import datetime
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+import pint
+
+# the analysis modules live in docs/ and are imported the way the notebooks import them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs'))
+
+from benchmarks import tle_checksum
+from propagator import DEFAULT_TLE
+from refpasses import reference_pass
+from tracking import AOS, LOS, MARGIN_NEGATIVE, MARGIN_POSITIVE, _events, track
+
+from tests.standin import make_calculator
+
+
+def current_tle():
+    """
+    DEFAULT_TLE moved to today's epoch, so ephem accepts dates around now
+    """
+    name, line1, line2 = DEFAULT_TLE
+    today = datetime.datetime.utcnow()
+    epoch = '%02d%012.8f' % (today.year % 100, today.timetuple().tm_yday)
+    return (name, tle_checksum(line1[:18] + epoch + line1[32:]), line2)
+
+
+def collect(samples, consumer_delay=0.0):
+    async def run():
+        collected = []
+        async for sample in samples:
+            collected.append((time.time(), sample))
+            if consumer_delay:
+                await asyncio.sleep(consumer_delay)
+        return collected
+    return asyncio.run(run())
+
+
+class TestEvents(unittest.TestCase):
+
+    def test_edges(self):
+        self.assertEqual(_events((-1.0, np.nan), 5.0, -2.0), (AOS,))
+        self.assertEqual(_events((-1.0, np.nan), 5.0, 3.0), (AOS, MARGIN_POSITIVE))
+        self.assertEqual(_events((5.0, -2.0), 6.0, 3.0), (MARGIN_POSITIVE,))
+        self.assertEqual(_events((6.0, 3.0), 5.0, -2.0), (MARGIN_NEGATIVE,))
+        self.assertEqual(_events((5.0, 3.0), -1.0, np.nan), (MARGIN_NEGATIVE, LOS))
+        self.assertEqual(_events((5.0, -2.0), -1.0, np.nan), (LOS,))
+        self.assertEqual(_events((-2.0, np.nan), -1.0, np.nan), ())
+        self.assertEqual(_events((5.0, 3.0), 6.0, 4.0), ())
+
+
+class TestTrack(unittest.TestCase):
+
+    def setUp(self):
+        self.ureg = pint.UnitRegistry()
+        self.lb_calc = make_calculator(self.ureg)
+
+    def replay(self, start, duration, rate=1.0):
+        return [sample for _, sample in collect(track(None, self.lb_calc, self.ureg, rate=rate, start=start,
+                                                      duration=duration, realtime=False))]
+
+    def test_replay_event_order(self):
+        reference = reference_pass('good')
+        start = float(reference.time[0]) - 5.0
+        samples = self.replay(start, float(reference.time[-1]) - start + 10.0)
+
+        events = [event for sample in samples for event in sample.events]
+        self.assertEqual(events, [AOS, MARGIN_POSITIVE, MARGIN_NEGATIVE, LOS])
+        for sample in samples:
+            self.assertEqual(np.isnan(sample.link_margin), not sample.el > 0.0)
+
+    def test_no_events_on_first_tick(self):
+        reference = reference_pass('good')
+        culmination = float(reference.time[np.argmax(reference.el)])
+        samples = self.replay(culmination, 3.0)
+        self.assertGreater(samples[0].el, 0.0)
+        self.assertGreater(samples[0].link_margin, 0.0)
+        self.assertEqual(samples[0].events, ())
+
+    def test_realtime_skips_late_ticks(self):
+        rate = 10.0
+        period = 1.0 / rate
+        now = time.time()
+        # half of the ticks are already in the past and the consumer is slower than the rate
+        samples = collect(track(current_tle(), self.lb_calc, self.ureg, rate=rate, start=now - 1.0,
+                                duration=2.0, lookahead=1.0), consumer_delay=2.5 * period)
+
+        self.assertGreater(len(samples), 0)
+        self.assertLess(len(samples), 10)
+        for received, sample in samples:
+            self.assertLess(received - sample.time, period + 0.05)
+        times = [sample.time for _, sample in samples]
+        self.assertEqual(times, sorted(times))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+import pint
+
+# the analysis modules live in docs/ and are imported the way the notebooks import them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs'))
+
+from linkbatch import run_batch
+from losses import loss_profile
+from propagator import make_observer, propagate
+from refpasses import reference_pass
+from windows import find_link_windows, find_maximum, find_root, positive_margin_elevations
+
+from tests.standin import make_calculator
+
+# sample spacing (s) of the brute-force reference count
+DENSE_STEP = 0.05
+
+
+class TestSolvers(unittest.TestCase):
+
+    def test_find_root(self):
+        f = lambda x: x**3 - 2.0
+        root = find_root(f, 0.0, 2.0, f(0.0), f(2.0), 1e-9)
+        self.assertAlmostEqual(root, 2.0 ** (1.0 / 3.0), places=8)
+
+        # decreasing function, bracket given the other way round
+        g = lambda x: math.cos(x)
+        self.assertAlmostEqual(find_root(g, 0.0, 3.0, g(0.0), g(3.0), 1e-9), math.pi / 2.0, places=8)
+
+    def test_find_maximum(self):
+        self.assertAlmostEqual(find_maximum(lambda x: -(x - 1.3)**2, -5.0, 5.0, 1e-7), 1.3, places=6)
+        self.assertAlmostEqual(find_maximum(math.sin, 0.0, 3.0, 1e-7), math.pi / 2.0, places=6)
+
+    def test_positive_margin_elevations(self):
+        # positive between 10 and 30 degrees and above 60
+        def margin(el):
+            return np.where(el < 45.0, 100.0 - (el - 20.0)**2, el - 60.0)
+        intervals = positive_margin_elevations(margin, 0.0, 90.0)
+        self.assertEqual(len(intervals), 2)
+        for (low, high), (expected_low, expected_high) in zip(intervals, [(10.0, 30.0), (60.0, 90.0)]):
+            self.assertAlmostEqual(low, expected_low, places=6)
+            self.assertAlmostEqual(high, expected_high, places=6)
+
+        self.assertEqual(positive_margin_elevations(lambda el: np.full(el.shape, -1.0), 0.0, 90.0), [])
+        self.assertEqual(positive_margin_elevations(margin, 50.0, 50.0), [])
+
+
+class TestFindLinkWindows(unittest.TestCase):
+
+    def setUp(self):
+        self.ureg = pint.UnitRegistry()
+        self.lb_calc = make_calculator(self.ureg)
+        self.observer = make_observer()
+
+    def windows(self, name, **kwargs):
+        start = float(reference_pass(name).time[0])
+        passes = find_link_windows(None, self.lb_calc, self.ureg, start - 120.0, start + 60.0, **kwargs)
+        self.assertEqual(len(passes), 1)
+        return passes[0]
+
+    def dense_count(self, window, elevation_mask=0.0):
+        """
+        Seconds with positive margin above elevation_mask, from samples DENSE_STEP apart
+        """
+        times = np.arange(window.rise - 10.0, window.set + 10.0, DENSE_STEP)
+        track = propagate(None, self.observer, times)
+        above = track.el > elevation_mask
+        el = track.el[above]
+        margins = run_batch(self.lb_calc, self.ureg, el, loss_profile('atmosphere')(el),
+                            loss_profile('eggbeater')(el)).link_margin
+        return np.count_nonzero(margins > 0.0) * DENSE_STEP
+
+    def test_matches_dense_count(self):
+        for name in ['good', 'great']:
+            window = self.windows(name)
+            self.assertGreater(window.duration, 0.0)
+            self.assertAlmostEqual(window.duration, self.dense_count(window), delta=0.2)
+            self.assertLess(window.evaluations, 100)
+
+    def test_pass_without_positive_margin(self):
+        window = self.windows('poor')
+        self.assertEqual(window.windows, [])
+        self.assertEqual(window.duration, 0.0)
+        self.assertEqual(self.dense_count(window), 0.0)
+
+    def test_elevation_mask(self):
+        mask = 40.0
+        unmasked = self.windows('great')
+        window = self.windows('great', elevation_mask=mask, report_elevations=(10.0, mask))
+        self.assertLess(window.duration, unmasked.duration)
+        self.assertAlmostEqual(window.duration, self.dense_count(window, mask), delta=0.2)
+
+        el_rise, el_set = propagate(None, self.observer, [window.mask_rise, window.mask_set]).el
+        self.assertAlmostEqual(el_rise, mask, places=2)
+        self.assertAlmostEqual(el_set, mask, places=2)
+        self.assertEqual(window.crossings[mask], (window.mask_rise, window.mask_set))
+        self.assertLess(window.crossings[10.0][0], window.mask_rise)
+
+    def test_mask_above_culmination(self):
+        window = self.windows('poor', elevation_mask=30.0)
+        self.assertIsNone(window.mask_rise)
+        self.assertEqual(window.windows, [])
+
+
+if __name__ == '__main__':
+    unittest.main()